@@ -11,6 +11,26 @@ Extracted from Appendix C.12.
 import numpy as np
 from octonion_algebra.core import Octonion, FANO_TRIPLES
 from octonion_algebra.associator import associator
+from octonion_algebra.bracketing import bracketed_products
+
+
+def all_bracketings(*elements):
+    """
+    Return all Catalan bracketings of n elements (fixed order).
+
+    The Catalan number C_{n-1} gives the number of distinct ways to
+    parenthesise a product of n elements in a non-associative algebra.
+    Shared sub-products are computed once by the bracketing engine.
+
+    Args:
+        *elements: Octonion instances (at least one).
+
+    Returns:
+        List of C_{n-1} Octonion values, fully left-associated first and
+        fully right-associated last.
+    """
+    X = np.array([e.coeffs for e in elements])
+    return [Octonion(v) for v in bracketed_products(X, 1.0)]
 
 
 def all_bracketings_4(a, b, c, d):
@@ -24,15 +44,10 @@ def all_bracketings_4(a, b, c, d):
         a, b, c, d: Octonion instances
 
     Returns:
-        List of 5 Octonion values, one per bracketing.
+        List of 5 Octonion values, one per bracketing:
+        ((ab)c)d, (a(bc))d, (ab)(cd), a((bc)d), a(b(cd)).
     """
-    return [
-        ((a * b) * c) * d,        # left-left-left
-        (a * (b * c)) * d,        # right-left
-        (a * b) * (c * d),        # balanced
-        a * ((b * c) * d),        # left-right
-        a * (b * (c * d)),        # right-right-right
-    ]
+    return all_bracketings(a, b, c, d)
 
 
 def associator_signature(team):
@@ -16,10 +16,12 @@ Models:
 """
 
 import numpy as np
-from itertools import permutations, combinations
+from itertools import combinations
 from octonion_algebra.core import Octonion
 from octonion_algebra.associator import associator, associator_norm
 from octonion_algebra.calculus import structure_constants
+from octonion_algebra.deformation import deformed_multiplication_tensor
+from octonion_algebra.bracketing import bracketed_products
 
 
 # ===========================================================================
@@ -122,6 +124,143 @@ def simulate_lotka_volterra(x0, r, A, T, dt, n_steps):
     return trajectory
 
 
+def fano_ternary_entries():
+    """
+    Sparse form of the Fano ternary tensor.
+
+    ``fano_ternary_tensor`` has 42 nonzero entries out of 343: each of the
+    7 Fano lines contributes its 6 orderings.  Every species i lies on 3
+    lines and so appears as the first index of exactly 6 entries.
+
+    Returns:
+        tuple (j, k) of int arrays of shape (7, 6): row i lists the index
+        pairs (j[i, m], k[i, m]) with F_{i j k} = 1.
+    """
+    F = fano_ternary_tensor()
+    j = np.zeros((7, 6), dtype=np.int64)
+    k = np.zeros((7, 6), dtype=np.int64)
+    for i in range(7):
+        jj, kk = np.nonzero(F[i])
+        j[i], k[i] = jj, kk
+    return j, k
+
+
+def simulate_lotka_volterra_ensemble(x0, r, A, ternary_scale, dt, n_steps,
+                                     extinction_threshold=None,
+                                     blowup_threshold=None,
+                                     return_trajectories=False):
+    """
+    Simulate a batch of octonionic Lotka-Volterra systems in lockstep (RK4).
+
+    Member b evolves under
+
+        dx_i/dt = x_i * (r_i + sum_j A_ij x_j + s_b sum_{jk} F_ijk x_j x_k)
+
+    with F the Fano ternary tensor and s_b its per-member scale, i.e. the
+    same dynamics as ``simulate_lotka_volterra`` with T = s_b * F.  The
+    ternary term is evaluated from the 42 nonzeros of F
+    (``fano_ternary_entries``) instead of a dense contraction, and all
+    members share each RK4 stage as one (B, 7) array operation.
+
+    Members stop early, independently, when any population drops below
+    ``extinction_threshold`` or any population exceeds
+    ``blowup_threshold`` or becomes non-finite.  A stopped member keeps
+    its last state and is removed from the working batch, so the cost of
+    a step falls with the number of members still running.
+
+    Args:
+        x0: array of shape (B, 7) -- initial populations.
+        r: array of shape (7,) or (B, 7) -- intrinsic growth rates.
+        A: array of shape (7, 7) or (B, 7, 7) -- pairwise interactions.
+        ternary_scale: float or array of shape (B,) -- scale s_b of F.
+        dt: float -- time step.
+        n_steps: int -- number of integration steps.
+        extinction_threshold: optional float.
+        blowup_threshold: optional float.
+        return_trajectories: bool, also return the (n_steps+1, B, 7)
+            trajectories (stopped members are held at their last state).
+
+    Returns:
+        dict with keys:
+            'final': ndarray (B, 7) -- populations at the last step taken.
+            'stop_step': ndarray (B,) int -- number of steps taken.
+            'extinct': ndarray (B,) bool -- stopped by extinction.
+            'blowup': ndarray (B,) bool -- stopped by blow-up.
+            'trajectories': ndarray (n_steps+1, B, 7), only when requested.
+    """
+    x = np.array(x0, dtype=float)
+    if x.ndim != 2 or x.shape[1] != 7:
+        raise ValueError("x0 must have shape (B, 7)")
+    B = x.shape[0]
+    r = np.broadcast_to(np.asarray(r, dtype=float), (B, 7)).copy()
+    A = np.asarray(A, dtype=float)
+    shared_A = A.ndim == 2
+    if not shared_A:
+        A = np.broadcast_to(A, (B, 7, 7)).copy()
+    s = np.broadcast_to(np.asarray(ternary_scale, dtype=float), (B,)).copy()
+    fj, fk = fano_ternary_entries()
+
+    def rhs(x, r, A, s):
+        pairwise = x @ A.T if shared_A else np.einsum('bij,bj->bi', A, x)
+        ternary = np.sum(x[:, fj] * x[:, fk], axis=-1)
+        return x * (r + pairwise + s[:, None] * ternary)
+
+    stop_step = np.full(B, n_steps, dtype=np.int64)
+    extinct = np.zeros(B, dtype=bool)
+    blowup = np.zeros(B, dtype=bool)
+    final = x.copy()
+    trajectories = None
+    if return_trajectories:
+        trajectories = np.zeros((n_steps + 1, B, 7))
+        trajectories[0] = x
+
+    # Working batch: indices of running members and their parameters
+    idx = np.arange(B)
+    xa, ra, sa = x, r, s
+    Aa = A
+    for step in range(n_steps):
+        if len(idx) == 0:
+            if return_trajectories:
+                trajectories[step + 1:] = final
+            break
+        # Overflow in a diverging member is caught by the blow-up check
+        with np.errstate(over='ignore', invalid='ignore'):
+            k1 = rhs(xa, ra, Aa, sa)
+            k2 = rhs(xa + 0.5 * dt * k1, ra, Aa, sa)
+            k3 = rhs(xa + 0.5 * dt * k2, ra, Aa, sa)
+            k4 = rhs(xa + dt * k3, ra, Aa, sa)
+            xa = xa + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+        final[idx] = xa
+        if return_trajectories:
+            trajectories[step + 1] = final
+
+        dead = ~np.all(np.isfinite(xa), axis=1)
+        if blowup_threshold is not None:
+            dead |= np.max(xa, axis=1) > blowup_threshold
+        gone = np.zeros(len(idx), dtype=bool)
+        if extinction_threshold is not None:
+            gone = ~dead & (np.min(xa, axis=1) < extinction_threshold)
+        stopped = dead | gone
+        if np.any(stopped):
+            blowup[idx[dead]] = True
+            extinct[idx[gone]] = True
+            stop_step[idx[stopped]] = step + 1
+            keep = ~stopped
+            idx, xa, ra, sa = idx[keep], xa[keep], ra[keep], sa[keep]
+            if not shared_A:
+                Aa = Aa[keep]
+
+    result = {
+        'final': final,
+        'stop_step': stop_step,
+        'extinct': extinct,
+        'blowup': blowup,
+    }
+    if return_trajectories:
+        result['trajectories'] = trajectories
+    return result
+
+
 def lotka_volterra_comparison(x0, r, A, dt, n_steps, T_scale=1.0):
     """
     Compare standard (T=0) vs octonionic (T != 0) Lotka-Volterra trajectories.
@@ -365,7 +504,185 @@ def agenda_dependence_measure(agents):
     return total / count if count > 0 else 0.0
 
 
-def optimal_coalition_ordering(agents):
+def _triple_cost_table(agents):
+    """
+    Table of associator norms cost[j, k, l] = |[a_j, a_k, a_l]| for all
+    ordered triples of agents.
+
+    Both bracketings of every triple are evaluated in batches through the
+    bracketing engine, one slice of first agents at a time.
+
+    Args:
+        agents: list of Octonion instances.
+
+    Returns:
+        numpy array of shape (n, n, n).
+    """
+    X = np.array([a.coeffs for a in agents])
+    n = X.shape[0]
+    tensor = deformed_multiplication_tensor(1.0)
+    kk, ll = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+    cost = np.zeros((n, n, n))
+    for j in range(n):
+        triples = np.stack([
+            np.broadcast_to(X[j], (n * n, 8)),
+            X[kk.ravel()],
+            X[ll.ravel()],
+        ], axis=1)
+        vals = bracketed_products(triples, 1.0, tensor=tensor)
+        cost[j] = np.linalg.norm(vals[:, 0] - vals[:, 1], axis=-1).reshape(n, n)
+    return cost
+
+
+def _held_karp_ordering(cost):
+    """
+    Exact minimum-cost ordering by dynamic programming over subsets.
+
+    The state is (visited set S, second-to-last agent j, last agent k) and
+
+        D(S + {l}, k, l) = min_j D(S, j, k) + cost[j, k, l].
+
+    Subsets are processed one cardinality layer at a time, so only two
+    layers of costs are held in memory; back-pointers are kept as int8 for
+    reconstruction.  Time O(2^n n^3), memory O(2^n n^2) bytes.
+
+    Args:
+        cost: numpy array of shape (n, n, n), the triple cost table.
+
+    Returns:
+        tuple (ordering, cost) with ordering a tuple of indices.
+    """
+    n = cost.shape[0]
+    full = np.arange(2 ** n, dtype=np.int64)
+    popcount = np.zeros(2 ** n, dtype=np.int8)
+    for b in range(n):
+        popcount += ((full >> b) & 1).astype(np.int8)
+    lookup = np.zeros(2 ** n, dtype=np.int64)
+
+    # Layer 2: ordered pairs (j, k) with zero cost
+    masks = full[popcount == 2]
+    lookup[masks] = np.arange(len(masks))
+    D = np.full((len(masks), n, n), np.inf)
+    for j in range(n):
+        for k in range(n):
+            if j != k:
+                D[lookup[(1 << j) | (1 << k)], j, k] = 0.0
+    layers = [(masks, None)]
+
+    for m in range(3, n + 1):
+        new_masks = full[popcount == m]
+        D_new = np.full((len(new_masks), n, n), np.inf)
+        pred = np.zeros((len(new_masks), n, n), dtype=np.int8)
+        new_lookup = np.zeros(2 ** n, dtype=np.int64)
+        new_lookup[new_masks] = np.arange(len(new_masks))
+        for l in range(n):
+            sel = new_masks[(new_masks >> l) & 1 == 1]
+            prev = D[lookup[sel ^ (1 << l)]]             # (M_l, j, k)
+            cand = prev + cost[None, :, :, l]
+            best_j = np.argmin(cand, axis=1)              # (M_l, k)
+            rows = new_lookup[sel]
+            D_new[rows, :, l] = np.take_along_axis(
+                cand, best_j[:, None, :], axis=1)[:, 0, :]
+            pred[rows, :, l] = best_j
+        D, lookup = D_new, new_lookup
+        layers.append((new_masks, pred))
+
+    # Reconstruct from the best final (k, l) pair
+    k, l = np.unravel_index(np.argmin(D[0]), (n, n))
+    best = float(D[0, k, l])
+    order = [int(l), int(k)]
+    mask = (1 << n) - 1
+    for m in range(n, 2, -1):
+        masks_m, pred = layers[m - 2]
+        row = np.searchsorted(masks_m, mask)
+        j = int(pred[row, order[-1], order[-2]])
+        mask ^= 1 << order[-2]
+        order.append(j)
+    return tuple(reversed(order)), best
+
+
+def _beam_ordering(cost, beam_width):
+    """
+    Approximate minimum-cost ordering by beam search.
+
+    Partial orderings are extended one agent at a time; among partial
+    orderings with the same visited set and last two agents only the
+    cheapest is kept (it dominates the others), and then the
+    ``beam_width`` cheapest survive.
+
+    Args:
+        cost: numpy array of shape (n, n, n), the triple cost table.
+        beam_width: int, number of partial orderings kept per step.
+
+    Returns:
+        tuple (ordering, cost) with ordering a tuple of indices.
+    """
+    n = cost.shape[0]
+    words = (n + 62) // 63
+    # Visited sets as rows of 63-bit words so that n is unbounded
+    j0, k0 = np.where(~np.eye(n, dtype=bool))
+    visited = np.zeros((len(j0), words), dtype=np.int64)
+    for idx in (j0, k0):
+        np.bitwise_or.at(visited, (np.arange(len(idx)), idx // 63),
+                         np.left_shift(1, idx % 63))
+    last2, last = j0, k0
+    total = np.zeros(len(j0))
+    history = [(np.arange(len(j0)), j0), (np.arange(len(j0)), k0)]
+
+    for _ in range(n - 2):
+        in_set = (visited[:, np.arange(n) // 63]
+                  >> (np.arange(n) % 63)) & 1            # (W, n)
+        cand = total[:, None] + cost[last2, last, :]      # (W, n)
+        cand[in_set == 1] = np.inf
+        parent, nxt = np.nonzero(np.isfinite(cand))
+        cand = cand[parent, nxt]
+
+        new_visited = visited[parent].copy()
+        new_visited[np.arange(len(nxt)), nxt // 63] |= np.left_shift(1, nxt % 63)
+
+        # Dominance: keep the cheapest per (visited, last two)
+        order = np.argsort(cand, kind='stable')
+        keys = np.column_stack([new_visited, last[parent], nxt])[order]
+        _, first = np.unique(keys, axis=0, return_index=True)
+        keep = order[np.sort(first)]
+        keep = keep[np.argsort(cand[keep], kind='stable')][:beam_width]
+
+        visited = new_visited[keep]
+        last2, last = last[parent[keep]], nxt[keep]
+        total = cand[keep]
+        history.append((parent[keep], nxt[keep]))
+
+    # Walk back-pointers from the cheapest complete ordering
+    b = int(np.argmin(total))
+    best = float(total[b])
+    order = []
+    for parents, agents in reversed(history):
+        order.append(int(agents[b]))
+        b = int(parents[b])
+    return tuple(reversed(order)), best
+
+
+def _ordering_bound(cost):
+    """
+    Lower bound on the cost of any ordering.
+
+    Every agent except the two endpoints is the middle element of exactly
+    one consecutive triple, so the cost is at least the sum of the n-2
+    smallest values of min_{j,l} cost[j, k, l].
+
+    Args:
+        cost: numpy array of shape (n, n, n), with invalid (repeated-agent)
+            entries set to +inf.
+
+    Returns:
+        float.
+    """
+    n = cost.shape[0]
+    middle = np.min(cost, axis=(0, 2))
+    return float(np.sum(np.sort(middle)[:n - 2]))
+
+
+def optimal_coalition_ordering(agents, exact_max_n=18, beam_width=512):
     """
     Find the permutation of agents that minimises and maximises the total
     sequential coalition associator magnitude.
@@ -375,11 +692,19 @@ def optimal_coalition_ordering(agents):
     a_{sigma_{i+2}}]| over consecutive triples.  This measures the total
     agenda dependence along the sequential coalition-formation process.
 
-    For n > 8, the brute-force search becomes infeasible, so a greedy
-    heuristic is used instead.
+    The cost depends only on consecutive triples, so all n^3 associator
+    norms are computed once and the search runs on that table.  Up to
+    ``exact_max_n`` agents a Held-Karp dynamic program over (visited set,
+    last two agents) gives the exact optimum in O(2^n n^3) time.  Beyond
+    that a beam search is used and the optimality gap is bounded by the
+    middle-element bound (every non-endpoint agent is the middle of
+    exactly one triple).
 
     Args:
         agents: list of Octonion instances (length >= 3).
+        exact_max_n: int, largest n solved exactly (default 18; the
+            dynamic program needs about 2^n n^2 bytes of back-pointers).
+        beam_width: int, partial orderings kept per step by the beam search.
 
     Returns:
         dict with keys:
@@ -387,83 +712,39 @@ def optimal_coalition_ordering(agents):
             'min_cost': float -- the minimum total associator cost.
             'max_ordering': tuple of indices maximising total associator cost.
             'max_cost': float -- the maximum total associator cost.
+            'exact': bool -- True if both orderings are provably optimal.
+            'min_gap': float -- min_cost minus a lower bound on the true
+                minimum (0.0 when exact).
+            'max_gap': float -- an upper bound on the true maximum minus
+                max_cost (0.0 when exact).
     """
     n = len(agents)
     if n < 3:
         raise ValueError("Need at least 3 agents")
 
-    def _sequential_cost(perm):
-        """Sum of associator norms over consecutive triples in a permutation."""
-        cost = 0.0
-        for t in range(len(perm) - 2):
-            cost += associator_norm(
-                agents[perm[t]], agents[perm[t + 1]], agents[perm[t + 2]]
-            )
-        return cost
-
-    if n <= 8:
-        # Brute-force over all permutations (feasible up to 8! = 40320)
-        best_min = (None, float('inf'))
-        best_max = (None, float('-inf'))
-        for perm in permutations(range(n)):
-            cost = _sequential_cost(perm)
-            if cost < best_min[1]:
-                best_min = (perm, cost)
-            if cost > best_max[1]:
-                best_max = (perm, cost)
-        return {
-            'min_ordering': best_min[0],
-            'min_cost': float(best_min[1]),
-            'max_ordering': best_max[0],
-            'max_cost': float(best_max[1]),
-        }
+    cost = _triple_cost_table(agents)
+    j, k, l = np.indices((n, n, n))
+    repeated = (j == k) | (k == l) | (j == l)
+    cost_min = np.where(repeated, np.inf, cost)
+    cost_max = np.where(repeated, np.inf, -cost)
+
+    exact = n <= exact_max_n
+    if exact:
+        min_order, min_cost = _held_karp_ordering(cost_min)
+        max_order, neg_max = _held_karp_ordering(cost_max)
+        min_gap = max_gap = 0.0
     else:
-        # Greedy heuristic for large n
-        # Minimisation: greedily pick next agent that minimises the new triple
-        indices = list(range(n))
-
-        # --- Minimising ordering ---
-        remaining_min = set(indices)
-        order_min = [0]
-        remaining_min.discard(0)
-        # Pick second element: minimise associator with first and any third
-        if n > 1:
-            best_second = min(remaining_min,
-                              key=lambda j: sum(
-                                  associator_norm(agents[order_min[0]], agents[j], agents[k])
-                                  for k in remaining_min if k != j))
-            order_min.append(best_second)
-            remaining_min.discard(best_second)
-
-        while remaining_min:
-            best_next = min(remaining_min,
-                            key=lambda j: associator_norm(
-                                agents[order_min[-2]], agents[order_min[-1]], agents[j]))
-            order_min.append(best_next)
-            remaining_min.discard(best_next)
-
-        # --- Maximising ordering ---
-        remaining_max = set(indices)
-        order_max = [0]
-        remaining_max.discard(0)
-        if n > 1:
-            best_second = max(remaining_max,
-                              key=lambda j: sum(
-                                  associator_norm(agents[order_max[0]], agents[j], agents[k])
-                                  for k in remaining_max if k != j))
-            order_max.append(best_second)
-            remaining_max.discard(best_second)
-
-        while remaining_max:
-            best_next = max(remaining_max,
-                            key=lambda j: associator_norm(
-                                agents[order_max[-2]], agents[order_max[-1]], agents[j]))
-            order_max.append(best_next)
-            remaining_max.discard(best_next)
-
-        return {
-            'min_ordering': tuple(order_min),
-            'min_cost': float(_sequential_cost(tuple(order_min))),
-            'max_ordering': tuple(order_max),
-            'max_cost': float(_sequential_cost(tuple(order_max))),
-        }
+        min_order, min_cost = _beam_ordering(cost_min, beam_width)
+        max_order, neg_max = _beam_ordering(cost_max, beam_width)
+        min_gap = max(min_cost - _ordering_bound(cost_min), 0.0)
+        max_gap = max(neg_max - _ordering_bound(cost_max), 0.0)
+
+    return {
+        'min_ordering': min_order,
+        'min_cost': float(min_cost),
+        'max_ordering': max_order,
+        'max_cost': float(-neg_max),
+        'exact': exact,
+        'min_gap': float(min_gap),
+        'max_gap': float(max_gap),
+    }
@@ -0,0 +1,114 @@
+"""
+Atomic, rotating checkpoints for long-running integrations.
+
+A checkpoint is a single ``.npz`` file holding named arrays plus a JSON
+metadata record.  ``Checkpointer.save`` writes to a temporary file in the
+target directory and renames it into place with ``os.replace``, so a
+checkpoint on disk is always complete: a run preempted mid-write leaves
+the previous checkpoint intact.  Only the newest ``keep`` checkpoints are
+retained.
+
+The simulator uses this module to snapshot its integrator state; see
+``simulator.resume``.
+"""
+
+import glob
+import json
+import os
+
+import numpy as np
+
+
+class Checkpointer:
+    """Periodic checkpoint writer with bounded retention.
+
+    Files are named ``{prefix}_{step:010d}.npz`` inside ``directory`` so
+    that lexicographic order is step order.
+
+    Attributes:
+        directory: str, directory holding the checkpoints.
+        every: int, checkpoint cadence in steps.
+        keep: int, number of checkpoints retained.
+        prefix: str, file-name prefix.
+    """
+
+    def __init__(self, directory, every=1000, keep=3, prefix='checkpoint'):
+        """Create a checkpointer (the directory is created if needed).
+
+        Args:
+            directory: checkpoint directory.
+            every: int >= 1, cadence in steps.
+            keep: int >= 1, number of checkpoints to retain.
+            prefix: file-name prefix.
+
+        Raises:
+            ValueError: if ``every`` or ``keep`` is less than 1.
+        """
+        if every < 1 or keep < 1:
+            raise ValueError("every and keep must be >= 1")
+        self.directory = str(directory)
+        self.every = int(every)
+        self.keep = int(keep)
+        self.prefix = prefix
+        os.makedirs(self.directory, exist_ok=True)
+
+    def due(self, step):
+        """True if a checkpoint should be taken after ``step``."""
+        return step > 0 and step % self.every == 0
+
+    def path_for(self, step):
+        """Return the checkpoint path for ``step``."""
+        return os.path.join(self.directory, f"{self.prefix}_{step:010d}.npz")
+
+    def checkpoints(self):
+        """Return the existing checkpoint paths, oldest first."""
+        pattern = os.path.join(self.directory, f"{self.prefix}_" + "[0-9]" * 10 + ".npz")
+        return sorted(glob.glob(pattern))
+
+    def latest(self):
+        """Return the newest checkpoint path, or None."""
+        paths = self.checkpoints()
+        return paths[-1] if paths else None
+
+    def save(self, step, arrays, meta):
+        """Atomically write a checkpoint and prune old ones.
+
+        Args:
+            step: int, step number (used in the file name).
+            arrays: dict of name -> array-like.
+            meta: JSON-serialisable dict.
+
+        Returns:
+            str, path of the written checkpoint.
+        """
+        path = self.path_for(step)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            np.savez(f, __meta__=np.array(json.dumps(meta)), **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+        for old in self.checkpoints()[:-self.keep]:
+            os.remove(old)
+        return path
+
+    def settings(self):
+        """Return the constructor arguments as a dict."""
+        return {'directory': self.directory, 'every': self.every,
+                'keep': self.keep, 'prefix': self.prefix}
+
+
+def load_checkpoint(path):
+    """Read a checkpoint written by ``Checkpointer.save``.
+
+    Args:
+        path: checkpoint file path.
+
+    Returns:
+        tuple (arrays, meta): dict of name -> ndarray, and the metadata dict.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files if name != '__meta__'}
+        meta = json.loads(str(data['__meta__']))
+    return arrays, meta
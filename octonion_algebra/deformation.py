@@ -127,6 +127,56 @@ def deformed_multiply(a_coeffs, b_coeffs, epsilon):
     return result
 
 
+def deformed_multiplication_tensor(epsilon):
+    """
+    Return the 8x8x8 tensor C with (a *_eps b)_k = sum_{ij} C[i, j, k] a_i b_j.
+
+    This is the dense form of the deformed multiplication table, suitable
+    for contracting whole batches of elements at once.
+
+    Args:
+        epsilon: deformation parameter in [0, 1].
+
+    Returns:
+        numpy array of shape (8, 8, 8).
+    """
+    table = _build_deformed_mult_table(epsilon)
+    C = np.zeros((8, 8, 8))
+    for i in range(8):
+        for j in range(8):
+            coeff, idx = table[i][j]
+            C[i, j, idx] += coeff
+    return C
+
+
+def deformed_multiply_batch(a, b, epsilon, tensor=None):
+    """
+    Multiply two batches of 8-component arrays with the deformed product.
+
+    Equivalent to calling ``deformed_multiply`` on every pair, but the
+    batch is contracted against the multiplication tensor in a single
+    matrix product.  ``a`` and ``b`` broadcast against each other over
+    their leading axes, so e.g. shapes (B, p, 1, 8) and (B, 1, q, 8) give
+    all p*q products per batch entry.
+
+    Args:
+        a: array-like of shape (..., 8).
+        b: array-like of shape (..., 8).
+        epsilon: deformation parameter in [0, 1].
+        tensor: optional precomputed ``deformed_multiplication_tensor(epsilon)``
+            to avoid rebuilding it on every call.
+
+    Returns:
+        numpy array of shape broadcast(a, b).shape: the products.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if tensor is None:
+        tensor = deformed_multiplication_tensor(epsilon)
+    outer = a[..., :, None] * b[..., None, :]
+    return outer.reshape(outer.shape[:-2] + (64,)) @ tensor.reshape(64, 8)
+
+
 class DeformedOctonion:
     """
     An element of the deformed algebra A_epsilon.
@@ -556,6 +556,7 @@ def simulate_physics():
     - Coherence charge tracking
     - Associative-limit comparison (eps=0 vs eps=1)
     - Signal-speed causality test
+    - Wall time of higher-order symplectic integrators
     """
     from octonion_algebra.simulator import OctonionicFieldSimulator
     from octonion_algebra.predictions import (
@@ -677,6 +678,31 @@ def simulate_physics():
     print(f"    Estimated M_GUT         = {wa['estimated_unification_scale_GeV']:.2e} GeV")
     print(f"    log10(M_GUT/GeV)        = {wa['log10_M_GUT_GeV']:.1f}")
     results.append(("Predictions Numerical", True))
+    print()
+
+    # --- 9. Higher-order integrators ---
+    _header("Physics Simulation: Integrator Benchmark")
+
+    print("  [9] Wall time to |dE|/E0 <= 1e-6 (KG, eps=1, t = 2)")
+    bench_sim = OctonionicFieldSimulator(N=N, dt=dt, L=L, m_squared=1.0,
+                                         boundary='periodic')
+    bench = bench_sim.benchmark_integrators(phi0_coh, tolerance=1e-6)
+    print(f"    {'integrator':>10}  {'order':>5}  {'dt':>10}  {'forces':>7}  "
+          f"{'|dE|/E0':>9}  {'time [s]':>9}  {'speedup':>7}")
+    for name, res in bench['results'].items():
+        speedup = bench['speedup'].get(name, float('nan'))
+        print(f"    {name:>10}  {res['order']:>5}  {res['dt']:10.2e}  "
+              f"{res['force_evaluations']:>7}  {res['energy_error']:9.2e}  "
+              f"{res['wall_time']:9.4f}  {speedup:7.2f}")
+    # Wall time is machine-dependent and shown for information only; the
+    # check compares force evaluations, which are deterministic
+    lf, y4 = bench['results']['leapfrog'], bench['results']['yoshida4']
+    passed_bench = (lf['reached'] and y4['reached']
+                    and y4['force_evaluations'] < lf['force_evaluations'])
+    print(f"    Result: {'PASS' if passed_bench else 'FAIL'} "
+          f"(4th order reaches the target in fewer force evaluations "
+          f"than leapfrog)")
+    results.append(("Higher-Order Integrators", passed_bench))
 
     return results
 
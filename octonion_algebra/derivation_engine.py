@@ -24,10 +24,14 @@ where phi(x) is an Octonion-valued field on a 1-D grid, we:
 
 The associator correction for nonlinear terms (quartic potential) is also
 computed, demonstrating genuine non-associative physics.
+
+The finite-difference variation costs O(N^2); ``action_gradient`` gives
+the same derivative exactly in O(N) by reverse-mode differentiation of the
+vectorised action, and ``vary_action`` remains as a checker.
 """
 
 import numpy as np
-from octonion_algebra.core import Octonion
+from octonion_algebra.core import Octonion, MULT_TABLE
 from octonion_algebra.associator import associator, associator_norm
 
 
@@ -98,12 +102,49 @@ class FieldConfiguration:
         """
         return (self.kinetic_energy(dx) + self.potential_energy(dx, m_sq)) * dt
 
+    def coherence_energy(self, dx):
+        r"""
+        Associator (coherence) energy  C = sum_i |[phi_i, phi_{i+1}, phi_{i+2}]|^2 dx.
+
+        The coherence functional of consecutive triples, integrated over
+        the grid.  It vanishes on associative (e.g. quaternionic) fields.
+        """
+        a, b, c = self._phi[:-2], self._phi[1:-1], self._phi[2:]
+        assoc = (_octonion_product(_octonion_product(a, b), c)
+                 - _octonion_product(a, _octonion_product(b, c)))
+        return float(np.sum(assoc ** 2)) * dx
+
+    def corrected_action(self, dx, dt, m_sq, coupling):
+        r"""
+        Associator-corrected action  S = (T + V + coupling * C) * dt,
+        with C the ``coherence_energy``.
+        """
+        return self.action(dx, dt, m_sq) + coupling * self.coherence_energy(dx) * dt
+
+    def action_gradient(self, dx, dt, m_sq, coupling=0.0):
+        r"""
+        Exact gradient dS/dphi of ``action`` (or of ``corrected_action``
+        when ``coupling`` is nonzero), by reverse-mode differentiation.
+
+        Returns ndarray of shape (N, 8).
+        """
+        phi = _Var(self._phi)
+        diff = phi[1:] - phi[:-1]
+        S = (diff.sum_squares() * (0.5 / dx)
+             + phi.sum_squares() * (0.5 * m_sq * dx))
+        if coupling:
+            a, b, c = phi[:-2], phi[1:-1], phi[2:]
+            assoc = _product(_product(a, b), c) - _product(a, _product(b, c))
+            S = S + assoc.sum_squares() * (coupling * dx)
+        (S * dt).backward()
+        return phi.grad
+
 
 # ---------------------------------------------------------------------------
 # 2. vary_action — numerical variational derivative
 # ---------------------------------------------------------------------------
 
-def vary_action(field_config, dx, m_sq=1.0, epsilon=1e-6):
+def vary_action(field_config, dx, m_sq=1.0, epsilon=1e-6, coupling=0.0):
     r"""
     Compute delta S / delta phi(x)  by finite-difference perturbation.
 
@@ -116,6 +157,8 @@ def vary_action(field_config, dx, m_sq=1.0, epsilon=1e-6):
     dx : float  — grid spacing
     m_sq : float  — mass squared
     epsilon : float  — perturbation size
+    coupling : float  — weight of the associator (coherence) energy, as in
+        ``FieldConfiguration.corrected_action``
 
     Returns
     -------
@@ -131,17 +174,162 @@ def vary_action(field_config, dx, m_sq=1.0, epsilon=1e-6):
         for a in range(8):
             phi_plus = phi.copy()
             phi_plus[i, a] += epsilon
-            S_plus = FieldConfiguration(phi_plus).action(dx, dt, m_sq)
+            S_plus = FieldConfiguration(phi_plus).corrected_action(
+                dx, dt, m_sq, coupling)
 
             phi_minus = phi.copy()
             phi_minus[i, a] -= epsilon
-            S_minus = FieldConfiguration(phi_minus).action(dx, dt, m_sq)
+            S_minus = FieldConfiguration(phi_minus).corrected_action(
+                dx, dt, m_sq, coupling)
 
             variation[i, a] = (S_plus - S_minus) / (2.0 * epsilon)
 
     return variation
 
 
+# ---------------------------------------------------------------------------
+# 2b. action_gradient — exact variational derivative by reverse mode
+# ---------------------------------------------------------------------------
+
+def _multiplication_tensor():
+    """Dense (8, 8, 8) form of MULT_TABLE: (ab)_k = sum_ij T[i,j,k] a_i b_j."""
+    T = np.zeros((8, 8, 8))
+    for i in range(8):
+        for j in range(8):
+            sign, k = MULT_TABLE[i][j]
+            T[i, j, k] = sign
+    return T
+
+
+_MULT_TENSOR = _multiplication_tensor()
+
+
+def _octonion_product(a, b):
+    """Pointwise octonion product of two (..., 8) arrays."""
+    outer = a[..., :, None] * b[..., None, :]
+    return outer.reshape(outer.shape[:-2] + (64,)) @ _MULT_TENSOR.reshape(64, 8)
+
+
+def _octonion_product_vjp(a, b, g):
+    """Gradients of sum(g * (a b)) with respect to a and b."""
+    bg = b[..., :, None] * g[..., None, :]          # (..., j, k)
+    ag = a[..., :, None] * g[..., None, :]          # (..., i, k)
+    grad_a = (bg.reshape(bg.shape[:-2] + (64,))
+              @ _MULT_TENSOR.transpose(1, 2, 0).reshape(64, 8))
+    grad_b = (ag.reshape(ag.shape[:-2] + (64,))
+              @ _MULT_TENSOR.transpose(0, 2, 1).reshape(64, 8))
+    return grad_a, grad_b
+
+
+class _Var:
+    """
+    A value in a reverse-mode computation over field arrays.
+
+    Each operation records its inputs together with a function mapping the
+    gradient of its output to the gradient of that input;
+    ``backward`` replays the record in reverse topological order and
+    leaves d(output)/d(node) in every node's ``grad``.  Only the handful of
+    operations the field actions need are provided.
+    """
+
+    def __init__(self, value, parents=()):
+        self.value = value
+        self.parents = parents      # tuple of (_Var, vjp)
+        self.grad = None
+
+    def __getitem__(self, key):
+        def vjp(g):
+            out = np.zeros_like(self.value)
+            out[key] = g
+            return out
+        return _Var(self.value[key], ((self, vjp),))
+
+    def __add__(self, other):
+        return _Var(self.value + other.value,
+                    ((self, lambda g: g), (other, lambda g: g)))
+
+    def __sub__(self, other):
+        return _Var(self.value - other.value,
+                    ((self, lambda g: g), (other, lambda g: -g)))
+
+    def __mul__(self, c):
+        return _Var(self.value * c, ((self, lambda g: g * c),))
+
+    def sum_squares(self):
+        return _Var(np.sum(self.value ** 2),
+                    ((self, lambda g: 2.0 * g * self.value),))
+
+    def backward(self):
+        order, seen = [], set()
+
+        def visit(node):
+            if id(node) in seen:
+                return
+            seen.add(id(node))
+            for parent, _ in node.parents:
+                visit(parent)
+            order.append(node)
+
+        visit(self)
+        for node in order:
+            node.grad = None
+        self.grad = np.ones_like(self.value)
+        for node in reversed(order):
+            for parent, vjp in node.parents:
+                g = vjp(node.grad)
+                parent.grad = g if parent.grad is None else parent.grad + g
+
+
+def _product(a, b):
+    """Octonion product of two ``_Var`` (..., 8) arrays."""
+    cache = {}
+
+    def vjp(g, side):
+        # Both input gradients come from one contraction against the same
+        # upstream g; compute it on the first side and drop it after the second
+        if cache.get('g') is not g:
+            cache.clear()
+            cache['g'] = g
+            cache['a'], cache['b'] = _octonion_product_vjp(a.value, b.value, g)
+            cache['pending'] = {'a', 'b'}
+        grad = cache[side]
+        cache['pending'].discard(side)
+        if not cache['pending']:
+            cache.clear()
+        return grad
+
+    def vjp_a(g):
+        return vjp(g, 'a')
+
+    def vjp_b(g):
+        return vjp(g, 'b')
+
+    return _Var(_octonion_product(a.value, b.value), ((a, vjp_a), (b, vjp_b)))
+
+
+def action_gradient(field_config, dx, m_sq=1.0, coupling=0.0):
+    r"""
+    Compute delta S / delta phi(x) exactly in O(N).
+
+    The analytic counterpart of ``vary_action``: same normalisation
+    (dt = 1), no perturbation error, and a single forward and backward
+    pass over the vectorised action instead of 16N action evaluations.
+
+    Parameters
+    ----------
+    field_config : FieldConfiguration
+    dx : float  — grid spacing
+    m_sq : float  — mass squared
+    coupling : float  — weight of the associator (coherence) energy;
+        0 gives the plain Klein-Gordon action
+
+    Returns
+    -------
+    gradient : ndarray of shape (N, 8)
+    """
+    return field_config.action_gradient(dx, 1.0, m_sq, coupling)
+
+
 # ---------------------------------------------------------------------------
 # 3. derive_euler_lagrange — compare numerical vs analytic
 # ---------------------------------------------------------------------------
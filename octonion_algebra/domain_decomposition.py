@@ -0,0 +1,212 @@
+"""
+Shared-memory domain decomposition for the field simulator.
+
+A grid is cut along its first axis into one slab per worker process.  Each
+worker advances its slab with the simulator's own stepper on a local array
+that carries one halo cell on every side facing another slab (or, with
+periodic boundaries, facing the wrapped-around end of the grid).  Every
+operator in the Klein-Gordon and 7D Maxwell steps -- the 3-point
+Laplacian, centred gradients and the nearest-neighbour associator -- reaches
+one cell, so a halo of width 1 suffices provided it is refreshed before
+each operator evaluation.  The steppers call an ``exchange`` hook at
+exactly those points.
+
+Halo exchange goes through a double-buffered array in
+``multiprocessing.shared_memory``: a worker writes its owned cells into
+buffer ``r % 2``, waits on a barrier with the other workers and then reads
+its halo cells from the same buffer.  The next write to that buffer comes
+two exchanges later, after another barrier, so no worker can overwrite
+cells a neighbour has yet to read.  After every step the workers write
+their slabs into a (likewise double-buffered) shared state, which the
+parent process reads after a barrier it shares with the workers.
+
+Each grid point is computed from the same neighbours by the same numpy
+operations as in a single-process run, so results match it exactly.
+Non-local operators (the spectral Laplacian, the IMEX transforms) cannot
+be decomposed this way and are rejected.
+"""
+
+import multiprocessing
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+HALO = 1
+
+
+def slab_bounds(n, workers):
+    """Split ``range(n)`` into ``workers`` contiguous slabs.
+
+    Args:
+        n: int, number of grid points along the decomposed axis.
+        workers: int, number of slabs.
+
+    Returns:
+        list of (start, stop) pairs covering ``range(n)``; sizes differ
+        by at most one.
+
+    Raises:
+        ValueError: if a slab would hold fewer than two points, which
+            would leave an edge slab too short for the 3-point stencil.
+    """
+    if workers < 1 or n < 2 * workers:
+        raise ValueError(f"Cannot split {n} grid points into {workers} "
+                         "slabs of at least 2 points")
+    edges = np.linspace(0, n, workers + 1).round().astype(int)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:])]
+
+
+def _local_indices(start, stop, n, periodic):
+    """Global indices of a slab's local array: owned cells plus halos."""
+    lo = start - HALO if periodic or start > 0 else start
+    hi = stop + HALO if periodic or stop < n else stop
+    return np.arange(lo, hi) % n, start - lo
+
+
+class _SharedArray:
+    """A numpy array backed by a named shared-memory block."""
+
+    def __init__(self, shape, name=None):
+        self.shape = tuple(shape)
+        nbytes = max(int(np.prod(self.shape)) * 8, 1)
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.array = np.ndarray(self.shape, dtype=float, buffer=self.shm.buf)
+
+    def spec(self):
+        return self.shm.name, self.shape
+
+    def close(self, unlink=False):
+        del self.array
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+class _HaloExchange:
+    """Worker-side halo refresh through the shared exchange buffer."""
+
+    def __init__(self, buffers, barrier, start, stop, owned, n, periodic):
+        self.buffers = buffers
+        self.barrier = barrier
+        self.start, self.stop = start, stop
+        self.owned = owned
+        self.n = n
+        self.left = periodic or start > 0
+        self.right = periodic or stop < n
+        self.round = 0
+
+    def __call__(self, local):
+        buf = self.buffers[self.round % 2]
+        self.round += 1
+        count = self.stop - self.start
+        buf[self.start:self.stop] = local[self.owned:self.owned + count]
+        self.barrier.wait()
+        if self.left:
+            local[0] = buf[(self.start - 1) % self.n]
+        if self.right:
+            local[-1] = buf[self.stop % self.n]
+
+
+def _worker(sim, kind, specs, barriers, bounds, first0, second0, steps,
+            epsilon, start, integrator):
+    """Advance one slab; run in a child process."""
+    exchange_barrier, step_barrier = barriers
+    arrays = {key: _SharedArray(shape, name) for key, (name, shape)
+              in specs.items()}
+    try:
+        n = sim.shape[0]
+        a, b = bounds
+        idx, owned = _local_indices(a, b, n, sim._periodic)
+        exchange = _HaloExchange(arrays['exchange'].array, exchange_barrier,
+                                 a, b, owned, n, sim._periodic)
+        first = arrays['first'].array
+        second = arrays['second'].array
+        stepper = (sim._kg_steps if kind == 'klein_gordon'
+                   else sim._maxwell_steps)
+        for n_step, u, v in stepper(first0[idx], second0[idx], steps,
+                                    epsilon, start=start,
+                                    integrator=integrator,
+                                    exchange=exchange):
+            slot = n_step % 2
+            first[slot, a:b] = u[owned:owned + b - a]
+            second[slot, a:b] = v[owned:owned + b - a]
+            step_barrier.wait()
+    except threading.BrokenBarrierError:
+        pass  # the parent stopped early or another worker failed
+    except BaseException:
+        exchange_barrier.abort()
+        step_barrier.abort()
+        raise
+    finally:
+        for arr in arrays.values():
+            arr.close()
+
+
+def decomposed_steps(sim, kind, first0, second0, steps, epsilon, start=0,
+                     integrator='leapfrog'):
+    """Run a simulator stepper across ``sim.workers`` processes.
+
+    Yields the same ``(n, first, second)`` sequence as
+    ``sim._kg_steps`` / ``sim._maxwell_steps`` run in a single process.
+
+    Args:
+        sim: ``OctonionicFieldSimulator`` with ``workers > 1``.
+        kind: 'klein_gordon' or 'maxwell_7d'.
+        first0, second0: initial fields, shape (*grid, C), at step
+            ``start``.
+        steps: int, last step number.
+        epsilon: float, deformation parameter.
+        start: int, step number of the initial fields.
+        integrator: 'leapfrog', 'yoshida4' or 'yoshida6'.
+
+    Raises:
+        ValueError: for the IMEX integrator or a grid too small to split.
+        RuntimeError: if a worker process fails.
+    """
+    if integrator == 'imex':
+        raise ValueError("The IMEX integrator is not supported with "
+                         "domain decomposition (its transforms are global)")
+    first0 = np.array(first0, dtype=float)
+    second0 = np.array(second0, dtype=float)
+    bounds = slab_bounds(sim.shape[0], sim.workers)
+
+    shape = first0.shape
+    arrays = {
+        'exchange': _SharedArray((2,) + shape),
+        'first': _SharedArray((2,) + shape),
+        'second': _SharedArray((2,) + shape),
+    }
+    specs = {key: arr.spec() for key, arr in arrays.items()}
+    ctx = multiprocessing.get_context()
+    barriers = (ctx.Barrier(sim.workers), ctx.Barrier(sim.workers + 1))
+    procs = [ctx.Process(target=_worker, daemon=True,
+                         args=(sim, kind, specs, barriers, bound, first0,
+                               second0, steps, epsilon, start, integrator))
+             for bound in bounds]
+    for p in procs:
+        p.start()
+    try:
+        for n in range(start, steps + 1):
+            try:
+                barriers[1].wait()
+            except threading.BrokenBarrierError:
+                raise RuntimeError("A domain-decomposition worker failed")
+            slot = n % 2
+            yield (n, arrays['first'].array[slot].copy(),
+                   arrays['second'].array[slot].copy())
+        for p in procs:
+            p.join()
+    finally:
+        for b in barriers:
+            b.abort()
+        for p in procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+        for arr in arrays.values():
+            arr.close(unlink=True)
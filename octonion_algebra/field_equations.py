@@ -152,6 +152,47 @@ def _deriv(F, axis, dx):
     return d
 
 
+def _remainder_coefficients(ndim_spatial):
+    """
+    Component-mixing matrices of R = curl(curl A) + Lap A - grad(div A).
+
+    Every term of R is a second derivative d_a d_b of a fixed linear
+    combination of components:
+
+        R = sum_{a >= b} d_a d_b (A @ C[a, b].T)
+
+    with a, b running over the spatial axes.  Derivatives along different
+    axes commute (also at the one-sided boundary stencils, since they act
+    on different axes), so the (a, b) and (b, a) terms are merged.  For the
+    octonionic structure constants the merged matrices cancel exactly --
+    the non-associative part of curl(curl) is antisymmetric in (a, b) --
+    so on a grid R is zero up to the rounding of evaluating its terms
+    separately.
+
+    Returns
+    -------
+    dict mapping (a, b) with a >= b to a (7, 7) matrix; pairs whose matrix
+    vanishes are omitted.
+    """
+    eps = structure_constants()
+    d = min(ndim_spatial, 7)
+    C = np.zeros((d, d, 7, 7))
+    for a in range(d):
+        for b in range(d):
+            # curl(curl A)_k = sum d_a eps[a,j,k] d_b eps[b,l,j] A_l
+            C[a, b] += eps[a].T @ eps[b].T
+            # grad(div A)_a = d_a d_b A_b
+            C[a, b, a, b] -= 1.0
+        C[a, a] += np.eye(7)
+    coeffs = {}
+    for a in range(d):
+        for b in range(a + 1):
+            M = C[a, b] + C[b, a] if a != b else C[a, a]
+            if np.any(M):
+                coeffs[(a, b)] = M
+    return coeffs
+
+
 def wave_equation_remainder(A, dx):
     """
     Non-associative remainder R[A] from the double-curl identity.
@@ -168,6 +209,13 @@ def wave_equation_remainder(A, dx):
     For example, ``A.shape = (N, N, N, 7)`` for a field living on a 3D
     grid with 7 vector components, or ``A.shape = (N, 7)`` for a 1D grid.
 
+    R is linear in A and every term is a second derivative of a component
+    mix (see ``_remainder_coefficients``), so the three operators are
+    evaluated together: each first derivative d_b A is computed once, the
+    components are mixed, and one more derivative is taken per axis.  To
+    apply R to many fields on the same grid, assemble it once with
+    ``wave_equation_remainder_operator``.
+
     Parameters
     ----------
     A : ndarray, shape (*grid, 7)
@@ -177,62 +225,131 @@ def wave_equation_remainder(A, dx):
     -------
     R : ndarray, same shape as A
     """
-    eps = structure_constants()
-    shape = A.shape
-    ndim_spatial = len(shape) - 1  # number of spatial grid dimensions
-    comp_axis = len(shape) - 1     # axis index for the 7 components
+    A = np.asarray(A, dtype=float)
+    return _apply_second_order(A, dx, _remainder_coefficients(A.ndim - 1))
 
-    # Convenience: extract component slices
-    def comp(F, c):
-        """Return the c-th component of field F (last axis)."""
-        return F[..., c]
 
-    def set_comp(F, c, val):
-        F[..., c] = val
-
-    # Step 1: compute curl(A)
-    curl_A = np.zeros_like(A)
-    for k in range(7):
-        for i in range(min(ndim_spatial, 7)):
-            for j in range(7):
-                if eps[i, j, k] == 0:
-                    continue
-                dAj_dxi = _deriv(comp(A, j), i, dx)
-                curl_A[..., k] += eps[i, j, k] * dAj_dxi
-
-    # Step 2: compute curl(curl(A))
-    curl_curl_A = np.zeros_like(A)
-    for k in range(7):
-        for i in range(min(ndim_spatial, 7)):
-            for j in range(7):
-                if eps[i, j, k] == 0:
-                    continue
-                dcurl_j_dxi = _deriv(comp(curl_A, j), i, dx)
-                curl_curl_A[..., k] += eps[i, j, k] * dcurl_j_dxi
-
-    # Step 3: compute Laplacian(A)
-    lap_A = np.zeros_like(A)
-    for c in range(7):
-        Ac = comp(A, c)
-        for i in range(min(ndim_spatial, 7)):
-            d2 = _deriv(_deriv(Ac, i, dx), i, dx)
-            lap_A[..., c] += d2
-
-    # Step 4: compute grad(div A)
-    # div A = sum_i dA_i / dx_i  (only up to ndim_spatial components)
-    div_A = np.zeros(shape[:-1])
-    for i in range(min(ndim_spatial, 7)):
-        div_A += _deriv(comp(A, i), i, dx)
-
-    grad_div_A = np.zeros_like(A)
-    for k in range(min(ndim_spatial, 7)):
-        grad_div_A[..., k] = _deriv(div_A, k, dx)
-
-    # R = curl(curl A) + Lap A - grad(div A)
-    R = curl_curl_A + lap_A - grad_div_A
+def _apply_second_order(A, dx, coeffs):
+    """Apply sum_{(a, b)} d_a d_b (A @ M.T), each d_b A computed once."""
+    dA = {b: _deriv(A, b, dx) for b in sorted({b for _, b in coeffs})}
+    R = np.zeros_like(A)
+    for a in sorted({a for a, _ in coeffs}):
+        mixed = sum(dA[b] @ M.T for (a_, b), M in coeffs.items() if a_ == a)
+        R += _deriv(mixed, a, dx)
     return R
 
 
+class SparseOperator:
+    """
+    A sparse matrix in compressed-row form, applied by gather and segment sum.
+
+    Parameters
+    ----------
+    rows, cols : ndarray of int  — coordinates of the entries
+    data : ndarray of float  — values; duplicate coordinates are summed
+    shape : (int, int)
+    """
+
+    def __init__(self, rows, cols, data, shape):
+        n_rows, n_cols = shape
+        key = np.asarray(rows, dtype=np.int64) * n_cols + np.asarray(cols)
+        key, inverse = np.unique(key, return_inverse=True)
+        data = np.bincount(inverse, weights=data, minlength=len(key))
+        keep = data != 0
+        key, data = key[keep], data[keep]
+        self.shape = (n_rows, n_cols)
+        self.rows = key // n_cols
+        self.indices = key % n_cols
+        self.data = data
+        self.indptr = np.searchsorted(self.rows, np.arange(n_rows + 1))
+
+    @property
+    def nnz(self):
+        """Number of stored entries."""
+        return len(self.data)
+
+    def __matmul__(self, x):
+        """Product with a vector (n,) or a stack of columns (n, k)."""
+        x = np.asarray(x, dtype=float)
+        products = self.data.reshape((-1,) + (1,) * (x.ndim - 1)) * x[self.indices]
+        out = np.zeros((self.shape[0],) + x.shape[1:])
+        filled = self.indptr[:-1] < self.indptr[1:]
+        if np.any(filled):
+            out[filled] = np.add.reduceat(products, self.indptr[:-1][filled])
+        return out
+
+    def toarray(self):
+        """Dense copy, for small grids (e.g. spectra)."""
+        out = np.zeros(self.shape)
+        out[self.rows, self.indices] = self.data
+        return out
+
+
+def _deriv_matrix(n, dx):
+    """The 1-D ``_deriv`` stencil as a dense (n, n) matrix."""
+    D = np.zeros((n, n))
+    i = np.arange(1, n - 1)
+    D[i, i + 1] = 1.0 / (2 * dx)
+    D[i, i - 1] = -1.0 / (2 * dx)
+    D[0, 0], D[0, 1] = -1.0 / dx, 1.0 / dx
+    D[-1, -1], D[-1, -2] = 1.0 / dx, -1.0 / dx
+    return D
+
+
+def wave_equation_remainder_operator(grid_shape, dx):
+    """
+    Assemble R[A] on a fixed grid as a sparse matrix.
+
+    The matrix acts on ``A.reshape(-1)`` for ``A`` of shape
+    ``(*grid_shape, 7)``, so that ``(op @ A.reshape(-1)).reshape(A.shape)``
+    equals ``wave_equation_remainder(A, dx)``.  Stacking fields as columns,
+    ``op @ X`` with ``X`` of shape (7 * prod(grid_shape), k) applies R to k
+    fields in one product.
+
+    Parameters
+    ----------
+    grid_shape : tuple of int  — spatial grid shape (each axis >= 3)
+    dx : float
+
+    Returns
+    -------
+    SparseOperator of shape (7 M, 7 M), M = prod(grid_shape).
+    """
+    grid_shape = tuple(int(n) for n in grid_shape)
+    return _assemble_second_order(grid_shape, dx,
+                                  _remainder_coefficients(len(grid_shape)))
+
+
+def _assemble_second_order(grid_shape, dx, coeffs):
+    """Sparse matrix of ``_apply_second_order`` on a fixed grid."""
+    size = int(np.prod(grid_shape))
+    D = [_deriv_matrix(n, dx) for n in grid_shape]
+
+    rows, cols, data = [], [], []
+    for (a, b), M in coeffs.items():
+        # Grid operator d_a d_b as a Kronecker product of 1-D factors
+        factors = [np.eye(n) for n in grid_shape]
+        factors[a] = D[a] @ D[b] if a == b else D[a]
+        if a != b:
+            factors[b] = D[b]
+        r, c, v = np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), np.ones(1)
+        for F in factors:
+            fr, fc = np.nonzero(F)
+            r = (r[:, None] * F.shape[0] + fr).ravel()
+            c = (c[:, None] * F.shape[1] + fc).ravel()
+            v = (v[:, None] * F[fr, fc]).ravel()
+        k, l = np.nonzero(M)
+        rows.append((r[:, None] * 7 + k).ravel())
+        cols.append((c[:, None] * 7 + l).ravel())
+        data.append((v[:, None] * M[k, l]).ravel())
+
+    if not rows:
+        return SparseOperator(np.zeros(0, int), np.zeros(0, int), np.zeros(0),
+                              (7 * size, 7 * size))
+    return SparseOperator(np.concatenate(rows), np.concatenate(cols),
+                          np.concatenate(data), (7 * size, 7 * size))
+
+
 # ---------------------------------------------------------------------------
 # 3. 7D Poynting vector  (Ch 29)
 # ---------------------------------------------------------------------------
@@ -13,6 +13,7 @@ import numpy as np
 from itertools import combinations
 from octonion_algebra.core import Octonion
 from octonion_algebra.associator import associator
+from octonion_algebra.bracketing import bracketed_products
 
 
 def moufang_check(a, b, c):
@@ -35,20 +36,18 @@ def moufang_check(a, b, c):
             'moufang_1', 'moufang_2', 'moufang_3': bool (True if satisfied)
             'errors': tuple of 3 floats (norm of lhs - rhs for each identity)
     """
-    # Identity 1: ((xy)z)y = x(y(zy))
-    lhs1 = ((a * b) * c) * b
-    rhs1 = a * (b * (c * b))
-    err1 = (lhs1 - rhs1).norm()
-
-    # Identity 2: (x(yz))x = (xy)(zx)
-    lhs2 = (a * (b * c)) * a
-    rhs2 = (a * b) * (c * a)
-    err2 = (lhs2 - rhs2).norm()
-
-    # Identity 3: ((xy)x)z = x(y(xz))
-    lhs3 = ((a * b) * a) * c
-    rhs3 = a * (b * (a * c))
-    err3 = (lhs3 - rhs3).norm()
+    # Each identity compares two bracketings of a 4-factor word, so all
+    # three are evaluated as one batch with shared sub-products.
+    # Bracketing order: ((xy)z)w, (x(yz))w, (xy)(zw), x((yz)w), x(y(zw))
+    words = np.array([
+        [a.coeffs, b.coeffs, c.coeffs, b.coeffs],   # 1: ((xy)z)y = x(y(zy))
+        [a.coeffs, b.coeffs, c.coeffs, a.coeffs],   # 2: (x(yz))x = (xy)(zx)
+        [a.coeffs, b.coeffs, a.coeffs, c.coeffs],   # 3: ((xy)x)z = x(y(xz))
+    ])
+    vals = bracketed_products(words, 1.0)
+    err1 = float(np.linalg.norm(vals[0, 0] - vals[0, 4]))
+    err2 = float(np.linalg.norm(vals[1, 1] - vals[1, 2]))
+    err3 = float(np.linalg.norm(vals[2, 0] - vals[2, 4]))
 
     return {
         'moufang_1': err1 < 1e-10,
@@ -6,12 +6,52 @@ on discretized grids, plus the 7D vorticity source term S_NA that arises
 from non-associativity and vanishes on any 3D slice.
 
 Extracted from Appendix C.5 and C.13.
+
+Derivatives default to second-order finite differences (``np.gradient``).
+For periodic fields such as ``taylor_green_7d``, ``method='spectral'``
+differentiates each axis with a real FFT instead, which is exact for
+band-limited fields and exponentially accurate for smooth ones.
 """
 import numpy as np
 from octonion_algebra.core import FANO_TRIPLES
 
 
-def octonionic_gradient(f_grid, dx, dims=7):
+_METHODS = ('stencil', 'spectral')
+
+
+def _check_method(method):
+    if method not in _METHODS:
+        raise ValueError(f"Unknown derivative method: {method!r} "
+                         f"(expected one of {_METHODS})")
+
+
+def _spectral_partial(f, axis, dx):
+    """
+    Spectral derivative df/dx_axis of a field periodic along ``axis``.
+
+    The grid along ``axis`` is taken to span one period, n * dx.  For
+    even n the Nyquist mode is dropped, since its derivative is not
+    representable on the grid.
+    """
+    n = f.shape[axis]
+    ik = 2j * np.pi * np.fft.rfftfreq(n, d=dx)
+    if n % 2 == 0:
+        ik[-1] = 0.0
+    shape = [1] * f.ndim
+    shape[axis] = -1
+    f_hat = np.fft.rfft(f, axis=axis)
+    f_hat *= ik.reshape(shape)
+    return np.fft.irfft(f_hat, n=n, axis=axis)
+
+
+def _partial(f, axis, dx, method):
+    """df/dx_axis by the chosen method."""
+    if method == 'spectral':
+        return _spectral_partial(f, axis, dx)
+    return np.gradient(f, dx, axis=axis)
+
+
+def octonionic_gradient(f_grid, dx, dims=7, method='stencil'):
     """
     Compute the octonionic gradient of a scalar field on a discretized grid.
 
@@ -25,19 +65,21 @@ def octonionic_gradient(f_grid, dx, dims=7):
                 grid (or fewer dimensions, specified by dims).
         dx: grid spacing (scalar, assumed uniform in all directions)
         dims: number of spatial dimensions (default 7)
+        method: 'stencil' (np.gradient) or 'spectral' (periodic FFT)
 
     Returns:
         List of dims numpy arrays, each the same shape as f_grid,
         representing the components of the gradient.
     """
+    _check_method(method)
     grad_components = []
     for axis in range(dims):
-        df = np.gradient(f_grid, dx, axis=axis)
+        df = _partial(f_grid, axis, dx, method)
         grad_components.append(df)
     return grad_components
 
 
-def octonionic_divergence(F_components, dx):
+def octonionic_divergence(F_components, dx, method='stencil'):
     """
     Compute the octonionic divergence of a vector field.
 
@@ -47,17 +89,19 @@ def octonionic_divergence(F_components, dx):
         F_components: list of numpy arrays (same shape), the
                       components of the vector field.
         dx: grid spacing
+        method: 'stencil' (np.gradient) or 'spectral' (periodic FFT)
 
     Returns:
         numpy array (same shape): the divergence (scalar field).
     """
+    _check_method(method)
     div = np.zeros_like(F_components[0])
     for i in range(len(F_components)):
-        div += np.gradient(F_components[i], dx, axis=i)
+        div += _partial(F_components[i], i, dx, method)
     return div
 
 
-def octonionic_curl_7d(F_components, dx):
+def octonionic_curl_7d(F_components, dx, method='stencil'):
     """
     Compute the 7D curl of a vector field using the octonionic cross product.
 
@@ -72,30 +116,71 @@ def octonionic_curl_7d(F_components, dx):
         F_components: list of 7 numpy arrays (same shape), the 7 components
                       of the vector field F = F_1 e_1 + ... + F_7 e_7.
         dx: grid spacing
+        method: 'stencil' (np.gradient) or 'spectral' (periodic FFT)
 
     Returns:
         List of 7 numpy arrays: the components of curl(F).
     """
     assert len(F_components) == 7, "7D curl requires exactly 7 components"
+    _check_method(method)
+    return _fano_curl(F_components, dx, FANO_TRIPLES, method)
+
 
-    # Precompute all partial derivatives dF_j/dx_i
-    partials = []
-    for j in range(7):
-        partials_j = []
-        for i in range(7):
-            partials_j.append(np.gradient(F_components[j], dx, axis=i))
-        partials.append(partials_j)
-    # partials[j][i] = dF_j / dx_i
+def _add_partial(out, f, axis, dx, sign, scratch, method='stencil'):
+    """
+    out += sign * df/dx_axis, with the stencil of ``np.gradient``.
 
-    curl = [np.zeros_like(F_components[0]) for _ in range(7)]
+    The interior difference is formed in ``scratch`` (a flat buffer at
+    least the size of ``f``), so no full-grid temporary is allocated.
+    The spectral derivative needs its own transform arrays.
+    """
+    accumulate = np.add if sign > 0 else np.subtract
+    if method == 'spectral':
+        accumulate(out, _spectral_partial(f, axis, dx), out=out)
+        return
+
+    def at(s):
+        idx = [slice(None)] * f.ndim
+        idx[axis] = s
+        return tuple(idx)
+
+    shape = list(f.shape)
+    shape[axis] -= 2
+    if shape[axis] > 0:
+        tmp = scratch[:int(np.prod(shape))].reshape(shape)
+        np.subtract(f[at(slice(2, None))], f[at(slice(None, -2))], out=tmp)
+        tmp /= 2.0 * dx
+        interior = out[at(slice(1, -1))]
+        accumulate(interior, tmp, out=interior)
+    for edge, (hi, lo) in ((0, (1, 0)), (-1, (-1, -2))):
+        accumulate(out[at(edge)], (f[at(hi)] - f[at(lo)]) / dx,
+                   out=out[at(edge)])
+
+
+def _fano_curl(F_components, dx, triples, method='stencil', out=None):
+    """
+    Curl contributions of the given Fano triples, streamed term by term.
+
+    Every ordered pair (i, j), i != j, lies on exactly one Fano line, so
+    each partial dF_j/dx_i enters the curl once, with a single sign and
+    output component.  The partials are therefore computed one at a time
+    and added straight into the output, instead of materialising all 49:
+    peak memory is the 7 output components plus one scratch buffer.
+    Contributions are added to ``out`` (7 arrays) when it is given.
+    """
+    if out is None:
+        out = [np.zeros_like(F_components[0]) for _ in range(7)]
+    curl = out
+    scratch = np.empty(F_components[0].size, dtype=curl[0].dtype)
 
-    for (a, b, c) in FANO_TRIPLES:
+    for (a, b, c) in triples:
         # Convert to 0-indexed
         ii, jj, kk = a - 1, b - 1, c - 1
-        # f_{ijk} = +1 for (i,j,k) = cyclic perm of Fano triple
-        curl[kk] += partials[jj][ii] - partials[ii][jj]
-        curl[ii] += partials[kk][jj] - partials[jj][kk]
-        curl[jj] += partials[ii][kk] - partials[kk][ii]
+        # f_{ijk} = +1 for (i,j,k) = cyclic perm of Fano triple:
+        # (curl F)_k += dF_j/dx_i - dF_i/dx_j, and cyclically
+        for (i, j, k) in ((ii, jj, kk), (jj, kk, ii), (kk, ii, jj)):
+            _add_partial(curl[k], F_components[j], i, dx, +1, scratch, method)
+            _add_partial(curl[k], F_components[i], j, dx, -1, scratch, method)
 
     return curl
 
@@ -126,7 +211,7 @@ def taylor_green_7d(N=8):
     return v, dx
 
 
-def vorticity_source_na(v, dx):
+def vorticity_source_na(v, dx, method='stencil'):
     """
     Compute the non-associative vorticity source term S_NA.
 
@@ -137,29 +222,17 @@ def vorticity_source_na(v, dx):
     Args:
         v: list of 7 numpy arrays (velocity components)
         dx: grid spacing
+        method: 'stencil' (np.gradient) or 'spectral' (periodic FFT)
 
     Returns:
         List of 7 numpy arrays: the components of S_NA.
     """
-    curl_v = octonionic_curl_7d(v, dx)
-
-    # Recompute partials for extracting the 3D-compatible part
-    partials = []
-    for j in range(7):
-        partials_j = []
-        for i in range(7):
-            partials_j.append(np.gradient(v[j], dx, axis=i))
-        partials.append(partials_j)
-
-    # 3D curl contribution: only Fano triple (1,2,3) -> 0-indexed (0,1,2)
-    curl_3d_part = [np.zeros_like(v[0]) for _ in range(7)]
-    ii, jj, kk = 0, 1, 2
-    curl_3d_part[kk] += partials[jj][ii] - partials[ii][jj]
-    curl_3d_part[ii] += partials[kk][jj] - partials[jj][kk]
-    curl_3d_part[jj] += partials[ii][kk] - partials[kk][ii]
-
-    S_NA = [curl_v[k] - curl_3d_part[k] for k in range(7)]
-    return S_NA
+    _check_method(method)
+    # The curl is a sum over Fano triples, so subtracting the 3D-compatible
+    # part (triple (1,2,3)) is the same as running the curl pass over the
+    # other six triples only.
+    return _fano_curl(v, dx, [t for t in FANO_TRIPLES if t != (1, 2, 3)],
+                      method)
 
 
 def restrict_velocity_to_3d(N=4):
@@ -22,6 +22,7 @@ plotting, and include an epsilon=0 baseline for comparison.
 
 import numpy as np
 from itertools import combinations
+from statistics import NormalDist
 
 from octonion_algebra.core import Octonion, FANO_TRIPLES
 from octonion_algebra.deformation import (
@@ -29,11 +30,15 @@ from octonion_algebra.deformation import (
     deformed_multiply,
     deformed_associator,
     deformed_structure_constants,
+    deformed_multiplication_tensor,
+    deformed_multiply_batch,
 )
 from octonion_algebra.associator import associator, associator_norm
+from octonion_algebra.bracketing import bracketing_spread
 from octonion_algebra.applications import (
     fano_ternary_tensor,
     simulate_lotka_volterra,
+    simulate_lotka_volterra_ensemble,
     octonionic_lotka_volterra_rhs,
 )
 
@@ -42,6 +47,34 @@ from octonion_algebra.applications import (
 # Helpers
 # ============================================================================
 
+def _lexicographic_permutations(n):
+    """
+    All permutations of range(n) as an (n!, n) array in lexicographic order.
+
+    Built level by level: every prefix is extended by each of its remaining
+    elements in increasing order, which keeps the rows sorted (the same
+    order as ``itertools.permutations``).
+
+    Args:
+        n: int, number of elements.
+
+    Returns:
+        ndarray of shape (n!, n), dtype int64.
+    """
+    prefixes = np.zeros((1, 0), dtype=np.int64)
+    remaining = np.arange(n, dtype=np.int64)[None, :]
+    for r in range(n, 1, -1):
+        # drop[j] lists the columns of `remaining` kept after taking column j
+        drop = np.array([[c for c in range(r) if c != j] for j in range(r)],
+                        dtype=np.int64)
+        prefixes = np.concatenate([
+            np.repeat(prefixes, r, axis=0),
+            remaining.reshape(-1, 1),
+        ], axis=1)
+        remaining = remaining[:, drop].reshape(-1, r - 1)
+    return np.concatenate([prefixes, remaining], axis=1)
+
+
 def _deformed_associator_norm(a_coeffs, b_coeffs, c_coeffs, epsilon):
     """
     Compute ||[a, b, c]_epsilon|| for raw coefficient arrays.
@@ -195,7 +228,8 @@ class MultiAgentMarket:
             count += 1
         return total / count if count > 0 else 0.0
 
-    def evolve(self, steps=100, dt=0.01, coupling=0.01):
+    def evolve(self, steps=100, dt=0.01, coupling=0.01, writer=None,
+               store_history=True):
         """
         Time-step the market for *steps* iterations.
 
@@ -212,22 +246,29 @@ class MultiAgentMarket:
             steps: number of time steps.
             dt: time-step size.
             coupling: interaction strength.
+            writer: optional ``trajectory_io.TrajectoryWriter``; the agent
+                states of every step are appended to it as field 'states'.
+            store_history: bool, keep the state history in memory.  With
+                False 'states_history' is None.
 
         Returns:
             dict with keys:
-                'states_history': ndarray (steps+1, n_agents, 8)
+                'states_history': ndarray (steps+1, n_agents, 8), or None
                 'associator_norms': ndarray (steps+1,) -- mean assoc norm
                     at each recorded time.
                 'total_wealth': ndarray (steps+1,) -- total wealth over time.
                 'times': ndarray (steps+1,) -- time values.
         """
         n = self.n_agents
-        history = np.zeros((steps + 1, n, 8))
+        history = np.zeros((steps + 1, n, 8)) if store_history else None
         assoc_norms = np.zeros(steps + 1)
         wealth_history = np.zeros(steps + 1)
         times = np.arange(steps + 1) * dt
 
-        history[0] = self.states.copy()
+        if store_history:
+            history[0] = self.states.copy()
+        if writer is not None:
+            writer.append(0, 0.0, states=self.states)
         assoc_norms[0] = self.mean_associator_norm()
         wealth_history[0] = self.total_wealth()
 
@@ -241,7 +282,10 @@ class MultiAgentMarket:
                     delta[j] -= dt * interaction
 
             self.states += delta
-            history[step + 1] = self.states.copy()
+            if store_history:
+                history[step + 1] = self.states.copy()
+            if writer is not None:
+                writer.append(step + 1, times[step + 1], states=self.states)
             assoc_norms[step + 1] = self.mean_associator_norm()
             wealth_history[step + 1] = self.total_wealth()
 
@@ -375,7 +419,72 @@ class PortfolioDynamics:
                 entropy -= p * np.log(p)
         return float(entropy)
 
-    def ordering_spread(self, indices):
+    def ordering_returns(self, orderings, prefix_sharing=False,
+                         batch_size=65536):
+        """
+        Returns (real parts of the left-to-right products) of many orderings.
+
+        Orderings are pushed through the sequential product together: at
+        step t the running products of all P orderings form one (P, 8)
+        array that is multiplied by the t-th assets in a single batched
+        call, instead of P separate ``portfolio_product`` calls.
+
+        With ``prefix_sharing`` the orderings are sorted into a trie: every
+        distinct prefix is multiplied out once and its product is shared by
+        all orderings that start with it.  For exhaustive enumeration of n
+        assets this cuts the number of products from n * n! to about
+        e * n!.
+
+        Args:
+            orderings: (P, n) array-like of asset indices, one ordering per row.
+            prefix_sharing: bool, evaluate through a prefix trie.
+            batch_size: int, orderings evaluated per batch.
+
+        Returns:
+            ndarray of shape (P,): the return of each ordering.
+        """
+        orderings = np.asarray(orderings, dtype=np.int64)
+        P, n = orderings.shape
+        tensor = deformed_multiplication_tensor(self.epsilon)
+        returns = np.empty(P)
+
+        for start in range(0, P, batch_size):
+            rows = orderings[start:start + batch_size]
+            if not prefix_sharing:
+                prod = self.assets[rows[:, 0]]
+                for t in range(1, n):
+                    prod = deformed_multiply_batch(
+                        prod, self.assets[rows[:, t]], None, tensor=tensor
+                    )
+                returns[start:start + len(rows)] = prod[:, 0]
+                continue
+
+            # Trie over the lexicographically sorted rows: a new node starts
+            # wherever a row's prefix differs from the previous row's.
+            order = np.lexsort(rows.T[::-1])
+            rows = rows[order]
+            new_node = np.ones(len(rows), dtype=bool)
+            new_node[1:] = rows[1:, 0] != rows[:-1, 0]
+            node_of_row = np.cumsum(new_node) - 1
+            prod = self.assets[rows[new_node, 0]]
+            for t in range(1, n):
+                changed = np.ones(len(rows), dtype=bool)
+                changed[1:] = rows[1:, t] != rows[:-1, t]
+                new_node = new_node | changed
+                first = np.flatnonzero(new_node)
+                prod = deformed_multiply_batch(
+                    prod[node_of_row[first]], self.assets[rows[first, t]],
+                    None, tensor=tensor,
+                )
+                node_of_row = np.cumsum(new_node) - 1
+            chunk = np.empty(len(rows))
+            chunk[order] = prod[node_of_row, 0]
+            returns[start:start + len(rows)] = chunk
+
+        return returns
+
+    def ordering_spread(self, indices, prefix_sharing=False,
+                        exhaustive_max_n=7, n_samples=5040):
         """
         Compute the spread of portfolio returns over all permutations of
         the given asset indices.
@@ -384,11 +493,16 @@ class PortfolioDynamics:
         and record its real part (the return). The spread is the difference
         between the maximum and minimum return.
 
-        For n <= 7 all permutations are enumerated; for larger n a random
-        sample of 5040 permutations is used.
+        For n <= exhaustive_max_n all permutations are enumerated (in
+        lexicographic order); for larger n a random sample of n_samples
+        permutations is used.  All permutations are evaluated together by
+        ``ordering_returns``.
 
         Args:
             indices: sequence of asset indices (length >= 3).
+            prefix_sharing: bool, share common prefixes through a trie.
+            exhaustive_max_n: int, largest n enumerated exhaustively.
+            n_samples: int, permutations sampled for larger n.
 
         Returns:
             dict with keys:
@@ -397,16 +511,15 @@ class PortfolioDynamics:
                 'mean_return': float.
                 'std_return': float.
         """
-        from itertools import permutations as iterperms
-        indices = list(indices)
+        indices = np.asarray(list(indices), dtype=np.int64)
         n = len(indices)
-        if n <= 7:
-            perms = list(iterperms(indices))
+        if n <= exhaustive_max_n:
+            perms = indices[_lexicographic_permutations(n)]
         else:
             rng = np.random.default_rng(self.seed + 999)
-            perms = [tuple(rng.permutation(indices)) for _ in range(5040)]
+            perms = np.array([rng.permutation(indices) for _ in range(n_samples)])
 
-        returns = np.array([self.portfolio_product(p)[0] for p in perms])
+        returns = self.ordering_returns(perms, prefix_sharing=prefix_sharing)
         return {
             'returns': returns,
             'spread': float(np.max(returns) - np.min(returns)),
@@ -414,6 +527,112 @@ class PortfolioDynamics:
             'std_return': float(np.std(returns)),
         }
 
+    def ordering_spread_estimate(self, indices, n_samples=20000,
+                                 confidence=0.95, seed=None,
+                                 prefix_sharing=False):
+        """
+        Sampling estimate of the ordering spread with confidence bounds.
+
+        Uniformly random orderings are evaluated in one batch.  The sample
+        range [min, max] is a guaranteed inner bound on the true range, so
+        the sample spread is a lower bound on the true spread.  How much of
+        the ordering distribution it misses is bounded distribution-free:
+        the fraction of all orderings whose return lies inside the sample
+        range is Beta(m-1, 2)-distributed for m samples, which gives
+        'coverage' -- with probability ``confidence`` at least this
+        fraction of all n! orderings falls inside the sample range.  The
+        mean return gets a normal-approximation confidence interval.
+
+        Args:
+            indices: sequence of asset indices (length >= 3).
+            n_samples: int, number of random orderings (>= 2).
+            confidence: float in (0, 1).
+            seed: optional int; defaults to the portfolio seed.
+            prefix_sharing: bool, share common prefixes through a trie.
+
+        Returns:
+            dict with keys:
+                'spread_lower_bound': float -- sample max - sample min.
+                'min_return', 'max_return': float -- sample extremes.
+                'coverage': float -- fraction of orderings inside the sample
+                    range, at the given confidence.
+                'mean_return': float.
+                'mean_ci': (float, float) -- confidence interval for the
+                    mean return over all orderings.
+                'std_return': float.
+                'n_samples': int.
+                'confidence': float.
+        """
+        indices = np.asarray(list(indices), dtype=np.int64)
+        n = len(indices)
+        m = int(n_samples)
+        if m < 2:
+            raise ValueError("Need at least 2 samples")
+        rng = np.random.default_rng(self.seed + 999 if seed is None else seed)
+        perms = indices[np.argsort(rng.random((m, n)), axis=1)]
+        returns = self.ordering_returns(perms, prefix_sharing=prefix_sharing)
+
+        # Coverage C of the sample range ~ Beta(m-1, 2):
+        # P(C <= q) = m q^(m-1) - (m-1) q^m.  Solve P(C <= q) = 1 - confidence.
+        lo, hi = 0.0, 1.0
+        for _ in range(100):
+            q = 0.5 * (lo + hi)
+            if m * q ** (m - 1) - (m - 1) * q ** m < 1.0 - confidence:
+                lo = q
+            else:
+                hi = q
+        coverage = lo
+
+        mean = float(np.mean(returns))
+        std = float(np.std(returns, ddof=1))
+        z = NormalDist().inv_cdf(0.5 + 0.5 * confidence)
+        half = z * std / np.sqrt(m)
+
+        return {
+            'spread_lower_bound': float(np.max(returns) - np.min(returns)),
+            'min_return': float(np.min(returns)),
+            'max_return': float(np.max(returns)),
+            'coverage': float(coverage),
+            'mean_return': mean,
+            'mean_ci': (float(mean - half), float(mean + half)),
+            'std_return': std,
+            'n_samples': m,
+            'confidence': float(confidence),
+        }
+
+    def bracketing_spread(self, indices):
+        """
+        Compute the spread of portfolio returns over all bracketings of a
+        fixed trade order.
+
+        ``portfolio_product`` only uses left association; here every one of
+        the Catalan(n-1) ways of grouping the n trades is evaluated, with
+        each sub-group's products computed once and shared.  Practical up
+        to n = 10 (4862 bracketings).
+
+        Args:
+            indices: sequence of asset indices (length >= 3), in trade order.
+
+        Returns:
+            dict with keys:
+                'spread': float -- max - min return over all bracketings.
+                'min_return': float.
+                'max_return': float.
+                'mean_return': float.
+                'max_deviation': float -- max ||P_b - P_LR|| over all
+                    bracketings b, P_LR being the left-to-right product.
+                'n_bracketings': int.
+        """
+        stats = bracketing_spread(self.assets[list(indices)], self.epsilon)
+        return {
+            'spread': stats['spread'],
+            'min_return': stats['min'],
+            'max_return': stats['max'],
+            'mean_return': stats['mean'],
+            'max_deviation': stats['max_deviation'],
+            'n_bracketings': stats['n_bracketings'],
+        }
+
     def compare_returns(self, epsilon_values=None):
         """
         Show how context-dependence affects portfolio returns across
@@ -606,29 +825,26 @@ class EcosystemModel:
             epsilon_values = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
         epsilon_values = np.asarray(epsilon_values, dtype=float)
 
-        saved_eps = self.epsilon
-        trajectories = {}
-        final_biomass = np.zeros(len(epsilon_values))
-
-        # Always compute eps=0 baseline first
-        self.epsilon = 0.0
-        baseline_result = self.simulate(dt, n_steps)
-        baseline_traj = baseline_result['trajectory']
+        # The eps=0 baseline and every epsilon evolve together as one batch
+        n_eps = len(epsilon_values)
+        scales = self.ternary_scale * np.concatenate([[0.0], epsilon_values])
+        ensemble = simulate_lotka_volterra_ensemble(
+            np.tile(self.x0, (n_eps + 1, 1)), self.r, self.A, scales,
+            dt, n_steps, return_trajectories=True,
+        )['trajectories']
+        baseline_traj = ensemble[:, 0]
 
+        trajectories = {}
+        final_biomass = np.zeros(n_eps)
+        max_species_dev = np.zeros(n_eps)
         for idx, eps in enumerate(epsilon_values):
-            self.epsilon = eps
-            result = self.simulate(dt, n_steps)
-            trajectories[float(eps)] = result['trajectory']
-            final_biomass[idx] = result['total_biomass'][-1]
+            traj = ensemble[:, idx + 1]
+            trajectories[float(eps)] = traj
+            final_biomass[idx] = np.sum(traj[-1])
+            max_species_dev[idx] = float(np.max(np.abs(traj - baseline_traj)))
 
         # Deviations from baseline
         biomass_dev = np.abs(final_biomass - final_biomass[0])
-        max_species_dev = np.zeros(len(epsilon_values))
-        for idx, eps in enumerate(epsilon_values):
-            diff = np.abs(trajectories[float(eps)] - baseline_traj)
-            max_species_dev[idx] = float(np.max(diff))
-
-        self.epsilon = saved_eps  # restore
 
         return {
             'epsilon': epsilon_values,
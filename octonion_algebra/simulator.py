@@ -43,6 +43,8 @@ References
 - Chapters 28-33: Field equations in 7D
 """
 
+import time
+
 import numpy as np
 
 from octonion_algebra.core import Octonion, FANO_TRIPLES
@@ -51,12 +53,19 @@ from octonion_algebra.deformation import (
     deformed_multiply,
     DeformedOctonion,
     deformed_structure_constants,
+    deformed_multiplication_tensor,
 )
 from octonion_algebra.time_evolution import (
     evolve_klein_gordon as _base_evolve_kg,
     compute_energy as _base_compute_energy,
+    _compute_laplacian as _base_laplacian,
+    _ImplicitLinearStep,
+    _laplacian_eigenbasis,
+    _mode_wavenumbers,
 )
 from octonion_algebra.field_equations import poynting_7d
+from octonion_algebra.checkpoint import Checkpointer, load_checkpoint
+from octonion_algebra.domain_decomposition import decomposed_steps
 
 
 # ---------------------------------------------------------------------------
@@ -119,27 +128,316 @@ def _deformed_multiply_array(a, b, epsilon):
     return result
 
 
-def _compute_laplacian(phi, dx):
-    """Discrete 1D Laplacian with Dirichlet (zero-ghost) boundaries.
+def _compute_laplacian(phi, dx, boundary='dirichlet', method='stencil'):
+    """Discrete 1D Laplacian, by default with Dirichlet (zero-ghost) boundaries.
 
     Uses the standard 3-point stencil, consistent with the leapfrog
     integrator in time_evolution.py so the symplectic energy is exact.
+    ``boundary='periodic'`` wraps the stencil and ``method='spectral'``
+    (periodic only) uses the FFT Laplacian -k^2.
 
     Parameters
     ----------
-    phi : ndarray, shape (N, C)  where C is the number of components
+    phi : ndarray, shape (..., N, C)  where C is the number of components;
+          leading axes (e.g. an ensemble axis) are batched over
     dx  : float
+    boundary : 'dirichlet' or 'periodic'
+    method   : 'stencil' or 'spectral'
 
     Returns
     -------
     ndarray, same shape as phi
     """
-    lap = np.zeros_like(phi)
-    lap[1:-1] = (phi[2:] - 2.0 * phi[1:-1] + phi[:-2]) / (dx ** 2)
-    # Dirichlet ghost: phi[-1] = phi[N] = 0
-    lap[0] = (phi[1] - 2.0 * phi[0]) / (dx ** 2)
-    lap[-1] = (phi[-2] - 2.0 * phi[-1]) / (dx ** 2)
-    return lap
+    return _base_laplacian(phi, dx, boundary, method)
+
+
+def _sine_synthesis(coeffs, n, axis):
+    """Sine series sum_k coeffs[k] sin(2 pi k j / n), j = 0..n-1, by FFT.
+
+    ``coeffs`` holds modes k = 0 .. n//2 - 1 along ``axis`` (the k = 0
+    mode vanishes); the result has length n along that axis.
+    """
+    c = np.moveaxis(coeffs, axis, -1)
+    spec = np.zeros(c.shape[:-1] + (n // 2 + 1,), dtype=complex)
+    # irfft(X)[j] = (2/n) sum_k Re(X_k e^{2 pi i k j / n}) for 0 < k < n/2
+    spec[..., 1:c.shape[-1]] = -0.5j * n * c[..., 1:]
+    return np.moveaxis(np.fft.irfft(spec, n=n, axis=-1), -1, axis)
+
+
+def _associator_split_tensors():
+    """Epsilon-split associator tensors.
+
+    The deformed multiplication tensor is affine in epsilon,
+    C(eps) = C0 + eps * D, so the associator tensor
+
+        T_{ij,lm}(eps) = sum_k C_{ijk} C_{klm} - C_{jlk} C_{ikm}
+
+    (with [a, b, c]_m = sum a_i b_j c_l T_{ij,lm}) is quadratic:
+    T(eps) = T0 + eps * T1 + eps^2 * T2.
+
+    Returns
+    -------
+    tuple of three ndarrays, each shape (64, 64) -- rows index the pair
+    (i, j) of the first two factors, columns the pair (l, m) of the third
+    factor and the output component.
+    """
+    C0 = deformed_multiplication_tensor(0.0)
+    D = deformed_multiplication_tensor(1.0) - C0
+
+    def assoc(X, Y):
+        # (ab)c uses X for ab and Y for (ab)c; a(bc) uses X for bc, Y for a(bc)
+        return (np.einsum('ijk,klm->ijlm', X, Y)
+                - np.einsum('jlk,ikm->ijlm', X, Y))
+
+    T0 = assoc(C0, C0)
+    T1 = assoc(C0, D) + assoc(D, C0)
+    T2 = assoc(D, D)
+    return tuple(T.reshape(64, 64) for T in (T0, T1, T2))
+
+
+def _axis_neighbours(phi, ndim, periodic):
+    """Left and right axis-aligned neighbours of every grid point.
+
+    Parameters
+    ----------
+    phi      : ndarray, shape (..., *grid, C) with ``ndim`` grid axes
+    ndim     : int -- number of grid axes (the axes just before the last)
+    periodic : bool -- wrap around the grid; otherwise the off-grid
+               neighbour repeats the edge value (such triples are then
+               replaced by ``_copy_interior_triples``)
+
+    Returns
+    -------
+    (left, right) : ndarrays, shape (ndim,) + phi.shape, with
+    left[a] = phi(x - e_a) and right[a] = phi(x + e_a)
+    """
+    lead = phi.ndim - 1 - ndim
+    pad = [(0, 0)] * lead + [(1, 1)] * ndim + [(0, 0)]
+    ext = np.pad(phi, pad, mode='wrap' if periodic else 'edge')
+    left = np.empty((ndim,) + phi.shape)
+    right = np.empty((ndim,) + phi.shape)
+    for a in range(ndim):
+        idx = [slice(1, -1)] * ndim
+        idx[a] = slice(0, -2)
+        left[a] = ext[(Ellipsis,) + tuple(idx) + (slice(None),)]
+        idx[a] = slice(2, None)
+        right[a] = ext[(Ellipsis,) + tuple(idx) + (slice(None),)]
+    return left, right
+
+
+def _copy_interior_triples(triples, ndim):
+    """Dirichlet boundaries: each boundary triple along axis a takes the
+    value of its interior neighbour along a (in place).
+
+    ``triples`` has shape (ndim, ..., *grid, C).
+    """
+    for a in range(ndim):
+        t = np.moveaxis(triples[a], triples.ndim - 2 - ndim + a, 0)
+        t[0] = t[1]
+        t[-1] = t[-2]
+
+
+class _AssociatorKernel:
+    """Fused nearest-neighbour associator for a fixed epsilon.
+
+    Computes the sum over grid axes a of the axis-aligned triples
+    [phi(x - e_a), phi(x), phi(x + e_a)]_eps for a whole 1D, 2D or 3D
+    grid with one outer product, one (M, 64) x (64, 64) matrix product
+    and one batched contraction over all ndim * (grid points) triples,
+    using the associator tensor assembled once from the epsilon-split
+    tensors.  Work arrays and the output are allocated on first use and
+    reused on every call with the same grid size, so the returned array
+    is overwritten by the next call.  The per-axis triples are kept in
+    ``triples`` (shape (ndim, *grid, 8)) until the next call.
+
+    Parameters
+    ----------
+    epsilon  : float in [0, 1]
+    periodic : bool -- wrap the stencil around the grid instead of copying
+               the nearest interior value to the boundary points
+    ndim     : int -- number of grid axes (1, 2 or 3)
+    """
+
+    def __init__(self, epsilon, periodic=False, ndim=1):
+        self.epsilon = float(epsilon)
+        self.periodic = bool(periodic)
+        self.ndim = int(ndim)
+        T0, T1, T2 = _associator_split_tensors()
+        self.matrix = T0 + self.epsilon * T1 + self.epsilon ** 2 * T2
+        self._shape = None
+
+    def _allocate(self, shape):
+        self._outer = np.empty((self.ndim,) + shape[:-1] + (8, 8))
+        self._mixed = np.empty((self._outer.size // 64, 64))
+        self.triples = np.zeros((self.ndim,) + shape)
+        self.out = np.zeros(shape)
+        self._shape = shape
+
+    def __call__(self, phi):
+        """Associator at every grid point (boundaries copy the nearest
+        interior value), written into the reusable output buffer.
+
+        Parameters
+        ----------
+        phi : ndarray, shape (*grid, 8)
+
+        Returns
+        -------
+        ndarray, shape (*grid, 8)
+        """
+        if phi.shape != self._shape:
+            self._allocate(phi.shape)
+        out = self.out
+        if min(phi.shape[:-1]) < 3 or abs(self.epsilon) < 1e-15:
+            out[:] = 0.0
+            self.triples[:] = 0.0
+            return out
+
+        left, right = _axis_neighbours(phi, self.ndim, self.periodic)
+        np.multiply(left[..., :, None], phi[..., None, :], out=self._outer)
+        np.matmul(self._outer.reshape(-1, 64), self.matrix, out=self._mixed)
+        np.einsum('nl,nlm->nm', right.reshape(-1, 8),
+                  self._mixed.reshape(-1, 8, 8),
+                  out=self.triples.reshape(-1, 8))
+
+        if not self.periodic:
+            _copy_interior_triples(self.triples, self.ndim)
+        np.sum(self.triples, axis=0, out=out)
+        return out
+
+
+class _EnsembleAssociatorKernel:
+    """Batched ``_AssociatorKernel`` with one epsilon per ensemble member.
+
+    The three epsilon-split tensors are stacked into one (192, 64) matrix
+    and each member's outer products are weighted by (1, eps, eps^2)
+    before a single matrix product, so the whole (B, *grid, 8) ensemble
+    is handled by one kernel invocation.  As in ``_AssociatorKernel``,
+    members with epsilon = 0 get no correction.
+
+    Parameters
+    ----------
+    epsilons : array-like, shape (B,)
+    periodic : bool -- as in ``_AssociatorKernel``
+    ndim     : int -- number of grid axes
+    """
+
+    def __init__(self, epsilons, periodic=False, ndim=1):
+        eps = np.asarray(epsilons, dtype=float)
+        self.epsilons = eps
+        self.periodic = bool(periodic)
+        self.ndim = int(ndim)
+        self.matrix = np.concatenate(_associator_split_tensors())
+        active = (np.abs(eps) >= 1e-15).astype(float)
+        self.weights = np.stack([active, active * eps, active * eps ** 2],
+                                axis=1)
+        self._shape = None
+
+    def _allocate(self, shape):
+        d, B = self.ndim, shape[0]
+        M = int(np.prod(shape[1:-1]))
+        self._outer = np.empty((d,) + shape[:-1] + (8, 8))
+        self._scaled = np.empty((d, B, M, 3, 64))
+        self._mixed = np.empty((d, B, M, 64))
+        self.triples = np.zeros((d,) + shape)
+        self.out = np.zeros(shape)
+        self._shape = shape
+
+    def __call__(self, phi):
+        """Associator of every member at every grid point.
+
+        Parameters
+        ----------
+        phi : ndarray, shape (B, *grid, 8)
+
+        Returns
+        -------
+        ndarray, shape (B, *grid, 8) -- reused buffer, as in
+        ``_AssociatorKernel``
+        """
+        if phi.shape != self._shape:
+            self._allocate(phi.shape)
+        out = self.out
+        if min(phi.shape[1:-1]) < 3:
+            out[:] = 0.0
+            self.triples[:] = 0.0
+            return out
+
+        d, B = self.ndim, phi.shape[0]
+        M = self._mixed.shape[2]
+        left, right = _axis_neighbours(phi, d, self.periodic)
+        np.multiply(left[..., :, None], phi[..., None, :], out=self._outer)
+        np.multiply(self._outer.reshape(d, B, M, 1, 64),
+                    self.weights[:, None, :, None], out=self._scaled)
+        np.matmul(self._scaled.reshape(d, B, M, 192), self.matrix,
+                  out=self._mixed)
+        np.einsum('dbnl,dbnlm->dbnm', right.reshape(d, B, M, 8),
+                  self._mixed.reshape(d, B, M, 8, 8),
+                  out=self.triples.reshape(d, B, M, 8))
+
+        if not self.periodic:
+            _copy_interior_triples(self.triples, d)
+        np.sum(self.triples, axis=0, out=out)
+        return out
+
+
+class _MaxwellOperators:
+    """Precompiled 7D curl and non-associative Ampere current.
+
+    The curl (curl F)_k = sum_j c_{0jk} dF_j/dx is one matrix product
+    dF @ ``curl_matrix``.  Only 24 of the 343 entries T[0, j, k, l] of the
+    Fano correction tensor are nonzero; J_assoc gathers dB_j and E_l for
+    those entries with two 0/1 selection matrices (a matrix product is
+    several times faster than ``np.take`` along a length-7 axis), forms
+    the 24 products and scatters them onto k with one (N, 24) x (24, 7)
+    matrix product carrying the coefficients.  Work arrays are
+    allocated on first use and reused for every call with the same field
+    shape, so a returned array is overwritten by the next call of the
+    same method.
+    """
+
+    def __init__(self):
+        c0 = structure_constants()[0]
+        self.curl_matrix = np.where(np.abs(c0) > 1e-15, c0, 0.0)
+        T0 = fano_correction_tensor()[0]
+        T0 = np.where(np.abs(T0) > 1e-15, T0, 0.0)
+        j_idx, k_idx, l_idx = np.nonzero(T0)
+        coeffs = T0[j_idx, k_idx, l_idx]
+        self.gather_j = np.eye(7)[:, j_idx]
+        self.gather_l = np.eye(7)[:, l_idx]
+        self.scatter = np.zeros((coeffs.size, 7))
+        self.scatter[np.arange(coeffs.size), k_idx] = coeffs
+        # dB @ operator_matrix is J_assoc as a linear map of E, flattened
+        self.operator_matrix = T0.reshape(7, 49)
+        self._shape = None
+
+    def _allocate(self, shape):
+        nnz = self.scatter.shape[0]
+        self._curl = np.empty(shape)
+        self._dB = np.empty(shape[:-1] + (nnz,))
+        self._E = np.empty(shape[:-1] + (nnz,))
+        self._J = np.empty(shape)
+        self._shape = shape
+
+    def curl(self, dF):
+        """Curl from the gradient ``dF`` (..., 7)."""
+        if dF.shape != self._shape:
+            self._allocate(dF.shape)
+        return np.matmul(dF, self.curl_matrix, out=self._curl)
+
+    def j_assoc(self, E, dB):
+        """sum_{j,l} T[0,j,k,l] E_l dB_j from E and the gradient ``dB``."""
+        if E.shape != self._shape:
+            self._allocate(E.shape)
+        np.matmul(dB, self.gather_j, out=self._dB)
+        np.matmul(E, self.gather_l, out=self._E)
+        np.multiply(self._dB, self._E, out=self._dB)
+        return np.matmul(self._dB, self.scatter, out=self._J)
+
+    def j_assoc_operator(self, dB):
+        """J_assoc as a linear map of E: M (..., 7, 7) with J = M @ E."""
+        return np.matmul(dB, self.operator_matrix).reshape(
+            dB.shape[:-1] + (7, 7))
 
 
 def _associator_correction(phi, dx, epsilon):
@@ -161,29 +459,363 @@ def _associator_correction(phi, dx, epsilon):
     -------
     ndarray, shape (N, 8) -- the associator at each grid point.
     """
-    N = phi.shape[0]
-    assoc = np.zeros_like(phi)
+    return _AssociatorKernel(epsilon)(np.asarray(phi, dtype=float)).copy()
+
+
+# Field names and component counts of the evolution kinds
+_FIELD_KINDS = {
+    'klein_gordon': (('phi', 'pi'), 8),
+    'maxwell_7d': (('E', 'B'), 7),
+}
 
-    if N < 3 or abs(epsilon) < 1e-15:
-        return assoc
 
-    # Interior points: [phi(i-1), phi(i), phi(i+1)]
-    a = phi[:-2]   # (N-2, 8)
-    b = phi[1:-1]  # (N-2, 8)
-    c = phi[2:]    # (N-2, 8)
+def _yoshida_triple_jump(order):
+    """Substep weights of the symmetric triple-jump composition.
 
-    ab = _deformed_multiply_array(a, b, epsilon)
-    bc = _deformed_multiply_array(b, c, epsilon)
-    ab_c = _deformed_multiply_array(ab, c, epsilon)
-    a_bc = _deformed_multiply_array(a, bc, epsilon)
+    Composing a symmetric method of order 2 with weights (w1, w0, w1),
+    w1 = 1 / (2 - 2^(1/3)), w0 = 1 - 2 w1, gives order 4 (Forest-Ruth /
+    Yoshida 1990).
+    """
+    w1 = 1.0 / (2.0 - 2.0 ** (1.0 / (order + 1)))
+    return (w1, 1.0 - 2.0 * w1, w1)
+
+
+# Symmetric composition schemes: each time step of size dt is a sequence
+# of base (leapfrog / Strang) substeps of size w * dt.  'yoshida6' is
+# Yoshida's 7-stage solution A, cheaper than a nested triple jump (9).
+_YOSHIDA6 = (0.784513610477560, 0.235573213359357, -1.17767998417887)
+_COMPOSITIONS = {
+    'leapfrog': (1.0,),
+    'yoshida4': _yoshida_triple_jump(2),
+    'yoshida6': _YOSHIDA6 + (1.0 - 2.0 * sum(_YOSHIDA6),) + _YOSHIDA6[::-1],
+}
+# 'imex' (Klein-Gordon only) is a single Strang step: half-kicks with the
+# explicit associator force around an implicit linear flow.
+_INTEGRATOR_ORDER = {'leapfrog': 2, 'yoshida4': 4, 'yoshida6': 6, 'imex': 2}
+
+
+def _composition(integrator, kind='klein_gordon'):
+    """Return the substep weights of ``integrator`` (ValueError if unknown)."""
+    if integrator == 'imex':
+        if kind != 'klein_gordon':
+            raise ValueError("The 'imex' integrator is only available for "
+                             "Klein-Gordon evolution")
+        return (1.0,)
+    try:
+        return _COMPOSITIONS[integrator]
+    except KeyError:
+        raise ValueError(f"Unknown integrator: {integrator!r}; expected one "
+                         f"of {sorted(_INTEGRATOR_ORDER)}") from None
+
+
+def _gmres(matvec, b, rtol=1e-10, restart=40, max_restarts=20):
+    """Restarted GMRES for ``matvec(x) = b`` on flat vectors.
+
+    Returns ``(x, iterations)``; stops when ||b - A x|| <= rtol ||b|| or
+    after ``max_restarts`` cycles of ``restart`` Arnoldi steps.
+    """
+    x = np.zeros_like(b)
+    b_norm = np.linalg.norm(b)
+    if b_norm == 0.0:
+        return x, 0
+    iterations = 0
+    for _ in range(max_restarts):
+        r = b - matvec(x)
+        beta = np.linalg.norm(r)
+        if beta <= rtol * b_norm:
+            break
+        V = np.zeros((restart + 1, b.size))
+        H = np.zeros((restart + 1, restart))
+        V[0] = r / beta
+        e1 = np.zeros(restart + 1)
+        e1[0] = beta
+        for j in range(restart):
+            iterations += 1
+            w = matvec(V[j])
+            # Modified Gram-Schmidt
+            for i in range(j + 1):
+                H[i, j] = w @ V[i]
+                w -= H[i, j] * V[i]
+            H[j + 1, j] = np.linalg.norm(w)
+            y = np.linalg.lstsq(H[:j + 2, :j + 1], e1[:j + 2], rcond=None)[0]
+            res = np.linalg.norm(e1[:j + 2] - H[:j + 2, :j + 1] @ y)
+            if res <= rtol * b_norm or H[j + 1, j] == 0.0:
+                break
+            V[j + 1] = w / H[j + 1, j]
+        x = x + y @ V[:j + 1]
+        if res <= rtol * b_norm:
+            break
+    return x, iterations
 
-    assoc[1:-1] = ab_c - a_bc
 
-    # Boundary: use the nearest interior triple
-    assoc[0] = assoc[1]
-    assoc[-1] = assoc[-2]
+# ===================================================================
+# Observers
+# ===================================================================
 
-    return assoc
+class Observer:
+    """Base class for quantities sampled during a simulation run.
+
+    An observer is passed to ``evolve_klein_gordon`` or
+    ``evolve_maxwell_7d`` and is notified after every step; it measures
+    the state on steps that are multiples of its own cadence ``every``,
+    independently of the history stride.  Subclasses implement
+    ``measure``.
+
+    Parameters
+    ----------
+    every : int -- sampling cadence in steps (default 1)
+    name  : str or None -- key of this observer's result in the evolve
+            output and its checkpoint records (default: the class name)
+
+    Attributes
+    ----------
+    name : str -- key of this observer's result in the evolve output
+    """
+
+    name = 'observer'
+
+    def __init__(self, every=1, name=None):
+        self.every = int(every)
+        if name is not None:
+            self.name = name
+        self.steps = []
+        self.times = []
+        self.values = []
+
+    def notify(self, sim, step, time, state):
+        """Record ``measure(sim, state)`` if ``step`` is on the cadence."""
+        if step % self.every == 0:
+            self.steps.append(step)
+            self.times.append(time)
+            self.values.append(self.measure(sim, state))
+
+    def measure(self, sim, state):
+        """Return the observed quantity for one state dict."""
+        raise NotImplementedError
+
+    def result(self):
+        """Return dict with 'steps', 'times' and 'values' arrays."""
+        return {
+            'steps': np.array(self.steps, dtype=int),
+            'times': np.array(self.times, dtype=float),
+            'values': np.array(self.values, dtype=float),
+        }
+
+    def state(self):
+        """Arrays that fully describe the records, saved in checkpoints."""
+        return self.result()
+
+    def restore(self, state):
+        """Reload records from a ``state()`` dict read from a checkpoint."""
+        self.steps = list(state['steps'])
+        self.times = list(state['times'])
+        self.values = list(state['values'])
+
+
+class EnergyObserver(Observer):
+    """Total energy: Klein-Gordon for {'phi', 'pi'} states, EM otherwise."""
+
+    name = 'energy'
+
+    def measure(self, sim, state):
+        if 'phi' in state:
+            return sim._kg_energy(state['phi'], state['pi'])
+        return sim._maxwell_energy(state['E'], state['B'])
+
+
+class CoherenceObserver(Observer):
+    """Coherence charge Q_C of a Klein-Gordon field at a given epsilon.
+
+    Parameters
+    ----------
+    every   : int -- sampling cadence in steps
+    epsilon : float in [0, 1]
+    name    : str or None -- result key (default 'coherence')
+    """
+
+    name = 'coherence'
+
+    def __init__(self, every=1, epsilon=1.0, name=None):
+        super().__init__(every, name)
+        self.epsilon = epsilon
+        self._kernel = None
+
+    def measure(self, sim, state):
+        if self._kernel is None:
+            self._kernel = sim._associator_kernel(self.epsilon)
+        return sim._coherence_charge(state['phi'], self.epsilon, self._kernel)
+
+
+class PoyntingFluxObserver(Observer):
+    """Total 7D Poynting flux sum_x S(x) dx of a Maxwell state, shape (7,)."""
+
+    name = 'poynting_flux'
+
+    def measure(self, sim, state):
+        return np.sum(sim._poynting_field(state['E'], state['B']),
+                      axis=0) * sim.dx
+
+
+class SpectralObserver(Observer):
+    """Streaming spectral diagnostics of a Klein-Gordon run.
+
+    Each sample is transformed to the eigenbasis of the simulator's
+    Laplacian (FFT on periodic grids, sine transform on Dirichlet ones)
+    and folded into running sums, so spectra are available without
+    storing the trajectory:
+
+    - the mode-energy spectrum
+      e_k = (1/2) (|pi_k|^2 + (m^2 + omega_k^2) |phi_k|^2), summed over
+      components and over the modes in each wavenumber shell |k|; its sum
+      is the quadratic (epsilon = 0) energy;
+    - the energy transfer Re(pi_k^* F_k) into each shell by the associator
+      force F = -alpha A_eps[phi].  The linear epsilon = 0 dynamics
+      conserve every mode's energy, so this is the whole transfer between
+      scales, and its sum is the power flowing from the epsilon-dependent
+      associator term into the quadratic energy;
+    - Welch power spectral densities in time of selected components:
+      Hann-windowed, mean-removed segments of ``segment`` samples with
+      50% overlap, averaged over segments and grid points.
+
+    ``values`` holds (quadratic energy, net transfer) per sample.  The
+    Welch segments are kept in a ring buffer of ``segment`` samples.
+
+    Parameters
+    ----------
+    every      : int -- sampling cadence in steps
+    epsilon    : float -- deformation parameter of the run (for the
+                 transfer)
+    components : list of int -- components for the PSD (default [0])
+    segment    : int -- Welch segment length in samples (default 64)
+    name       : str or None -- result key (default 'spectrum')
+    """
+
+    name = 'spectrum'
+
+    def __init__(self, every=1, epsilon=1.0, components=None, segment=64,
+                 name=None):
+        super().__init__(every, name)
+        if segment < 2:
+            raise ValueError("segment must be >= 2")
+        self.epsilon = epsilon
+        self.components = [0] if components is None else list(components)
+        self.segment = int(segment)
+        self._kernel = None
+        self._sums = None
+
+    def _setup(self, sim, shape):
+        grid = shape[:-1]
+        if sim.ndim != len(grid):
+            raise ValueError("SpectralObserver requires a Klein-Gordon state")
+        self._forward, _, symbol = _laplacian_eigenbasis(
+            grid, sim.spacing, sim.boundary, sim.laplacian)
+        self._omega2 = sim.m_squared - symbol[..., 0]
+
+        # Parseval weights: sum_x |f|^2 = sum_k w_k |f_k|^2
+        if sim._periodic:
+            w = np.full(self._omega2.shape, 2.0 / np.prod(grid))
+            w[..., 0] /= 2.0
+            if grid[-1] % 2 == 0:
+                w[..., -1] /= 2.0
+        else:
+            w = np.full(self._omega2.shape,
+                        np.prod([2.0 / (n + 1) for n in grid]))
+        self._weight = 0.5 * sim.dV * w
+
+        ks = _mode_wavenumbers(grid, sim.spacing, sim.boundary)
+        dk = min(k[1] - k[0] if sim._periodic else k[0] for k in ks)
+        kk = np.sqrt(sum(K ** 2 for K in np.meshgrid(*ks, indexing='ij')))
+        self._shell = np.rint(kk / dk).astype(int).ravel()
+        self._wavenumbers = np.arange(self._shell.max() + 1) * dk
+        self._alpha = 0.1 * sim.dx ** 2  # as in evolve_klein_gordon
+        self._window = np.hanning(self.segment + 1)[:-1]
+        self._fs = 1.0 / (self.every * sim.dt)
+        self._kernel = sim._associator_kernel(self.epsilon)
+
+        if self._sums is None:
+            n_bins = len(self._wavenumbers)
+            n_freq = self.segment // 2 + 1
+            self._sums = {
+                'energy_sum': np.zeros(n_bins),
+                'transfer_sum': np.zeros(n_bins),
+                'psd_sum': np.zeros((n_freq, len(self.components))),
+                'counts': np.zeros(3, dtype=int),  # samples, filled, segments
+                'buffer': np.zeros((self.segment,) + grid
+                                   + (len(self.components),)),
+            }
+
+    def _shells(self, per_mode):
+        return np.bincount(self._shell, weights=per_mode.ravel(),
+                           minlength=len(self._wavenumbers))
+
+    def measure(self, sim, state):
+        if 'phi' not in state:
+            raise ValueError("SpectralObserver requires a Klein-Gordon state")
+        phi, pi = state['phi'], state['pi']
+        if self._kernel is None:
+            self._setup(sim, phi.shape)
+        sums = self._sums
+        phi_k = self._forward(phi)
+        pi_k = self._forward(pi)
+        force_k = self._forward(-self._alpha * self._kernel(phi))
+
+        energy = self._weight * (
+            np.sum(np.abs(pi_k) ** 2, axis=-1)
+            + self._omega2 * np.sum(np.abs(phi_k) ** 2, axis=-1))
+        transfer = 2.0 * self._weight * np.sum(
+            (pi_k.conj() * force_k).real, axis=-1)
+        sums['energy_sum'] += self._shells(energy)
+        sums['transfer_sum'] += self._shells(transfer)
+        sums['counts'][0] += 1
+
+        filled = sums['counts'][1]
+        sums['buffer'][filled % self.segment] = phi[..., self.components]
+        sums['counts'][1] += 1
+        hop = self.segment // 2
+        if filled + 1 >= self.segment and (filled + 1 - self.segment) % hop == 0:
+            self._add_segment(np.roll(sums['buffer'], -(filled + 1), axis=0))
+        return np.array([np.sum(energy), np.sum(transfer)])
+
+    def _add_segment(self, seg):
+        """Fold one Welch periodogram (one-sided density) into the sums."""
+        seg = seg - seg.mean(axis=0)
+        w = self._window.reshape((-1,) + (1,) * (seg.ndim - 1))
+        spec = np.abs(np.fft.rfft(w * seg, axis=0)) ** 2
+        spec /= self._fs * np.sum(self._window ** 2)
+        spec[1:(self.segment + 1) // 2] *= 2.0
+        grid_axes = tuple(range(1, seg.ndim - 1))
+        self._sums['psd_sum'] += spec.mean(axis=grid_axes)
+        self._sums['counts'][2] += 1
+
+    def result(self):
+        """Records plus 'wavenumbers', time-averaged 'mode_energy' and
+        'transfer' per shell, and 'frequencies' and 'psd'
+        (n_freq, len(components)), averaged over the Welch segments."""
+        res = super().result()
+        if self._sums is None:
+            return res
+        n_samples, _, n_segments = self._sums['counts']
+        res.update({
+            'wavenumbers': self._wavenumbers,
+            'mode_energy': self._sums['energy_sum'] / max(n_samples, 1),
+            'transfer': self._sums['transfer_sum'] / max(n_samples, 1),
+            'frequencies': np.fft.rfftfreq(self.segment, d=1.0 / self._fs),
+            'psd': self._sums['psd_sum'] / max(n_segments, 1),
+        })
+        return res
+
+    def state(self):
+        res = super().result()
+        if self._sums is not None:
+            res.update(self._sums)
+        return res
+
+    def restore(self, state):
+        super().restore(state)
+        if 'buffer' in state:
+            self._sums = {key: np.array(state[key]) for key in
+                          ('energy_sum', 'transfer_sum', 'psd_sum', 'counts',
+                           'buffer')}
 
 
 # ===================================================================
@@ -191,38 +823,156 @@ def _associator_correction(phi, dx, epsilon):
 # ===================================================================
 
 class OctonionicFieldSimulator:
-    """1D simulation engine for octonionic field dynamics.
+    """1D, 2D and 3D simulation engine for octonionic field dynamics.
 
     Initialise with grid parameters, then call the individual evolution
     methods to produce time-series data as numpy arrays.
 
+    On a 2D or 3D lattice fields have shape (Nx, Ny[, Nz], 8), the
+    Laplacian is the separable sum of the 1D stencils and the associator
+    correction sums the axis-aligned triples
+    [phi(x - e_a), phi(x), phi(x + e_a)] over the axes a.  The 7D Maxwell
+    evolution and the signal-speed test are 1D only.
+
     Parameters
     ----------
-    N  : int
-        Number of spatial grid points (default 64).
+    N  : int or tuple of int
+        Number of spatial grid points (default 64), or the grid shape
+        (Nx, Ny) / (Nx, Ny, Nz) for a 2D / 3D lattice.
     dt : float
         Time step (default 0.01).
-    L  : float
-        Spatial extent of the domain [0, L] (default 10.0).
+    L  : float or tuple of float
+        Spatial extent of the domain [0, L] (default 10.0); a float gives
+        every axis of a 2D/3D lattice the same length.
     m_squared : float
         Mass-squared parameter for Klein-Gordon (default 1.0).
+    boundary : {'dirichlet', 'periodic'}
+        Spatial boundary condition (default 'dirichlet').  With 'periodic'
+        the grid is a ring: derivatives and the associator stencil wrap.
+    laplacian : {'stencil', 'spectral'}
+        Spatial derivative scheme (default 'stencil', second-order finite
+        differences).  'spectral' uses FFT derivatives, exact for every
+        resolved Fourier mode, and requires ``boundary='periodic'``.  The
+        leapfrog step is then stable for dt < 2 dx / pi (without mass).
+    workers : int
+        Number of processes for the Klein-Gordon and Maxwell steppers
+        (default 1).  With more than one the grid is split along its first
+        axis into slabs advanced in parallel, exchanging one halo cell per
+        side through shared memory; results are identical to a
+        single-process run.  Requires the stencil Laplacian and an
+        explicit integrator.
 
     Attributes
     ----------
-    x      : ndarray, shape (N,)   -- spatial grid
-    dx     : float                 -- grid spacing L / N
+    x      : ndarray, shape (N,)   -- spatial grid (first axis on a lattice)
+    dx     : float                 -- grid spacing L / N (smallest spacing
+                                      on a lattice)
+    shape  : tuple of int          -- grid shape
+    ndim   : int                   -- number of spatial dimensions
+    spacing : tuple of float       -- per-axis grid spacings
+    coords : tuple of ndarray      -- per-axis coordinates
+    dV     : float                 -- cell volume (dx in 1D)
     fields : dict                  -- named field arrays, each (N, 8) or (N, 7)
     """
 
-    def __init__(self, N=64, dt=0.01, L=10.0, m_squared=1.0):
-        self.N = N
+    def __init__(self, N=64, dt=0.01, L=10.0, m_squared=1.0,
+                 boundary='dirichlet', laplacian='stencil', workers=1):
+        if boundary not in ('dirichlet', 'periodic'):
+            raise ValueError(f"Unknown boundary: {boundary!r}")
+        if laplacian not in ('stencil', 'spectral'):
+            raise ValueError(f"Unknown laplacian: {laplacian!r}")
+        if laplacian == 'spectral' and boundary != 'periodic':
+            raise ValueError("laplacian='spectral' requires boundary='periodic'")
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if workers > 1 and laplacian == 'spectral':
+            raise ValueError("Domain decomposition requires the stencil "
+                             "Laplacian")
+        shape = tuple(int(n) for n in np.atleast_1d(N))
+        if not 1 <= len(shape) <= 3:
+            raise ValueError("Grids must be 1D, 2D or 3D")
+        lengths = np.broadcast_to(np.asarray(L, dtype=float), (len(shape),))
+        self.shape = shape
+        self.ndim = len(shape)
+        self.N = shape[0] if self.ndim == 1 else shape
+        self.L = L if self.ndim == 1 else tuple(float(l) for l in lengths)
         self.dt = dt
-        self.L = L
-        self.dx = L / N
+        self.spacing = tuple(float(l / n) for l, n in zip(lengths, shape))
+        self.dx = min(self.spacing)
+        self.dV = float(np.prod(self.spacing))
         self.m_squared = m_squared
-        self.x = np.linspace(0, L - self.dx, N)
+        self.boundary = boundary
+        self.laplacian = laplacian
+        self.workers = int(workers)
+        self.coords = tuple(np.linspace(0, l - h, n)
+                            for l, h, n in zip(lengths, self.spacing, shape))
+        self.x = self.coords[0]
         self.fields = {}
 
+    @property
+    def _periodic(self):
+        return self.boundary == 'periodic'
+
+    def _laplacian(self, phi):
+        """Laplacian of ``phi`` (..., *grid, C) with this simulator's scheme."""
+        return _compute_laplacian(phi, self.spacing, self.boundary,
+                                  self.laplacian)
+
+    def _mesh(self):
+        """Coordinate arrays broadcast over the grid, one per axis."""
+        return np.meshgrid(*self.coords, indexing='ij')
+
+    def _require_1d(self, what):
+        if self.ndim != 1:
+            raise ValueError(f"{what} is only implemented on 1D grids")
+
+    def _interior_sum_sq(self, triples):
+        """Sum of squares of per-axis triples (ndim, ..., *grid, 8) over
+        the grid and components, leaving the leading (batch) axes.
+
+        With Dirichlet boundaries the boundary triples along each axis are
+        copies of interior ones and are excluded.
+        """
+        d = self.ndim
+        lead = triples.ndim - 2 - d
+        total = 0.0
+        for a in range(d):
+            t = triples[a]
+            if not self._periodic:
+                idx = [slice(None)] * t.ndim
+                idx[lead + a] = slice(1, -1)
+                t = t[tuple(idx)]
+            total = total + np.sum(t ** 2, axis=tuple(range(lead, t.ndim)))
+        return total
+
+    def _gradient(self, F):
+        """First derivative dF/dx of ``F`` (N, C) along the grid.
+
+        Dirichlet: centred differences with one-sided boundary values.
+        Periodic: wrapped centred differences, or the FFT derivative ik
+        (Nyquist mode dropped) for the spectral scheme.
+        """
+        dx = self.dx
+        if self.laplacian == 'spectral':
+            N = F.shape[0]
+            k = 2.0 * np.pi * np.fft.rfftfreq(N, d=dx)
+            if N % 2 == 0:
+                k[-1] = 0.0
+            return np.fft.irfft(1j * k[:, None] * np.fft.rfft(F, axis=0),
+                                n=N, axis=0)
+        if self._periodic:
+            return (np.roll(F, -1, axis=0) - np.roll(F, 1, axis=0)) / (2 * dx)
+        dF = np.zeros_like(F)
+        dF[1:-1] = (F[2:] - F[:-2]) / (2 * dx)
+        dF[0] = (F[1] - F[0]) / dx
+        dF[-1] = (F[-1] - F[-2]) / dx
+        return dF
+
+    def _associator_kernel(self, epsilon):
+        """``_AssociatorKernel`` matching this simulator's boundary."""
+        return _AssociatorKernel(epsilon, periodic=self._periodic,
+                                 ndim=self.ndim)
+
     # ------------------------------------------------------------------
     # Initial-condition helpers
     # ------------------------------------------------------------------
@@ -235,124 +985,140 @@ class OctonionicFieldSimulator:
         are NOT proportional octonions.  This ensures the associator
         is nonzero and non-associative dynamics are actually triggered.
 
+        On a 2D/3D lattice the pulse is radial and the modulation is the
+        product of the per-axis modulations.
+
         Parameters
         ----------
-        sigma      : float, default L/10
-        center     : float, default L/2
+        sigma      : float, default L/10 (smallest L on a lattice)
+        center     : float or sequence of float, default L/2
         components : list of int, which of the 8 components to excite
                      (default [0, 1] -- real + e1).
 
         Returns
         -------
-        phi0 : ndarray, shape (N, 8)
+        phi0 : ndarray, shape (*grid, 8)
         """
+        lengths = np.broadcast_to(np.asarray(self.L, dtype=float),
+                                  (self.ndim,))
         if sigma is None:
-            sigma = self.L / 10.0
+            sigma = float(np.min(lengths)) / 10.0
         if center is None:
-            center = self.L / 2.0
+            center = lengths / 2.0
+        center = np.broadcast_to(np.asarray(center, dtype=float),
+                                 (self.ndim,))
         if components is None:
             components = [0, 1]
 
-        phi0 = np.zeros((self.N, 8))
+        mesh = self._mesh()
+        phi0 = np.zeros(self.shape + (8,))
         for idx, c in enumerate(components):
             # Shift centre and modulate so each component varies differently
             shift = 0.3 * sigma * idx
             freq = 1.0 + 0.5 * idx
-            envelope = np.exp(
-                -((self.x - center - shift) ** 2) / (2 * sigma ** 2)
-            )
-            modulation = np.cos(freq * np.pi * self.x / self.L)
-            phi0[:, c] = envelope * modulation
+            r2 = sum((X - c0 - shift) ** 2 for X, c0 in zip(mesh, center))
+            envelope = np.exp(-r2 / (2 * sigma ** 2))
+            modulation = np.prod([np.cos(freq * np.pi * X / l)
+                                  for X, l in zip(mesh, lengths)], axis=0)
+            phi0[..., c] = envelope * modulation
         return phi0
 
     def sine_mode(self, mode=1, components=None):
         """Create a standing-wave initial condition sin(mode * pi * x / L).
 
+        On a 2D/3D lattice the mode is the product of the per-axis sines.
+        A sequence of modes gives a batch with one member per mode, built
+        from one outer product of the modes with the grid.
+
         Parameters
         ----------
-        mode       : int, mode number (default 1)
+        mode       : int or sequence of int, mode number (default 1)
         components : list of int, default [0]
 
         Returns
         -------
-        phi0 : ndarray, shape (N, 8)
+        phi0 : ndarray, shape (*grid, 8), or (len(mode), *grid, 8)
         """
         if components is None:
             components = [0]
-        phi0 = np.zeros((self.N, 8))
-        for c in components:
-            phi0[:, c] = np.sin(mode * np.pi * self.x / self.L)
+        lengths = np.broadcast_to(np.asarray(self.L, dtype=float),
+                                  (self.ndim,))
+        modes = np.asarray(mode, dtype=float)
+        wave = np.prod([np.sin(np.multiply.outer(modes * np.pi, X) / l)
+                        for X, l in zip(self._mesh(), lengths)], axis=0)
+        phi0 = np.zeros(wave.shape + (8,))
+        phi0[..., components] = wave[..., None]
         return phi0
 
-    def random_field(self, amplitude=0.1, seed=42):
+    def random_field(self, amplitude=0.1, seed=42, spectrum=None,
+                     batch=None):
         """Create a smoothed random octonionic field.
 
-        The field is generated from random Fourier modes with a k^{-2}
-        power spectrum so that the gradient energy is finite.
+        The field is a sum of random Fourier sine modes
+        sin(2 pi k x / L) with amplitudes damped as k^{-2} so that the
+        gradient energy is finite.  On a 2D/3D lattice the modes are
+        products of per-axis sines damped as |k|^{-2}.  The sum is
+        evaluated by inverse FFT along each axis, O(N log N) per component.
 
         Parameters
         ----------
         amplitude : float
         seed      : int
+        spectrum  : callable or None -- mode amplitude as a function of
+                    |k| (the square root of the power spectrum); default
+                    ``lambda k: k ** -2.0``
+        batch     : int or None -- number of independent fields; member 0
+                    is the field returned without ``batch``
 
         Returns
         -------
-        phi0 : ndarray, shape (N, 8)
+        phi0 : ndarray, shape (*grid, 8), or (batch, *grid, 8)
         """
         rng = np.random.default_rng(seed)
-        phi0 = np.zeros((self.N, 8))
-        for c in range(8):
-            # Random Fourier coefficients with k^{-2} damping
-            modes = rng.standard_normal(self.N // 2)
-            field_c = np.zeros(self.N)
-            for k in range(1, self.N // 2):
-                field_c += modes[k] * np.sin(
-                    2 * np.pi * k * self.x / self.L
-                ) / (k ** 2)
-            phi0[:, c] = amplitude * field_c
-        return phi0
+        n_modes = tuple(n // 2 for n in self.shape)
+        B = 1 if batch is None else int(batch)
+        ks = np.meshgrid(*[np.arange(m) for m in n_modes], indexing='ij')
+        k = np.sqrt(sum(K ** 2 for K in ks))
+        weight = np.zeros(n_modes)
+        if spectrum is None:
+            np.divide(1.0, k ** 2, out=weight, where=k > 0)
+        else:
+            weight[k > 0] = spectrum(k[k > 0])
+
+        # Same draw order as one standard_normal(n_modes) per component
+        coeffs = rng.standard_normal((B, 8) + n_modes) * weight
+        for a, n in enumerate(self.shape):
+            coeffs = _sine_synthesis(coeffs, n, axis=2 + a)
+        phi0 = amplitude * np.moveaxis(coeffs, 1, -1)
+        return phi0[0] if batch is None else phi0
 
     # ==================================================================
     # 1.  Klein-Gordon evolution with associator correction
     # ==================================================================
 
-    def evolve_klein_gordon(self, phi0, pi0=None, steps=200, epsilon=1.0):
-        """Evolve the octonionic Klein-Gordon equation.
-
-        Uses symplectic leapfrog (Stormer-Verlet) time-stepping so that
-        energy is conserved to O(dt^2) with no secular drift.
-
-        The equation of motion is:
-
-            d^2 phi/dt^2 = Lap(phi) - m^2 phi
-                           - epsilon * alpha * [phi(x-dx), phi(x), phi(x+dx)]
-
-        where alpha is a coupling constant chosen so that the associator
-        correction is perturbative (alpha = 0.01 * dx^2).
+    def _kg_steps(self, phi0, pi0, steps, epsilon, start=0,
+                  integrator='leapfrog', exchange=None):
+        """Leapfrog (composed leapfrog, or IMEX) Klein-Gordon stepper.
 
-        Parameters
-        ----------
-        phi0    : ndarray, shape (N, 8) -- initial field
-        pi0     : ndarray, shape (N, 8) or None (zero momentum)
-        steps   : int -- number of time steps
-        epsilon : float in [0, 1] -- deformation parameter.
-                  0 = associative (quaternionic) limit.
-                  1 = full octonionic dynamics.
+        Yields ``(n, phi, pi)`` for n = start, ..., steps, where
+        (phi0, pi0) is the state at step ``start``.  The yielded arrays
+        are fresh each step and are not modified afterwards.
 
-        Returns
-        -------
-        dict with keys:
-            'phi_history'    : ndarray, shape (steps+1, N, 8)
-            'pi_history'     : ndarray, shape (steps+1, N, 8)
-            'energy_history' : ndarray, shape (steps+1,)
-            'times'          : ndarray, shape (steps+1,)
-            'epsilon'        : float
+        ``exchange`` is called on phi before every force evaluation after
+        the first; a domain-decomposition worker uses it to refresh the
+        halo cells of its slab.  With ``workers > 1`` and no ``exchange``
+        the run is handed to ``domain_decomposition.decomposed_steps``.
         """
+        weights = _composition(integrator)
         phi = np.array(phi0, dtype=float)
         if pi0 is None:
             pi = np.zeros_like(phi)
         else:
             pi = np.array(pi0, dtype=float)
+        if exchange is None and self.workers > 1:
+            yield from decomposed_steps(self, 'klein_gordon', phi, pi, steps,
+                                        epsilon, start, integrator)
+            return
 
         dt = self.dt
         dx = self.dx
@@ -363,70 +1129,247 @@ class OctonionicFieldSimulator:
         # factors, the Laplacian has 1/dx^2, so alpha ~ dx^2 keeps the ratio
         # of associator to Laplacian terms resolution-independent).
         alpha = 0.1 * dx ** 2
+        kernel = self._associator_kernel(epsilon)
 
-        # Preallocate history arrays for speed
-        phi_hist = np.empty((steps + 1, self.N, 8))
-        pi_hist = np.empty((steps + 1, self.N, 8))
-        energy_hist = np.empty(steps + 1)
-
-        phi_hist[0] = phi
-        pi_hist[0] = pi
-        energy_hist[0] = self._kg_energy(phi, pi)
-
-        for n in range(steps):
+        def force_of(phi):
             # Force F(phi) = Lap(phi) - m^2 phi - alpha * A[phi]
-            force = (
-                _compute_laplacian(phi, dx)
+            return (
+                self._laplacian(phi)
                 - m2 * phi
-                - alpha * _associator_correction(phi, dx, epsilon)
+                - alpha * kernel(phi)
             )
 
-            # Leapfrog: half-kick, drift, half-kick
-            pi_half = pi + 0.5 * dt * force
-            phi_new = phi + dt * pi_half
+        yield start, phi, pi
+
+        if integrator == 'imex':
+            # Strang splitting: explicit half-kicks with the associator
+            # force around the implicit flow of Lap(phi) - m^2 phi.
+            linear_step = _ImplicitLinearStep(phi.shape[:-1], self.spacing,
+                                              dt, m2, self.boundary,
+                                              self.laplacian)
+            force = -alpha * kernel(phi)
+            for n in range(start, steps):
+                pi = pi + 0.5 * dt * force
+                phi, pi = linear_step(phi, pi)
+                force = -alpha * kernel(phi)
+                pi = pi + 0.5 * dt * force
+                yield n + 1, phi, pi
+            return
+
+        # The end-of-substep force is the next substep's start force, so
+        # each substep costs a single force evaluation.
+        force = force_of(phi)
+        for n in range(start, steps):
+            for w in weights:
+                # Leapfrog: half-kick, drift, half-kick
+                h = w * dt
+                pi_half = pi + 0.5 * h * force
+                phi = phi + h * pi_half
+                if exchange is not None:
+                    exchange(phi)
+                force = force_of(phi)
+                pi = pi_half + 0.5 * h * force
+            yield n + 1, phi, pi
+
+    def iter_klein_gordon(self, phi0, pi0=None, steps=200, epsilon=1.0,
+                          every=1, integrator='leapfrog'):
+        """Generator form of ``evolve_klein_gordon``.
+
+        Yields snapshots as they are produced instead of storing a
+        history, so memory stays proportional to one state however long
+        the run.
 
-            force_new = (
-                _compute_laplacian(phi_new, dx)
-                - m2 * phi_new
-                - alpha * _associator_correction(phi_new, dx, epsilon)
-            )
-            pi_new = pi_half + 0.5 * dt * force_new
+        Parameters
+        ----------
+        phi0, pi0, steps, epsilon, integrator : as in ``evolve_klein_gordon``
+        every   : int -- yield every ``every``-th step (step 0 included)
 
-            phi = phi_new
-            pi = pi_new
+        Yields
+        ------
+        (step, time, phi, pi) : int, float, ndarray (N, 8), ndarray (N, 8)
+        """
+        for n, phi, pi in self._kg_steps(phi0, pi0, steps, epsilon,
+                                         integrator=integrator):
+            if n % every == 0:
+                yield n, n * self.dt, phi, pi
+
+    def evolve_klein_gordon(self, phi0, pi0=None, steps=200, epsilon=1.0,
+                            record_every=1, observers=None, callback=None,
+                            writer=None, store_history=True, checkpoint=None,
+                            integrator='leapfrog'):
+        """Evolve the octonionic Klein-Gordon equation.
 
-            phi_hist[n + 1] = phi
-            pi_hist[n + 1] = pi
-            energy_hist[n + 1] = self._kg_energy(phi, pi)
+        Uses symplectic leapfrog (Stormer-Verlet) time-stepping so that
+        energy is conserved to O(dt^2) with no secular drift.  The
+        ``integrator`` option composes leapfrog substeps into a 4th order
+        ('yoshida4', 3 force evaluations per step) or 6th order
+        ('yoshida6', 7 per step) symmetric symplectic method, which reaches
+        a given energy error with a much larger dt.
+
+        All of these are explicit, so dt must stay below about dx.
+        ``integrator='imex'`` treats Lap(phi) - m^2 phi implicitly
+        (Crank-Nicolson, solved by FFT or sine transform) and only the
+        associator term explicitly; it is stable for any dt, so fine grids
+        can use a time step set by the dynamics instead of by dx.
 
-        times = np.arange(steps + 1) * dt
+        The equation of motion is:
 
-        return {
-            'phi_history': phi_hist,
-            'pi_history': pi_hist,
-            'energy_history': energy_hist,
-            'times': times,
-            'epsilon': epsilon,
-        }
+            d^2 phi/dt^2 = Lap(phi) - m^2 phi
+                           - epsilon * alpha * [phi(x-dx), phi(x), phi(x+dx)]
+
+        where alpha is a coupling constant chosen so that the associator
+        correction is perturbative (alpha = 0.01 * dx^2).
+
+        Histories are kept only every ``record_every`` steps; observers
+        see every step and sample it at their own cadence.
+
+        Parameters
+        ----------
+        phi0    : ndarray, shape (N, 8) -- initial field
+        pi0     : ndarray, shape (N, 8) or None (zero momentum)
+        steps   : int -- number of time steps
+        epsilon : float in [0, 1] -- deformation parameter.
+                  0 = associative (quaternionic) limit.
+                  1 = full octonionic dynamics.
+        record_every : int -- history stride (steps 0, k, 2k, ... are kept)
+        observers : list of ``Observer`` or None, with distinct names
+        callback  : callable(step, time, state) or None, called at every
+                    recorded step with state = {'phi': ..., 'pi': ...}
+        writer    : ``trajectory_io.TrajectoryWriter`` or None -- recorded
+                    steps are appended to it (fields 'phi' and 'pi')
+        store_history : bool -- keep field histories in memory; with
+                    False they are None and memory stays at one state
+        checkpoint : ``checkpoint.Checkpointer`` or None -- periodically
+                    snapshot the full run state; continue with ``resume``
+        integrator : 'leapfrog', 'yoshida4', 'yoshida6' or 'imex'
+
+        Returns
+        -------
+        dict with keys:
+            'phi_history'    : ndarray, shape (R, N, 8), R = steps // record_every + 1
+                               (None when store_history is False)
+            'pi_history'     : ndarray, shape (R, N, 8) (or None)
+            'energy_history' : ndarray, shape (R,)
+            'times'          : ndarray, shape (R,)
+            'epsilon'        : float
+            'observers'      : dict mapping observer name -> observer result
+        """
+        return self._run('klein_gordon', phi0, pi0, steps, epsilon,
+                         record_every, observers, callback, writer,
+                         store_history, checkpoint, integrator=integrator)
 
     def _kg_energy(self, phi, pi):
         """Discrete Klein-Gordon energy (matches the leapfrog Hamiltonian).
 
-        E = (1/2) sum [ |pi|^2 - phi . Lap(phi) + m^2 |phi|^2 ] * dx
+        E = (1/2) sum [ |pi|^2 - phi . Lap(phi) + m^2 |phi|^2 ] * dV
         """
-        dx = self.dx
+        dV = self.dV
         m2 = self.m_squared
-        lap = _compute_laplacian(phi, dx)
-        kinetic = np.sum(pi ** 2) * dx
-        gradient = -np.sum(phi * lap) * dx
-        mass = m2 * np.sum(phi ** 2) * dx
+        lap = self._laplacian(phi)
+        kinetic = np.sum(pi ** 2) * dV
+        gradient = -np.sum(phi * lap) * dV
+        mass = m2 * np.sum(phi ** 2) * dV
         return 0.5 * (kinetic + gradient + mass)
 
     # ==================================================================
     # 2.  7D Maxwell evolution
     # ==================================================================
 
-    def evolve_maxwell_7d(self, E0, B0, steps=200, epsilon=1.0):
+    def _maxwell_steps(self, E0, B0, steps, epsilon, start=0,
+                       integrator='leapfrog', exchange=None):
+        """Strang-split (or composed Strang) 7D Maxwell stepper.
+
+        Yields ``(n, E, B)`` for n = start, ..., steps, where (E0, B0) is
+        the state at step ``start``.  The yielded arrays are fresh each
+        step and are not modified afterwards.
+
+        The plain Strang step treats J_assoc explicitly, which breaks its
+        time symmetry when epsilon > 0.  Composition only raises the order
+        of a symmetric step, so the composed integrators take the E
+        substep by the implicit midpoint rule instead; J_assoc is linear
+        in E at fixed B, so that is one 7x7 solve per grid point.
+
+        ``exchange`` is called on E or B before each curl of an updated
+        field, as in ``_kg_steps``.
+        """
+        weights = _composition(integrator, 'maxwell_7d')
+        ops = _MaxwellOperators()
+        dt = self.dt
+        alpha = 0.01  # associator coupling
+
+        E = np.array(E0, dtype=float)
+        B = np.array(B0, dtype=float)
+        if exchange is None and self.workers > 1:
+            yield from decomposed_steps(self, 'maxwell_7d', E, B, steps,
+                                        epsilon, start, integrator)
+            return
+        if exchange is None:
+            def exchange(F):
+                pass
+        yield start, E, B
+
+        if integrator == 'leapfrog':
+            for n in range(start, steps):
+                # --- half-step B ---
+                curl_E = self._curl_7d(E, ops)
+                B = B - 0.5 * dt * curl_E
+                exchange(B)
+
+                # --- full-step E ---
+                curl_B = self._curl_7d(B, ops)
+                J_assoc = self._j_assoc(E, B, epsilon, ops)
+                E = E + dt * (curl_B - epsilon * alpha * J_assoc)
+                exchange(E)
+
+                # --- half-step B ---
+                curl_E = self._curl_7d(E, ops)
+                B = B - 0.5 * dt * curl_E
+                yield n + 1, E, B
+            return
+
+        eye = np.eye(7)
+        # As in the Strang step, the end-of-substep curl E is reused
+        curl_E = self._curl_7d(E, ops)
+        for n in range(start, steps):
+            for w in weights:
+                h = w * dt
+                B = B - 0.5 * h * curl_E
+                exchange(B)
+
+                # E' = E + h (curl B - c M E_mid),  E_mid = (E + E') / 2
+                curl_B = self._curl_7d(B, ops)
+                M = (0.5 * h * epsilon * alpha) * self._j_assoc_operator(
+                    B, epsilon, ops)
+                rhs = E - np.einsum('nkl,nl->nk', M, E) + h * curl_B
+                E = np.linalg.solve(eye + M, rhs[..., None])[..., 0]
+                exchange(E)
+
+                curl_E = self._curl_7d(E, ops)
+                B = B - 0.5 * h * curl_E
+            yield n + 1, E, B
+
+    def iter_maxwell_7d(self, E0, B0, steps=200, epsilon=1.0, every=1,
+                        integrator='leapfrog'):
+        """Generator form of ``evolve_maxwell_7d``.
+
+        Parameters
+        ----------
+        E0, B0, steps, epsilon, integrator : as in ``evolve_maxwell_7d``
+        every   : int -- yield every ``every``-th step (step 0 included)
+
+        Yields
+        ------
+        (step, time, E, B) : int, float, ndarray (N, 7), ndarray (N, 7)
+        """
+        for n, E, B in self._maxwell_steps(E0, B0, steps, epsilon,
+                                           integrator=integrator):
+            if n % every == 0:
+                yield n, n * self.dt, E, B
+
+    def evolve_maxwell_7d(self, E0, B0, steps=200, epsilon=1.0,
+                          record_every=1, observers=None, callback=None,
+                          writer=None, store_history=True, checkpoint=None,
+                          integrator='leapfrog'):
         """Evolve 7D Maxwell equations with non-associative corrections.
 
         The first-order system is:
@@ -439,105 +1382,70 @@ class OctonionicFieldSimulator:
 
         A symplectic splitting is used: advance B by half a step using
         the curl of E, then advance E by a full step using the curl of B,
-        then advance B by another half step.
+        then advance B by another half step.  ``integrator='yoshida4'``
+        or ``'yoshida6'`` composes time-symmetric splitting steps into a
+        4th or 6th order method.
 
         Parameters
         ----------
         E0, B0  : ndarray, shape (N, 7) -- initial electric and magnetic fields
         steps   : int
         epsilon : float in [0, 1]
+        record_every : int -- history stride (steps 0, k, 2k, ... are kept)
+        observers : list of ``Observer`` or None, with distinct names
+        callback  : callable(step, time, state) or None, called at every
+                    recorded step with state = {'E': ..., 'B': ...}
+        writer    : ``trajectory_io.TrajectoryWriter`` or None -- recorded
+                    steps are appended to it (fields 'E' and 'B')
+        store_history : bool -- keep field and Poynting histories in
+                    memory; with False they are None
+        checkpoint : ``checkpoint.Checkpointer`` or None -- periodically
+                    snapshot the full run state; continue with ``resume``
+        integrator : 'leapfrog', 'yoshida4' or 'yoshida6' -- the composed
+                    integrators take the E substep by the implicit
+                    midpoint rule so that the splitting step stays
+                    time-symmetric for epsilon > 0
 
         Returns
         -------
         dict with keys:
-            'E_history'       : ndarray, shape (steps+1, N, 7)
-            'B_history'       : ndarray, shape (steps+1, N, 7)
-            'energy_history'  : ndarray, shape (steps+1,)
-            'poynting_history': ndarray, shape (steps+1, N, 7)
-            'times'           : ndarray, shape (steps+1,)
+            'E_history'       : ndarray, shape (R, N, 7), R = steps // record_every + 1
+                                (None when store_history is False)
+            'B_history'       : ndarray, shape (R, N, 7) (or None)
+            'energy_history'  : ndarray, shape (R,)
+            'poynting_history': ndarray, shape (R, N, 7) (or None)
+            'times'           : ndarray, shape (R,)
             'epsilon'         : float
+            'observers'       : dict mapping observer name -> observer result
         """
-        eps_tensor = structure_constants()
-        T = fano_correction_tensor()
-        dt = self.dt
-        dx = self.dx
-        alpha = 0.01  # associator coupling
-
-        E = np.array(E0, dtype=float)
-        B = np.array(B0, dtype=float)
-
-        E_hist = np.empty((steps + 1, self.N, 7))
-        B_hist = np.empty((steps + 1, self.N, 7))
-        en_hist = np.empty(steps + 1)
-        poynt_hist = np.empty((steps + 1, self.N, 7))
-
-        E_hist[0] = E
-        B_hist[0] = B
-        en_hist[0] = self._maxwell_energy(E, B)
-        poynt_hist[0] = self._poynting_field(E, B)
-
-        for n in range(steps):
-            # --- half-step B ---
-            curl_E = self._curl_7d(E, eps_tensor)
-            B = B - 0.5 * dt * curl_E
-
-            # --- full-step E ---
-            curl_B = self._curl_7d(B, eps_tensor)
-            J_assoc = self._j_assoc(E, B, T, epsilon)
-            E = E + dt * (curl_B - epsilon * alpha * J_assoc)
+        return self._run('maxwell_7d', E0, B0, steps, epsilon,
+                         record_every, observers, callback, writer,
+                         store_history, checkpoint, integrator=integrator)
 
-            # --- half-step B ---
-            curl_E = self._curl_7d(E, eps_tensor)
-            B = B - 0.5 * dt * curl_E
+    def _curl_7d(self, F, ops=None):
+        """Discrete 1D 7D curl.  (curl F)_k = sum_j c_{0jk} dF_j/dx.
 
-            E_hist[n + 1] = E
-            B_hist[n + 1] = B
-            en_hist[n + 1] = self._maxwell_energy(E, B)
-            poynt_hist[n + 1] = self._poynting_field(E, B)
-
-        times = np.arange(steps + 1) * dt
-
-        return {
-            'E_history': E_hist,
-            'B_history': B_hist,
-            'energy_history': en_hist,
-            'poynting_history': poynt_hist,
-            'times': times,
-            'epsilon': epsilon,
-        }
-
-    def _curl_7d(self, F, eps_tensor):
-        """Discrete 1D 7D curl.  (curl F)_k = sum_j c_{0jk} dF_j/dx."""
-        dF = np.zeros_like(F)
-        dF[1:-1] = (F[2:] - F[:-2]) / (2 * self.dx)
-        dF[0] = (F[1] - F[0]) / self.dx
-        dF[-1] = (F[-1] - F[-2]) / self.dx
-        curl = np.zeros_like(F)
-        for k in range(7):
-            for j in range(7):
-                c = eps_tensor[0, j, k]
-                if abs(c) > 1e-15:
-                    curl[:, k] += c * dF[:, j]
-        return curl
+        ``ops`` is an optional ``_MaxwellOperators`` reused across steps;
+        its result buffer is then overwritten by the next curl.
+        """
+        if ops is None:
+            ops = _MaxwellOperators()
+        return ops.curl(self._gradient(F))
 
-    def _j_assoc(self, E, B, T, epsilon):
+    def _j_assoc(self, E, B, epsilon, ops=None):
         """Non-associative Ampere current from the Fano correction tensor.
 
         J_assoc_k = sum_{j,l} T[0,j,k,l] * E[:,l] * dB[:,j] / dx
         """
-        dB = np.zeros_like(B)
-        dB[1:-1] = (B[2:] - B[:-2]) / (2 * self.dx)
-        dB[0] = (B[1] - B[0]) / self.dx
-        dB[-1] = (B[-1] - B[-2]) / self.dx
+        if ops is None:
+            ops = _MaxwellOperators()
+        return epsilon * ops.j_assoc(E, self._gradient(B))
 
-        J = np.zeros_like(E)
-        for k in range(7):
-            for j in range(7):
-                for l in range(7):
-                    c = T[0, j, k, l]
-                    if abs(c) > 1e-15:
-                        J[:, k] += c * E[:, l] * dB[:, j]
-        return epsilon * J
+    def _j_assoc_operator(self, B, epsilon, ops=None):
+        """J_assoc as a linear map of E: returns M (N, 7, 7), J = M @ E."""
+        if ops is None:
+            ops = _MaxwellOperators()
+        return epsilon * ops.j_assoc_operator(self._gradient(B))
 
     def _maxwell_energy(self, E, B):
         """EM energy: U = (1/2) int (|E|^2 + |B|^2) dx."""
@@ -562,6 +1470,118 @@ class OctonionicFieldSimulator:
                     S[:, k] += E[:, kk] * B[:, i] - E[:, i] * B[:, kk]
         return S
 
+    # ------------------------------------------------------------------
+    # Shared recording loop
+    # ------------------------------------------------------------------
+
+    def _run(self, kind, first0, second0, steps, epsilon, record_every,
+             observers, callback, writer, store_history, checkpoint,
+             restored=None, integrator='leapfrog'):
+        """Drive a stepper, recording histories, observers and checkpoints.
+
+        ``kind`` selects the equations ('klein_gordon' or 'maxwell_7d').
+        ``restored`` is the (arrays, meta) pair of a checkpoint to continue
+        from; the run then starts at the checkpointed step with its
+        histories and observer records already filled in.
+        """
+        _composition(integrator, kind)
+        if kind == 'maxwell_7d':
+            self._require_1d("7D Maxwell evolution")
+        names, n_comp = _FIELD_KINDS[kind]
+        if kind == 'klein_gordon':
+            stepper, energy = self._kg_steps, self._kg_energy
+            hist_names = names
+        else:
+            stepper, energy = self._maxwell_steps, self._maxwell_energy
+            hist_names = names + ('poynting',)
+
+        n_rec = steps // record_every + 1
+        grid = np.shape(first0)[:-1]
+        observers = list(observers) if observers is not None else []
+        obs_names = [obs.name for obs in observers]
+        duplicates = sorted({n for n in obs_names if obs_names.count(n) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate observer names {duplicates}; "
+                             "pass name= to tell them apart")
+
+        # Preallocate history arrays for speed
+        hist = {}
+        if store_history:
+            hist = {h: np.empty((n_rec,) + grid + (n_comp,))
+                    for h in hist_names}
+        energy_hist = np.empty(n_rec)
+
+        start = 0
+        if restored is not None:
+            arrays, meta = restored
+            start = meta['step']
+            r = start // record_every + 1
+            energy_hist[:r] = arrays['energy_history']
+            for h in hist:
+                hist[h][:r] = arrays[h + '_history']
+            for obs in observers:
+                prefix = obs.name + '/'
+                if prefix + 'steps' in arrays:
+                    obs.restore({key[len(prefix):]: val
+                                 for key, val in arrays.items()
+                                 if key.startswith(prefix)})
+            if writer is not None:
+                writer.rewind(meta['writer_frames'])
+            first0, second0 = arrays[names[0]], arrays[names[1]]
+
+        for n, a, b in stepper(first0, second0, steps, epsilon, start=start,
+                               integrator=integrator):
+            if restored is not None and n == start:
+                continue  # recorded before the checkpoint was taken
+            t = n * self.dt
+            state = {names[0]: a, names[1]: b}
+            for obs in observers:
+                obs.notify(self, n, t, state)
+            if n % record_every == 0:
+                r = n // record_every
+                if store_history:
+                    hist[names[0]][r] = a
+                    hist[names[1]][r] = b
+                    if 'poynting' in hist:
+                        hist['poynting'][r] = self._poynting_field(a, b)
+                energy_hist[r] = energy(a, b)
+                if writer is not None:
+                    writer.append(n, t, **state)
+                if callback is not None:
+                    callback(n, t, state)
+            if checkpoint is not None and checkpoint.due(n):
+                r = n // record_every + 1
+                arrays = {names[0]: a, names[1]: b,
+                          'energy_history': energy_hist[:r]}
+                for h in hist:
+                    arrays[h + '_history'] = hist[h][:r]
+                for obs in observers:
+                    for key, val in obs.state().items():
+                        arrays[obs.name + '/' + key] = val
+                if writer is not None:
+                    writer.flush()
+                checkpoint.save(n, arrays, {
+                    'kind': kind, 'step': n, 'steps': steps,
+                    'epsilon': float(epsilon), 'record_every': record_every,
+                    'integrator': integrator,
+                    'store_history': bool(store_history),
+                    'N': self.N, 'dt': self.dt, 'L': self.L,
+                    'm_squared': self.m_squared,
+                    'boundary': self.boundary, 'laplacian': self.laplacian,
+                    'workers': self.workers,
+                    'writer_frames': writer.n_frames if writer is not None else 0,
+                    'checkpoint': checkpoint.settings(),
+                })
+
+        result = {h + '_history': hist.get(h) for h in hist_names}
+        result.update({
+            'energy_history': energy_hist,
+            'times': np.arange(n_rec) * record_every * self.dt,
+            'epsilon': epsilon,
+            'observers': {obs.name: obs.result() for obs in observers},
+        })
+        return result
+
     # ==================================================================
     # 3.  Coherence evolution
     # ==================================================================
@@ -593,13 +1613,14 @@ class OctonionicFieldSimulator:
             'max_drift'    : float  -- max |Q_C(t) - Q_C(0)|
             'relative_drift': float -- max_drift / Q_C(0) if Q_C(0) > 0
         """
-        result = self.evolve_klein_gordon(phi0, pi0, steps, epsilon)
-        phi_hist = result['phi_history']
-        times = result['times']
-
-        qc = np.empty(steps + 1)
-        for n in range(steps + 1):
-            qc[n] = self._coherence_charge(phi_hist[n], epsilon)
+        # Q_C is sampled every step by an observer; no field history is kept.
+        observer = CoherenceObserver(epsilon=epsilon)
+        self.evolve_klein_gordon(phi0, pi0, steps, epsilon,
+                                 record_every=max(steps, 1),
+                                 observers=[observer], store_history=False)
+        tracked = observer.result()
+        qc = tracked['values']
+        times = tracked['times']
 
         q0 = qc[0]
         max_drift = float(np.max(np.abs(qc - q0)))
@@ -614,23 +1635,22 @@ class OctonionicFieldSimulator:
             'relative_drift': rel_drift,
         }
 
-    def _coherence_charge(self, phi, epsilon):
-        """Compute Q_C = sum_i |[phi_i, phi_{i+1}, phi_{i+2}]_eps|^2."""
-        N = phi.shape[0]
-        if N < 3:
-            return 0.0
-
-        a = phi[:-2]
-        b = phi[1:-1]
-        c = phi[2:]
+    def _coherence_charge(self, phi, epsilon, kernel=None):
+        """Compute Q_C = sum_i |[phi_i, phi_{i+1}, phi_{i+2}]_eps|^2.
 
-        ab = _deformed_multiply_array(a, b, epsilon)
-        bc = _deformed_multiply_array(b, c, epsilon)
-        ab_c = _deformed_multiply_array(ab, c, epsilon)
-        a_bc = _deformed_multiply_array(a, bc, epsilon)
+        The sum runs over the N-2 interior triples, or over all N wrapped
+        triples with periodic boundaries.  On a 2D/3D lattice it runs over
+        the axis-aligned triples along every axis.  ``kernel`` is an
+        optional ``_AssociatorKernel`` for ``epsilon``, reused across calls
+        when tracking Q_C along a trajectory.
+        """
+        if min(phi.shape[:-1]) < 3:
+            return 0.0
 
-        assoc = ab_c - a_bc  # (N-2, 8)
-        return float(np.sum(assoc ** 2))
+        if kernel is None:
+            kernel = self._associator_kernel(epsilon)
+        kernel(phi)
+        return float(self._interior_sum_sq(kernel.triples))
 
     # ==================================================================
     # 4.  Associative-limit comparison
@@ -657,18 +1677,31 @@ class OctonionicFieldSimulator:
             'delta'       : ndarray, shape (steps+1,)  -- relative L2 diff
             'times'       : ndarray, shape (steps+1,)
         """
-        oct_res = self.evolve_klein_gordon(phi0, pi0, steps, epsilon=1.0)
-        quat_res = self.evolve_klein_gordon(phi0, pi0, steps, epsilon=0.0)
+        # Both limits evolve together as a two-member ensemble
+        ens = self.evolve_klein_gordon_ensemble(phi0, pi0, steps,
+                                                epsilon=[1.0, 0.0])
+        oct_res, quat_res = [
+            {
+                'phi_history': ens['phi_history'][:, b],
+                'pi_history': ens['pi_history'][:, b],
+                'energy_history': ens['energy_history'][:, b],
+                'times': ens['times'],
+                'epsilon': float(ens['epsilon'][b]),
+                'observers': {},
+            }
+            for b in range(2)
+        ]
 
         phi_oct = oct_res['phi_history']
         phi_quat = quat_res['phi_history']
 
+        field_axes = tuple(range(1, phi_quat.ndim))
         norms_quat = np.sqrt(
-            np.sum(phi_quat ** 2, axis=(1, 2))
+            np.sum(phi_quat ** 2, axis=field_axes)
         )  # (steps+1,)
         norms_quat = np.maximum(norms_quat, 1e-30)
 
-        diff = np.sqrt(np.sum((phi_oct - phi_quat) ** 2, axis=(1, 2)))
+        diff = np.sqrt(np.sum((phi_oct - phi_quat) ** 2, axis=field_axes))
         delta = diff / norms_quat
 
         return {
@@ -701,6 +1734,7 @@ class OctonionicFieldSimulator:
             'expected_speed' : float  (always 1.0)
             'causal'         : bool   (measured_speed <= 1.0 + tol)
         """
+        self._require_1d("The signal-speed test")
         old_m2 = self.m_squared
         self.m_squared = 0.0  # massless for clean speed measurement
 
@@ -753,32 +1787,399 @@ class OctonionicFieldSimulator:
         }
 
 
+    # ==================================================================
+    # 6.  Ensemble Klein-Gordon evolution
+    # ==================================================================
+
+    def evolve_klein_gordon_ensemble(self, phi0, pi0=None, steps=200,
+                                     epsilon=1.0, m_squared=None,
+                                     record_every=1, store_history=True,
+                                     integrator='leapfrog'):
+        """Evolve a batch of Klein-Gordon runs in lockstep.
+
+        Member b follows ``evolve_klein_gordon`` with its own epsilon and
+        mass; all members share one Laplacian and one associator-kernel
+        invocation per step on the stacked (B, N, 8) state.  The
+        Laplacian and associator of the current field are also reused for
+        the energy and coherence charge, so recording adds no extra field
+        operations.
+
+        Parameters
+        ----------
+        phi0      : ndarray, shape (B, *grid, 8), or (*grid, 8) shared by
+                    all members
+        pi0       : ndarray, same shapes as phi0, or None (zero momentum)
+        steps     : int
+        epsilon   : float or array-like of shape (B,)
+        m_squared : float, array-like of shape (B,), or None (self.m_squared)
+        record_every : int -- history stride
+        store_history : bool -- keep field histories in memory
+        integrator : as in ``evolve_klein_gordon``
+
+        Returns
+        -------
+        dict with keys:
+            'phi_history'       : ndarray (R, B, *grid, 8), or None
+            'pi_history'        : ndarray (R, B, *grid, 8), or None
+            'energy_history'    : ndarray (R, B)
+            'coherence_history' : ndarray (R, B) -- Q_C of each member
+            'times'             : ndarray (R,)
+            'epsilon'           : ndarray (B,)
+            'm_squared'         : ndarray (B,)
+        """
+        weights = _composition(integrator)
+        if m_squared is None:
+            m_squared = self.m_squared
+        phi0 = np.asarray(phi0, dtype=float)
+        d = self.ndim
+        B = max(np.size(epsilon), np.size(m_squared),
+                phi0.shape[0] if phi0.ndim == d + 2 else 1)
+        eps = np.broadcast_to(np.asarray(epsilon, dtype=float), (B,)).copy()
+        m2 = np.broadcast_to(np.asarray(m_squared, dtype=float), (B,)).copy()
+        phi = np.array(np.broadcast_to(phi0, (B,) + phi0.shape[-d - 1:]))
+        if pi0 is None:
+            pi = np.zeros_like(phi)
+        else:
+            pi = np.array(np.broadcast_to(np.asarray(pi0, dtype=float),
+                                          phi.shape))
+
+        dt = self.dt
+        dx = self.dx
+        dV = self.dV
+        alpha = 0.1 * dx ** 2  # as in evolve_klein_gordon
+        kernel = _EnsembleAssociatorKernel(eps, periodic=self._periodic,
+                                           ndim=d)
+        m2_col = m2.reshape((B,) + (1,) * (d + 1))
+        member_axes = tuple(range(1, d + 2))
+
+        n_rec = steps // record_every + 1
+        phi_hist = pi_hist = None
+        if store_history:
+            phi_hist = np.empty((n_rec,) + phi.shape)
+            pi_hist = np.empty((n_rec,) + phi.shape)
+        energy_hist = np.empty((n_rec, B))
+        coherence_hist = np.empty((n_rec, B))
+
+        def force_of(phi):
+            lap = self._laplacian(phi)
+            assoc = kernel(phi)
+            return lap - m2_col * phi - alpha * assoc, lap, assoc
+
+        def record(r, phi, pi, lap, assoc):
+            if store_history:
+                phi_hist[r] = phi
+                pi_hist[r] = pi
+            energy_hist[r] = 0.5 * dV * (
+                np.sum(pi ** 2, axis=member_axes)
+                - np.sum(phi * lap, axis=member_axes)
+                + m2 * np.sum(phi ** 2, axis=member_axes)
+            )
+            coherence_hist[r] = self._interior_sum_sq(kernel.triples)
+
+        if integrator == 'imex':
+            linear_step = _ImplicitLinearStep(phi.shape[1:-1], self.spacing,
+                                              dt, m2, self.boundary,
+                                              self.laplacian)
+
+        force, lap, assoc = force_of(phi)
+        record(0, phi, pi, lap, assoc)
+        for n in range(steps):
+            if integrator == 'imex':
+                # As in _kg_steps: explicit associator half-kicks around
+                # the implicit linear flow
+                pi = pi - 0.5 * dt * alpha * assoc
+                phi, pi = linear_step(phi, pi)
+                force, lap, assoc = force_of(phi)
+                pi = pi - 0.5 * dt * alpha * assoc
+            else:
+                for w in weights:
+                    h = w * dt
+                    pi_half = pi + 0.5 * h * force
+                    phi = phi + h * pi_half
+                    force, lap, assoc = force_of(phi)
+                    pi = pi_half + 0.5 * h * force
+            if (n + 1) % record_every == 0:
+                record((n + 1) // record_every, phi, pi, lap, assoc)
+
+        return {
+            'phi_history': phi_hist,
+            'pi_history': pi_hist,
+            'energy_history': energy_hist,
+            'coherence_history': coherence_hist,
+            'times': np.arange(n_rec) * record_every * dt,
+            'epsilon': eps,
+            'm_squared': m2,
+        }
+
+
+    # ==================================================================
+    # 7.  Integrator benchmark
+    # ==================================================================
+
+    def benchmark_integrators(self, first0, second0=None, kind='klein_gordon',
+                              t_final=2.0, tolerance=1e-5, epsilon=1.0,
+                              integrators=None, dt0=None, max_halvings=12):
+        """Wall time for each integrator to reach an energy-error target.
+
+        For every integrator the time step is halved, starting from
+        ``dt0``, until the maximum relative energy error over [0, t_final]
+        is at most ``tolerance``; the run that meets the target is timed.
+        Grid, mass and boundary settings are those of this simulator.
+
+        With epsilon > 0 the associator force is not part of the measured
+        energy, so the error levels off at a small epsilon-dependent floor
+        as dt -> 0; targets below that floor are reported as not reached.
+        The same holds for Maxwell with Dirichlet boundaries, whose
+        one-sided boundary derivatives make the discrete curl non-skew;
+        benchmark Maxwell with ``boundary='periodic'``.
+
+        Parameters
+        ----------
+        first0, second0 : initial state -- (phi0, pi0) for 'klein_gordon',
+                          (E0, B0) for 'maxwell_7d'
+        kind       : 'klein_gordon' or 'maxwell_7d'
+        t_final    : float -- integration time
+        tolerance  : float -- relative energy-error target
+        epsilon    : float in [0, 1]
+        integrators : list of names, or None for all of them
+        dt0        : float or None -- largest step tried (default dx / 2)
+        max_halvings : int -- give up after this many halvings
+
+        Returns
+        -------
+        dict with keys:
+            'tolerance' : float
+            't_final'   : float
+            'results'   : dict mapping integrator name -> dict with
+                          'order', 'dt', 'steps', 'force_evaluations'
+                          (force or curl/J substeps), 'energy_error',
+                          'wall_time' (seconds, the successful run only)
+                          and 'reached' (bool)
+            'speedup'   : dict mapping name -> leapfrog wall time divided
+                          by this integrator's (when both reached)
+        """
+        if kind not in _FIELD_KINDS:
+            raise ValueError(f"Unknown kind: {kind!r}")
+        if integrators is None:
+            integrators = list(_COMPOSITIONS)
+        for name in integrators:
+            _composition(name, kind)
+        if dt0 is None:
+            dt0 = 0.5 * self.dx
+
+        results = {}
+        for name in integrators:
+            dt = dt0
+            for _ in range(max_halvings + 1):
+                steps = int(np.ceil(t_final / dt - 1e-9))
+                sim = OctonionicFieldSimulator(
+                    N=self.N, dt=t_final / steps, L=self.L,
+                    m_squared=self.m_squared, boundary=self.boundary,
+                    laplacian=self.laplacian)
+                t0 = time.perf_counter()
+                with np.errstate(over='ignore', invalid='ignore'):
+                    run = sim._run(kind, first0, second0, steps, epsilon, 1,
+                                   None, None, None, False, None,
+                                   integrator=name)
+                wall = time.perf_counter() - t0
+                energy = run['energy_history']
+                error = float(np.max(np.abs(energy - energy[0]))
+                              / max(abs(energy[0]), 1e-300))
+                reached = bool(np.isfinite(error) and error <= tolerance)
+                if reached:
+                    break
+                dt *= 0.5
+            results[name] = {
+                'order': _INTEGRATOR_ORDER[name],
+                'dt': sim.dt,
+                'steps': steps,
+                'force_evaluations': steps * len(_composition(name, kind)),
+                'energy_error': error,
+                'wall_time': wall,
+                'reached': reached,
+            }
+
+        speedup = {}
+        base = results.get('leapfrog')
+        if base is not None and base['reached']:
+            for name, res in results.items():
+                if res['reached']:
+                    speedup[name] = base['wall_time'] / res['wall_time']
+        return {
+            'tolerance': tolerance,
+            't_final': t_final,
+            'results': results,
+            'speedup': speedup,
+        }
+
+    # ==================================================================
+    # 8.  Static solutions
+    # ==================================================================
+
+    def solve_static(self, source=None, phi0=None, epsilon=1.0,
+                     continuation=4, tol=1e-10, max_newton=50):
+        """Solve the static field equation by Newton-Krylov iteration.
+
+        Finds phi with
+
+            Lap(phi) - m^2 phi - alpha * A_eps[phi] = source
+
+        (the Klein-Gordon force of ``evolve_klein_gordon`` set equal to a
+        static source), instead of relaxing a damped evolution for
+        thousands of steps.
+
+        Each Newton correction solves J d = -F with GMRES.  Jacobian
+        products are exact: A_eps is a cubic form, so its derivative along
+        v is (A(phi + h v) - A(phi - h v)) / (2 h) - h^2 A(v) for any h,
+        three associator evaluations.  GMRES is preconditioned with the
+        exact inverse of Lap - m^2, applied in the Laplacian's eigenbasis
+        (FFT or sine transform, as in IMEX stepping), so the preconditioned
+        operator is the identity plus the associator term and a few Krylov
+        steps suffice.  Steps are damped by backtracking on the residual.
+
+        Epsilon is continued from 0 (where the equation is linear and the
+        preconditioner solves it outright) to ``epsilon``, each solution
+        seeding the next.
+
+        Parameters
+        ----------
+        source       : ndarray, shape (*grid, 8), or None (zero)
+        phi0         : ndarray, shape (*grid, 8), or None -- initial guess;
+                       by default the epsilon = 0 solution
+        epsilon      : float in [0, 1] -- target deformation parameter
+        continuation : int or sequence of float -- number of equal epsilon
+                       increments, or the explicit epsilon path
+        tol          : float -- max-norm residual tolerance
+        max_newton   : int -- Newton iterations allowed per epsilon value
+
+        Returns
+        -------
+        dict with keys:
+            'phi'               : ndarray (*grid, 8) -- the solution
+            'residual'          : float -- final max-norm residual
+            'converged'         : bool
+            'newton_iterations' : int -- total over the epsilon path
+            'krylov_iterations' : int -- total GMRES iterations
+            'epsilon_path'      : ndarray -- epsilon values visited
+            'residual_history'  : list of float -- residual per Newton
+                                  iteration at every epsilon
+        """
+        shape = self.shape + (8,)
+        f = np.zeros(shape) if source is None else np.asarray(source, float)
+        if np.ndim(continuation) == 0:
+            path = np.linspace(0.0, epsilon, int(continuation) + 1)[1:]
+        else:
+            path = np.asarray(continuation, dtype=float)
+        alpha = 0.1 * self.dx ** 2  # as in evolve_klein_gordon
+
+        forward, inverse, symbol = _laplacian_eigenbasis(
+            self.shape, self.spacing, self.boundary, self.laplacian)
+        lam = symbol - self.m_squared
+        inv_lam = np.zeros_like(lam)
+        np.divide(1.0, lam, out=inv_lam, where=np.abs(lam) > 1e-12)
+
+        def precondition(v):
+            return inverse(inv_lam * forward(v))
+
+        def linear(v):
+            return self._laplacian(v) - self.m_squared * v
+
+        phi = precondition(f) if phi0 is None else np.array(phi0, float)
+        history = []
+        newton = krylov = 0
+        converged = True
+        for eps in path:
+            kernel = self._associator_kernel(eps)
+
+            def residual(u):
+                return linear(u) - alpha * kernel(u) - f
+
+            def jacobian(u, v):
+                scale = np.linalg.norm(v)
+                if scale == 0.0:
+                    return np.zeros_like(v)
+                w = v / scale
+                h = np.linalg.norm(u) or 1.0
+                plus = kernel(u + h * w).copy()
+                minus = kernel(u - h * w).copy()
+                d_assoc = (plus - minus) / (2 * h) - h ** 2 * kernel(w)
+                return linear(v) - alpha * scale * d_assoc
+
+            r = residual(phi)
+            norm = np.max(np.abs(r))
+            history.append(float(norm))
+            for _ in range(max_newton):
+                if norm <= tol:
+                    break
+                u = phi
+
+                def matvec(x):
+                    return precondition(jacobian(u, x.reshape(shape))).ravel()
+
+                d, its = _gmres(matvec, -precondition(r).ravel(), rtol=1e-12)
+                d = d.reshape(shape)
+                krylov += its
+                newton += 1
+                step = 1.0
+                while True:
+                    trial = phi + step * d
+                    r_trial = residual(trial)
+                    norm_trial = np.max(np.abs(r_trial))
+                    if norm_trial < (1.0 - 1e-4 * step) * norm or step < 1e-3:
+                        break
+                    step *= 0.5
+                phi, r, norm = trial, r_trial, norm_trial
+                history.append(float(norm))
+            converged = converged and norm <= tol
+
+        return {
+            'phi': phi,
+            'residual': float(norm),
+            'converged': bool(converged),
+            'newton_iterations': newton,
+            'krylov_iterations': krylov,
+            'epsilon_path': path,
+            'residual_history': history,
+        }
+
+
 # ===================================================================
 # Module-level convenience wrappers
 # ===================================================================
 
-def evolve_klein_gordon(phi0, pi0, dx, dt, steps, m_squared=1.0, epsilon=1.0):
+def _grid_from_field(field, dx):
+    """(N, L) simulator arguments for a (*grid, C) field with spacing dx."""
+    grid = field.shape[:-1]
+    if len(grid) == 1:
+        return grid[0], grid[0] * dx
+    return grid, tuple(n * dx for n in grid)
+
+
+def evolve_klein_gordon(phi0, pi0, dx, dt, steps, m_squared=1.0, epsilon=1.0,
+                        boundary='dirichlet', laplacian='stencil'):
     """Module-level wrapper matching the signature expected in the spec.
 
     Parameters
     ----------
-    phi0, pi0 : ndarray, shape (N, 8)
+    phi0, pi0 : ndarray, shape (N, 8), or (Nx, Ny[, Nz], 8) on a lattice
     dx, dt    : float
     steps     : int
     m_squared : float
     epsilon   : float
+    boundary, laplacian : as in ``OctonionicFieldSimulator``
 
     Returns
     -------
     dict  (same keys as OctonionicFieldSimulator.evolve_klein_gordon)
     """
-    N = phi0.shape[0]
-    L = N * dx
-    sim = OctonionicFieldSimulator(N=N, dt=dt, L=L, m_squared=m_squared)
+    N, L = _grid_from_field(phi0, dx)
+    sim = OctonionicFieldSimulator(N=N, dt=dt, L=L, m_squared=m_squared,
+                                   boundary=boundary, laplacian=laplacian)
     return sim.evolve_klein_gordon(phi0, pi0, steps, epsilon=epsilon)
 
 
-def evolve_maxwell_7d(E0, B0, dx, dt, steps, epsilon=1.0):
+def evolve_maxwell_7d(E0, B0, dx, dt, steps, epsilon=1.0,
+                      boundary='dirichlet', laplacian='stencil'):
     """Module-level wrapper for 7D Maxwell evolution.
 
     Parameters
@@ -787,6 +2188,7 @@ def evolve_maxwell_7d(E0, B0, dx, dt, steps, epsilon=1.0):
     dx, dt : float
     steps  : int
     epsilon: float
+    boundary, laplacian : as in ``OctonionicFieldSimulator``
 
     Returns
     -------
@@ -794,26 +2196,69 @@ def evolve_maxwell_7d(E0, B0, dx, dt, steps, epsilon=1.0):
     """
     N = E0.shape[0]
     L = N * dx
-    sim = OctonionicFieldSimulator(N=N, dt=dt, L=L)
+    sim = OctonionicFieldSimulator(N=N, dt=dt, L=L, boundary=boundary,
+                                   laplacian=laplacian)
     return sim.evolve_maxwell_7d(E0, B0, steps, epsilon=epsilon)
 
 
 def compute_coherence_evolution(phi0, pi0, dx, dt, steps, epsilon=1.0):
     """Module-level wrapper for coherence tracking."""
-    N = phi0.shape[0]
-    L = N * dx
+    N, L = _grid_from_field(phi0, dx)
     sim = OctonionicFieldSimulator(N=N, dt=dt, L=L)
     return sim.compute_coherence_evolution(phi0, pi0, steps, epsilon=epsilon)
 
 
 def compare_associative_limit(phi0, pi0, dx, dt, steps):
     """Module-level wrapper for the eps=0 vs eps=1 comparison."""
-    N = phi0.shape[0]
-    L = N * dx
+    N, L = _grid_from_field(phi0, dx)
     sim = OctonionicFieldSimulator(N=N, dt=dt, L=L)
     return sim.compare_associative_limit(phi0, pi0, steps)
 
 
+def resume(checkpoint_path, observers=None, callback=None, writer=None,
+           checkpoint=True):
+    """Continue a run from a checkpoint written during ``evolve_*``.
+
+    The simulator is rebuilt from the grid parameters stored in the
+    checkpoint and the integration continues from the saved fields at the
+    saved step.  Both integrators are deterministic functions of the
+    saved state, so the returned dict is bit-for-bit identical to that of
+    an uninterrupted run.
+
+    Parameters
+    ----------
+    checkpoint_path : str -- a file written by ``checkpoint.Checkpointer``
+    observers : list of ``Observer`` or None -- observers whose names match
+                the checkpointed ones get their records restored
+    callback  : callable or None -- as in ``evolve_klein_gordon``
+    writer    : ``trajectory_io.TrajectoryWriter`` or None -- opened with
+                mode='a' on the original file; frames written after the
+                checkpoint are discarded before continuing
+    checkpoint : True, None or ``checkpoint.Checkpointer`` -- True keeps
+                checkpointing with the original settings
+
+    Returns
+    -------
+    dict  (same keys as the original ``evolve_*`` call)
+    """
+    arrays, meta = load_checkpoint(checkpoint_path)
+    if meta.get('kind') not in _FIELD_KINDS:
+        raise ValueError(f"Not a simulator checkpoint: {checkpoint_path}")
+    if checkpoint is True:
+        checkpoint = Checkpointer(**meta['checkpoint'])
+    sim = OctonionicFieldSimulator(N=meta['N'], dt=meta['dt'], L=meta['L'],
+                                   m_squared=meta['m_squared'],
+                                   boundary=meta.get('boundary', 'dirichlet'),
+                                   laplacian=meta.get('laplacian', 'stencil'),
+                                   workers=meta.get('workers', 1))
+    names = _FIELD_KINDS[meta['kind']][0]
+    return sim._run(meta['kind'], arrays[names[0]], arrays[names[1]],
+                    meta['steps'], meta['epsilon'], meta['record_every'],
+                    observers, callback, writer, meta['store_history'],
+                    checkpoint, restored=(arrays, meta),
+                    integrator=meta.get('integrator', 'leapfrog'))
+
+
 # ===================================================================
 # Main demo
 # ===================================================================
@@ -23,14 +23,17 @@ Classes:
 """
 
 import numpy as np
-from itertools import combinations
+from itertools import combinations, islice, permutations
+from math import factorial
 
 from octonion_algebra.core import Octonion
 from octonion_algebra.deformation import (
     DeformedOctonion,
     deformed_multiply,
     deformed_associator,
+    deformed_multiplication_tensor,
 )
+from octonion_algebra.bracketing import catalan, bracketed_products
 from octonion_algebra.associator import associator, associator_norm
 
 
@@ -172,7 +175,8 @@ class OctonionicDynamicalSystem:
 
     # -- integration ----------------------------------------------------------
 
-    def evolve(self, dt, steps, epsilon=None):
+    def evolve(self, dt, steps, epsilon=None, writer=None,
+               store_history=True):
         """Integrate the system forward using 4th-order Runge-Kutta.
 
         This ensures norm drift is minimised even for stiff non-associative
@@ -184,10 +188,14 @@ class OctonionicDynamicalSystem:
             epsilon: optional float to override the deformation parameter.
                 If provided, states are re-wrapped at the new epsilon before
                 integration begins.
+            writer: optional ``trajectory_io.TrajectoryWriter``; every state
+                is appended to it as field 'states'.
+            store_history: bool, keep the trajectory in memory.  With False
+                'trajectory' is None and only the scalar series are kept.
 
         Returns:
             dict with keys:
-                'trajectory': numpy array of shape (steps+1, N, 8)
+                'trajectory': numpy array of shape (steps+1, N, 8), or None
                 'times': numpy array of shape (steps+1,)
                 'total_norm': numpy array of shape (steps+1,) -- sum of norms
                 'associator_energy': numpy array of shape (steps+1,)
@@ -198,12 +206,16 @@ class OctonionicDynamicalSystem:
                 _states_to_array(self.states), self.epsilon
             )
 
-        trajectory = np.zeros((steps + 1, self.N, 8))
+        trajectory = np.zeros((steps + 1, self.N, 8)) if store_history else None
         times = np.zeros(steps + 1)
         total_norm = np.zeros(steps + 1)
         assoc_energy = np.zeros(steps + 1)
 
-        trajectory[0] = _states_to_array(self.states)
+        arr = _states_to_array(self.states)
+        if store_history:
+            trajectory[0] = arr
+        if writer is not None:
+            writer.append(0, 0.0, states=arr)
         total_norm[0] = self._total_norm()
         assoc_energy[0] = self.measure_associator()
 
@@ -211,7 +223,11 @@ class OctonionicDynamicalSystem:
             self._rk4_step(dt)
             t = (step + 1) * dt
             times[step + 1] = t
-            trajectory[step + 1] = _states_to_array(self.states)
+            arr = _states_to_array(self.states)
+            if store_history:
+                trajectory[step + 1] = arr
+            if writer is not None:
+                writer.append(step + 1, t, states=arr)
             total_norm[step + 1] = self._total_norm()
             assoc_energy[step + 1] = self.measure_associator()
 
@@ -508,71 +524,259 @@ class CoalitionModel:
         """
         return self.agents[i].associator(self.agents[j], self.agents[k])
 
-    def agenda_dependence_index(self):
+    def agenda_dependence_index(self, coalition_size=3, batch_size=None):
         """Global scalar measuring how much outcomes depend on ordering.
 
-        ADI = (sum_{i<j<k} ||[a_i, a_j, a_k]||) / (sum_{i<j<k} max-perm ||product||)
+        ADI = (sum_C max_b ||v_b(C) - v_0(C)||) / (sum_C max_b ||v_b(C)||)
+
+        where C runs over all coalitions of the given size, v_b(C) are the
+        products of C's agents under every bracketing b and v_0(C) is the
+        left-associated product.  For triples the numerator is
+        sum_{i<j<k} ||[a_i, a_j, a_k]||.
 
         Normalised so ADI in [0, 1].  ADI = 0 means the algebra is
         associative (epsilon=0) and ordering does not matter.
 
+        Args:
+            coalition_size: int in [3, 6] (default 3).
+            batch_size: optional int, coalitions scored per vectorised batch.
+
         Returns:
             float: agenda dependence index.
         """
         total_assoc = 0.0
         total_value = 0.0
-
-        for i, j, k in combinations(range(self.N), 3):
-            assoc = self.coalition_associator(i, j, k)
-            total_assoc += assoc.norm()
-
-            # The maximum product norm across the two parenthesisations
-            v1 = (self.agents[i] * self.agents[j]) * self.agents[k]
-            v2 = self.agents[i] * (self.agents[j] * self.agents[k])
-            total_value += max(v1.norm(), v2.norm())
+        for _, scores in self._scored_batches(coalition_size, None,
+                                              False, batch_size):
+            total_assoc += float(np.sum(scores["bracketing_spread"]))
+            total_value += float(np.sum(scores["max_norm"]))
 
         if total_value < 1e-30:
             return 0.0
         return total_assoc / total_value
 
-    def find_stable_coalitions(self, coalition_size=3):
+    def find_stable_coalitions(self, coalition_size=3, threshold=0.1,
+                               top_k=None, batch_size=None):
         """Find coalitions where no agent benefits from switching.
 
-        A coalition (i, j, k) is "stable" if for every permutation of
-        the agents, the coalition value does not increase by more than
-        a tolerance.  This corresponds to configurations where the
-        associator is small -- the ordering does not matter much.
+        A coalition is "stable" if regrouping its members does not change
+        the coalition product by more than a tolerance relative to its
+        value: the bracketing dependence
+
+            max_b ||v_b - v_0|| / ||v_0||
+
+        over all bracketings b is below ``threshold``.  For triples this is
+        ||[a_i, a_j, a_k]|| / ||(a_i a_j) a_k||.
 
         Args:
-            coalition_size: int, size of coalitions to consider (default 3).
+            coalition_size: int in [3, 6] (default 3).
+            threshold: float, maximum relative agenda dependence (default 0.1).
+            top_k: optional int, return only the top_k most valuable.
+            batch_size: optional int, coalitions scored per vectorised batch.
 
         Returns:
-            list of tuples: stable coalitions sorted by value (descending).
+            list of tuples (combo, value, relative_dependence) sorted by
+            value (descending).
         """
-        from itertools import permutations
-
-        stable = []
-        for combo in combinations(range(self.N), coalition_size):
-            if coalition_size != 3:
-                # Only triples supported for associator analysis
-                continue
-
-            i, j, k = combo
-            assoc_norm = self.coalition_associator(i, j, k).norm()
-            base_value = self.coalition_value(i, j, k)
-
-            # Stability criterion: associator is small relative to value
-            # (ordering insensitivity)
-            if base_value < 1e-15:
-                continue
-            relative_dependence = assoc_norm / base_value
-            if relative_dependence < 0.1:  # less than 10% agenda dependence
-                stable.append((combo, base_value, relative_dependence))
+        found = self.query_coalitions(
+            coalition_size, key="bracketing_dependence", threshold=threshold,
+            largest=False, batch_size=batch_size,
+        )
+        stable = [
+            (tuple(int(i) for i in combo), float(v), float(d))
+            for combo, v, d in zip(found["coalitions"], found["value"],
+                                   found["bracketing_dependence"])
+        ]
 
         # Sort by value descending
         stable.sort(key=lambda x: -x[1])
+        if top_k is not None:
+            stable = stable[:top_k]
         return stable
 
+    # -- vectorised coalition scoring ------------------------------------------
+
+    def score_coalitions(self, coalition_size=3, coalitions=None,
+                         orderings=False, batch_size=None):
+        """Score coalitions over all bracketings (and optionally orderings).
+
+        Coalitions are pushed through the bracketing engine in batches, so
+        every sub-product is computed once per batch and shared across all
+        bracketings and orderings that contain it.
+
+        Scores for a coalition with left-associated product v_0 and
+        bracketed products v_b:
+          - value:                 ||v_0||
+          - bracketing_dependence: max_b ||v_b - v_0|| / ||v_0||
+          - ordering_dependence:   as above, but maximised over every
+                                   ordering of the members as well
+                                   (only when ``orderings`` is True)
+
+        Dependences are inf when ||v_0|| vanishes.
+
+        Args:
+            coalition_size: int in [3, 6] (default 3).
+            coalitions: optional (M, coalition_size) array of agent indices.
+                Defaults to all combinations of the N agents.
+            orderings: bool, also score every ordering of the members.
+            batch_size: optional int, coalitions scored per vectorised batch.
+
+        Returns:
+            dict with keys 'coalitions' ((M, coalition_size) int array),
+            'value', 'bracketing_dependence' and, if requested,
+            'ordering_dependence' (each shape (M,)).
+        """
+        keys = ["value", "bracketing_dependence"]
+        if orderings:
+            keys.append("ordering_dependence")
+        combos = []
+        collected = {key: [] for key in keys}
+        for idx, scores in self._scored_batches(coalition_size, coalitions,
+                                                orderings, batch_size):
+            combos.append(idx)
+            for key in keys:
+                collected[key].append(scores[key])
+
+        result = {
+            "coalitions": (np.concatenate(combos) if combos
+                           else np.zeros((0, coalition_size), dtype=int)),
+        }
+        for key in keys:
+            result[key] = (np.concatenate(collected[key]) if combos
+                           else np.zeros(0))
+        return result
+
+    def query_coalitions(self, coalition_size=3, key="bracketing_dependence",
+                         threshold=None, top_k=None, largest=True,
+                         orderings=False, coalitions=None, batch_size=None):
+        """Threshold and top-k queries over coalition scores.
+
+        Coalitions are scored batch by batch and only the survivors are
+        kept, so memory stays bounded by ``top_k`` (or by the number of
+        coalitions passing the threshold) rather than by the number of
+        candidate coalitions.
+
+        Args:
+            coalition_size: int in [3, 6] (default 3).
+            key: score to query, one of 'value', 'bracketing_dependence',
+                'ordering_dependence'.
+            threshold: optional float.  Keeps coalitions with score >=
+                threshold if ``largest``, otherwise score < threshold.
+            top_k: optional int, keep only the top_k largest (or smallest)
+                scores.
+            largest: bool, direction of the threshold and top-k selection.
+            orderings: bool, also score every ordering of the members
+                (required for key='ordering_dependence').
+            coalitions: optional (M, coalition_size) array of candidates.
+            batch_size: optional int, coalitions scored per vectorised batch.
+
+        Returns:
+            dict with the same keys as ``score_coalitions``, restricted to
+            the selected coalitions and sorted by ``key`` (descending if
+            ``largest``, ascending otherwise).
+        """
+        if key == "ordering_dependence":
+            orderings = True
+        keys = ["value", "bracketing_dependence"]
+        if orderings:
+            keys.append("ordering_dependence")
+        if key not in keys:
+            raise ValueError(f"Unknown coalition score: {key!r}")
+
+        kept = {"coalitions": np.zeros((0, coalition_size), dtype=int)}
+        for k in keys:
+            kept[k] = np.zeros(0)
+
+        for idx, scores in self._scored_batches(coalition_size, coalitions,
+                                                orderings, batch_size):
+            s = scores[key]
+            mask = np.isfinite(s)
+            if threshold is not None:
+                mask &= (s >= threshold) if largest else (s < threshold)
+            kept["coalitions"] = np.concatenate([kept["coalitions"], idx[mask]])
+            for k in keys:
+                kept[k] = np.concatenate([kept[k], scores[k][mask]])
+
+            if top_k is not None and len(kept[key]) > top_k:
+                sel = np.argpartition(-kept[key] if largest else kept[key],
+                                      top_k - 1)[:top_k]
+                for k in kept:
+                    kept[k] = kept[k][sel]
+
+        order = np.argsort(-kept[key] if largest else kept[key], kind="stable")
+        return {k: v[order] for k, v in kept.items()}
+
+    def _scored_batches(self, coalition_size, coalitions, orderings,
+                        batch_size):
+        """Yield (indices, scores) for successive batches of coalitions.
+
+        Args:
+            coalition_size: int in [3, 6].
+            coalitions: optional iterable of index tuples; defaults to all
+                combinations of the N agents.
+            orderings: bool, also compute ordering_dependence.
+            batch_size: optional int.
+
+        Yields:
+            tuple (indices, scores): an (B, coalition_size) int array and a
+            dict of (B,) score arrays.
+        """
+        if not 3 <= coalition_size <= 6:
+            raise ValueError(
+                f"coalition_size must be between 3 and 6, got {coalition_size}"
+            )
+        if batch_size is None:
+            per_coalition = catalan(coalition_size - 1)
+            if orderings:
+                per_coalition *= factorial(coalition_size)
+            batch_size = max(32, 2 ** 15 // per_coalition)
+
+        if coalitions is None:
+            it = combinations(range(self.N), coalition_size)
+        else:
+            it = (tuple(c) for c in coalitions)
+
+        arr = self.agent_array()
+        tensor = deformed_multiplication_tensor(self.epsilon)
+        identity = tuple(range(coalition_size))
+
+        while True:
+            chunk = list(islice(it, batch_size))
+            if not chunk:
+                return
+            idx = np.array(chunk, dtype=int).reshape(-1, coalition_size)
+            X = arr[idx]
+            memo = {}
+
+            vals = bracketed_products(X, self.epsilon, memo=memo, tensor=tensor)
+            v0 = vals[:, 0]
+            value = np.linalg.norm(v0, axis=-1)
+            spread = np.max(np.linalg.norm(vals - v0[:, None], axis=-1), axis=1)
+            safe = np.where(value > 1e-15, value, 1.0)
+
+            scores = {
+                "value": value,
+                "bracketing_spread": spread,
+                "bracketing_dependence": np.where(value > 1e-15,
+                                                  spread / safe, np.inf),
+                "max_norm": np.max(np.linalg.norm(vals, axis=-1), axis=1),
+            }
+
+            if orderings:
+                worst = spread.copy()
+                for order in permutations(identity):
+                    if order == identity:
+                        continue
+                    pvals = bracketed_products(X, self.epsilon, order=order,
+                                               memo=memo, tensor=tensor)
+                    dev = np.linalg.norm(pvals - v0[:, None], axis=-1)
+                    np.maximum(worst, np.max(dev, axis=1), out=worst)
+                scores["ordering_dependence"] = np.where(
+                    value > 1e-15, worst / safe, np.inf
+                )
+
+            yield idx, scores
+
     def agent_array(self):
         """Return agent states as (N, 8) numpy array."""
         return _states_to_array(self.agents)
@@ -714,10 +918,8 @@ class DeformationSweep:
             stable = model.find_stable_coalitions()
             n_stable[idx] = len(stable)
             # Mean coalition value over all triples
-            vals = []
-            for combo in combinations(range(N), 3):
-                vals.append(model.coalition_value(*combo))
-            mean_val[idx] = np.mean(vals) if vals else 0.0
+            vals = model.score_coalitions()["value"]
+            mean_val[idx] = np.mean(vals) if len(vals) else 0.0
 
         phase_eps = self._detect_phase_transition(adi)
 
@@ -0,0 +1,263 @@
+"""
+Out-of-core 7D fluid fields, processed slab by slab.
+
+A 7-component field on an N^7 grid needs 56 N^7 bytes (15 GB at N = 16),
+more than fits in memory next to its curl.  ``TiledField`` keeps such a
+field in a ``.npy`` file opened with ``np.memmap`` (component-major, shape
+(components, *grid)), and the operators here stream over it in slabs of
+``tile`` planes along the first grid axis.
+
+The finite-difference stencils of ``fluids`` reach one grid point along
+each axis.  So a slab is read together with one halo plane on either side
+(none at the grid ends, where the one-sided stencils apply).  The in-core
+operator runs on that local block, and only the slab's own planes are
+written out.  Every point sees the same neighbours and arithmetic as in a
+whole-grid computation, so tiled results match ``fluids`` exactly.  Peak
+memory is a few multiples of one slab, independent of N along the first
+axis.
+
+Norms and the S_NA / vorticity ratio are accumulated slab by slab without
+writing any output field.  Spectral derivatives are global along every
+axis and are not available out of core.
+"""
+
+import numpy as np
+
+from octonion_algebra.core import FANO_TRIPLES
+from octonion_algebra.fluids import _fano_curl, octonionic_divergence
+
+
+HALO = 1
+
+_NA_TRIPLES = [t for t in FANO_TRIPLES if t != (1, 2, 3)]
+
+
+class TiledField:
+    """A multi-component grid field accessed in slabs along axis 0.
+
+    Attributes:
+        data: array of shape (components, *grid_shape); an ``np.memmap``
+            for file-backed fields.
+        tile: int, planes per slab.
+    """
+
+    def __init__(self, data, tile=1):
+        """Wrap an existing array or memmap.
+
+        Args:
+            data: array of shape (components, *grid_shape).
+            tile: int >= 1, planes per slab.
+
+        Raises:
+            ValueError: on a bad tile size.
+        """
+        if tile < 1:
+            raise ValueError("tile must be >= 1")
+        self.data = data
+        self.tile = int(tile)
+
+    @classmethod
+    def create(cls, path, grid_shape, components=7, tile=1):
+        """Create a zero-filled file-backed field.
+
+        Args:
+            path: output ``.npy`` path.
+            grid_shape: tuple of int, spatial grid shape.
+            components: int, number of field components.
+            tile: int, planes per slab.
+
+        Returns:
+            TiledField.
+        """
+        data = np.lib.format.open_memmap(
+            str(path), mode='w+', dtype=np.float64,
+            shape=(int(components),) + tuple(int(n) for n in grid_shape))
+        return cls(data, tile)
+
+    @classmethod
+    def open(cls, path, mode='r', tile=1):
+        """Open a field written by ``create``.
+
+        Args:
+            path: ``.npy`` path.
+            mode: 'r' (read-only) or 'r+'.
+            tile: int, planes per slab.
+
+        Returns:
+            TiledField.
+        """
+        return cls(np.lib.format.open_memmap(str(path), mode=mode), tile)
+
+    @property
+    def components(self):
+        return self.data.shape[0]
+
+    @property
+    def grid_shape(self):
+        return self.data.shape[1:]
+
+    def slabs(self):
+        """Yield the (start, stop) plane ranges of the slabs."""
+        n = self.grid_shape[0]
+        for start in range(0, n, self.tile):
+            yield start, min(start + self.tile, n)
+
+    def read(self, start, stop, halo=0):
+        """Load planes ``start:stop`` plus up to ``halo`` planes each side.
+
+        Returns:
+            (block, offset): an in-memory array of shape
+            (components, planes, *grid_shape[1:]), and the index of plane
+            ``start`` within it.
+        """
+        lo = max(start - halo, 0)
+        hi = min(stop + halo, self.grid_shape[0])
+        return np.array(self.data[:, lo:hi]), start - lo
+
+    def write(self, start, values):
+        """Store ``values`` (components, planes, ...) from plane ``start``."""
+        self.data[:, start:start + values.shape[1]] = values
+
+    def sum_squares(self):
+        """Sum of squares over every component and grid point, streamed."""
+        return float(sum(np.sum(self.read(a, b)[0] ** 2)
+                         for a, b in self.slabs()))
+
+    def norm(self):
+        """Euclidean norm over every component and grid point, streamed."""
+        return float(np.sqrt(self.sum_squares()))
+
+    def flush(self):
+        """Write pending changes of a file-backed field to disk."""
+        if isinstance(self.data, np.memmap):
+            self.data.flush()
+
+    def to_components(self):
+        """The field as a list of in-memory component arrays (small grids)."""
+        return [np.array(c) for c in self.data]
+
+
+def _output(out, like, components):
+    """``out`` as a TiledField, creating the file when given a path."""
+    if isinstance(out, TiledField):
+        if out.data.shape != (components,) + like.grid_shape:
+            raise ValueError(f"Output field has shape {out.data.shape}, "
+                             f"expected {(components,) + like.grid_shape}")
+        return out
+    return TiledField.create(out, like.grid_shape, components, like.tile)
+
+
+def _map_slabs(F, out, components, op):
+    """Apply a local operator slab by slab, keeping only owned planes."""
+    out = _output(out, F, components)
+    for start, stop in F.slabs():
+        block, offset = F.read(start, stop, HALO)
+        result = op(block)
+        out.write(start, np.stack(result)[:, offset:offset + stop - start])
+    out.flush()
+    return out
+
+
+def tiled_curl_7d(F, dx, out):
+    """7D curl of a tiled field (``fluids.octonionic_curl_7d``).
+
+    Args:
+        F: TiledField with 7 components on a 7D grid.
+        dx: grid spacing.
+        out: TiledField of the same shape, or a path for a new one.
+
+    Returns:
+        TiledField holding curl(F).
+    """
+    if F.components != 7:
+        raise ValueError("7D curl requires exactly 7 components")
+    return _map_slabs(F, out, 7,
+                      lambda block: _fano_curl(list(block), dx, FANO_TRIPLES))
+
+
+def tiled_divergence(F, dx, out):
+    """Divergence of a tiled field (``fluids.octonionic_divergence``).
+
+    Args:
+        F: TiledField with one component per grid axis.
+        dx: grid spacing.
+        out: single-component TiledField on the same grid, or a path.
+
+    Returns:
+        TiledField holding div(F).
+    """
+    return _map_slabs(F, out, 1,
+                      lambda block: [octonionic_divergence(list(block), dx)])
+
+
+def tiled_vorticity_source_na(v, dx, out):
+    """Non-associative vorticity source of a tiled velocity field.
+
+    Args:
+        v: TiledField with 7 components on a 7D grid.
+        dx: grid spacing.
+        out: TiledField of the same shape, or a path for a new one.
+
+    Returns:
+        TiledField holding S_NA (``fluids.vorticity_source_na``).
+    """
+    if v.components != 7:
+        raise ValueError("S_NA requires exactly 7 components")
+    return _map_slabs(v, out, 7,
+                      lambda block: _fano_curl(list(block), dx, _NA_TRIPLES))
+
+
+def vorticity_source_ratio(v, dx):
+    """Streamed norms of S_NA and of the vorticity, and their ratio.
+
+    Each slab's curl is accumulated in two steps: the S_NA triples first,
+    then the 3D-compatible triple (1,2,3) on top, so one pass gives both
+    norms without storing either field.
+
+    Args:
+        v: TiledField with 7 components on a 7D grid.
+        dx: grid spacing.
+
+    Returns:
+        dict with keys:
+            's_na_norm': float, ||S_NA||.
+            'vorticity_norm': float, ||curl v||.
+            'ratio': float, ||S_NA|| / ||curl v|| (0 for zero vorticity).
+    """
+    s_sq = w_sq = 0.0
+    for start, stop in v.slabs():
+        block, offset = v.read(start, stop, HALO)
+        owned = slice(offset, offset + stop - start)
+        curl = _fano_curl(list(block), dx, _NA_TRIPLES)
+        s_sq += sum(float(np.sum(c[owned] ** 2)) for c in curl)
+        _fano_curl(list(block), dx, [(1, 2, 3)], out=curl)
+        w_sq += sum(float(np.sum(c[owned] ** 2)) for c in curl)
+    s_norm, w_norm = np.sqrt(s_sq), np.sqrt(w_sq)
+    return {
+        's_na_norm': float(s_norm),
+        'vorticity_norm': float(w_norm),
+        'ratio': float(s_norm / w_norm) if w_norm > 0 else 0.0,
+    }
+
+
+def tiled_taylor_green_7d(path, N=8, tile=1):
+    """``fluids.taylor_green_7d`` written slab by slab to a file.
+
+    Args:
+        path: output ``.npy`` path.
+        N: grid points per dimension.
+        tile: int, planes per slab.
+
+    Returns:
+        (TiledField, dx).
+    """
+    dx = 2 * np.pi / N
+    coords_1d = np.linspace(0, 2 * np.pi - dx, N)
+    field = TiledField.create(path, (N,) * 7, 7, tile)
+    for start, stop in field.slabs():
+        grids = np.meshgrid(coords_1d[start:stop],
+                            *[coords_1d for _ in range(6)], indexing='ij')
+        field.write(start, np.stack([
+            np.sin(grids[k]) * np.cos(grids[(k + 1) % 7]) for k in range(7)]))
+    field.flush()
+    return field, dx
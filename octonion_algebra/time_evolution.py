@@ -20,26 +20,195 @@ import numpy as np
 # Helper: discrete Laplacian (shared by RHS and energy)
 # ---------------------------------------------------------------------------
 
-def _compute_laplacian(phi, dx):
+def _grid_spacing(dx):
+    """Per-axis grid spacings: a float is a 1D grid, a sequence is nD."""
+    return tuple(float(h) for h in np.atleast_1d(dx))
+
+
+def _second_difference(phi, axis, dx, periodic):
+    """3-point second difference of ``phi`` along ``axis``.
+
+    Dirichlet boundaries use zero ghost values; periodic ones wrap.
+    """
+    p = np.moveaxis(phi, axis, 0)
+    lap = np.zeros_like(p)
+    lap[1:-1] = (p[2:] - 2.0 * p[1:-1] + p[:-2]) / (dx ** 2)
+    if periodic:
+        lap[0] = (p[1] - 2.0 * p[0] + p[-1]) / (dx ** 2)
+        lap[-1] = (p[0] - 2.0 * p[-1] + p[-2]) / (dx ** 2)
+    else:
+        lap[0] = (p[1] - 2.0 * p[0]) / (dx ** 2)
+        lap[-1] = (p[-2] - 2.0 * p[-1]) / (dx ** 2)
+    return np.moveaxis(lap, 0, axis)
+
+
+def _compute_laplacian(phi, dx, boundary='dirichlet', method='stencil'):
     """Compute discrete Laplacian matching the evolution operator.
 
-    Uses 3-point stencil with Dirichlet (zero ghost) boundary conditions.
+    By default uses the 3-point stencil with Dirichlet (zero ghost) boundary
+    conditions.  ``boundary='periodic'`` wraps the stencil around the grid,
+    and ``method='spectral'`` (periodic only) applies the pseudo-spectral
+    Laplacian -k^2 in Fourier space, which is exact for every resolved mode.
     This must be identical to the Laplacian used in octonionic_klein_gordon_rhs
     so that compute_energy is the exact discrete Hamiltonian.
+
+    ``dx`` is a float for a 1D grid, whose axis is the second-to-last one,
+    or a sequence of per-axis spacings for a 2D/3D grid occupying the
+    ``len(dx)`` axes before the last; the stencil is then the separable
+    sum of 1D stencils.  Leading axes are batched over.
     """
     phi = np.asarray(phi, dtype=float)
-    lap = np.zeros_like(phi)
-    lap[1:-1, :] = (phi[2:, :] - 2.0 * phi[1:-1, :] + phi[:-2, :]) / (dx ** 2)
-    lap[0, :] = (phi[1, :] - 2.0 * phi[0, :]) / (dx ** 2)
-    lap[-1, :] = (phi[-2, :] - 2.0 * phi[-1, :]) / (dx ** 2)
+    if boundary not in ('dirichlet', 'periodic'):
+        raise ValueError(f"Unknown boundary: {boundary!r}")
+    dxs = _grid_spacing(dx)
+    d = len(dxs)
+    if method == 'spectral':
+        if boundary != 'periodic':
+            raise ValueError("The spectral Laplacian requires periodic boundaries")
+        forward, inverse, symbol = _laplacian_eigenbasis(
+            phi.shape[-d - 1:-1], dxs, boundary, method)
+        return inverse(symbol * forward(phi))
+    if method != 'stencil':
+        raise ValueError(f"Unknown Laplacian method: {method!r}")
+
+    periodic = boundary == 'periodic'
+    lap = _second_difference(phi, phi.ndim - 1 - d, dxs[0], periodic)
+    for a in range(1, d):
+        lap += _second_difference(phi, phi.ndim - 1 - d + a, dxs[a], periodic)
     return lap
 
 
+def _dst1(x, axis=-2):
+    """Type-I discrete sine transform along ``axis`` (unnormalised).
+
+    X_j = sum_n x_n sin(pi (j+1) (n+1) / (N+1)); applying it twice gives
+    (N+1)/2 times the input.  Computed with one rfft of the odd extension.
+    """
+    x = np.moveaxis(x, axis, -2)
+    N = x.shape[-2]
+    zero = np.zeros(x.shape[:-2] + (1,) + x.shape[-1:])
+    ext = np.concatenate((zero, x, zero, -x[..., ::-1, :]), axis=-2)
+    out = -0.5 * np.fft.rfft(ext, axis=-2)[..., 1:N + 1, :].imag
+    return np.moveaxis(out, -2, axis)
+
+
+def _mode_wavenumbers(shape, dx, boundary):
+    """Per-axis wavenumbers of the modes of ``_laplacian_eigenbasis``.
+
+    FFT ordering for periodic grids (rfft ordering on the last grid axis),
+    k_j = pi j / ((n + 1) dx), j = 1..n, for the Dirichlet sine modes.
+    """
+    d = len(shape)
+    ks = []
+    for a, (n, h) in enumerate(zip(shape, dx)):
+        if boundary == 'periodic':
+            freq = np.fft.rfftfreq if a == d - 1 else np.fft.fftfreq
+            ks.append(2.0 * np.pi * freq(n, d=h))
+        else:
+            ks.append(np.pi * np.arange(1, n + 1) / ((n + 1) * h))
+    return ks
+
+
+def _laplacian_eigenbasis(shape, dx, boundary, laplacian):
+    """Transform pair diagonalising the discrete Laplacian, and its symbol.
+
+    Periodic grids use the (real) FFT over the grid axes; the Dirichlet
+    3-point stencil is diagonalised by the type-I sine transform along
+    each axis.
+
+    Parameters
+    ----------
+    shape : tuple of int -- grid shape (the axes before the last)
+    dx : tuple of float -- per-axis spacings
+    boundary, laplacian : str -- as in _compute_laplacian
+
+    Returns
+    -------
+    (forward, inverse, symbol) : two callables on (..., *shape, C) arrays
+    and the Laplacian eigenvalues, broadcastable to (*modes, 1).
+    """
+    d = len(shape)
+    axes = tuple(range(-d - 1, -1))
+    if boundary == 'periodic':
+        def forward(x):
+            return np.fft.rfftn(x, axes=axes)
+
+        def inverse(y):
+            return np.fft.irfftn(y, s=shape, axes=axes)
+    elif laplacian == 'stencil':
+        scale = np.prod([2.0 / (n + 1) for n in shape])
+
+        def forward(x):
+            for axis in axes:
+                x = _dst1(x, axis)
+            return x
+
+        def inverse(y):
+            return forward(y) * scale
+    else:
+        raise ValueError("The spectral Laplacian requires periodic boundaries")
+
+    symbol = 0.0
+    for a, (n, h, k) in enumerate(zip(shape, dx,
+                                      _mode_wavenumbers(shape, dx, boundary))):
+        if laplacian == 'spectral':
+            s_a = -(k ** 2)
+        elif laplacian == 'stencil':
+            s_a = -(2.0 - 2.0 * np.cos(k * h)) / h ** 2
+        else:
+            raise ValueError(f"Unknown Laplacian method: {laplacian!r}")
+        symbol = symbol + s_a.reshape((-1,) + (1,) * (d - a))
+    return forward, inverse, symbol
+
+
+class _ImplicitLinearStep:
+    """Crank-Nicolson flow of the linear Klein-Gordon part over a step h.
+
+    Advances phi' = pi, pi' = K phi with K = Lap - m^2 by the trapezoidal
+    rule, which is unconditionally stable and conserves the discrete
+    energy (1/2)(|pi|^2 - phi . K phi) exactly.  The implicit system
+    (I - h^2 K / 4) phi_1 = (I + h^2 K / 4) phi_0 + h pi_0 is solved in
+    the eigenbasis of the Laplacian: the FFT for periodic grids and the
+    type-I sine transform for the Dirichlet 3-point stencil (whose
+    tridiagonal matrix it diagonalises exactly), so a step costs two
+    transforms per field instead of a banded factorisation.
+
+    ``N`` is the grid size, or the grid shape for 2D/3D grids (with ``dx``
+    a matching sequence of spacings).  ``m_squared`` may be an array of
+    shape (B,) for a (B, *grid, C) batch.
+    """
+
+    def __init__(self, N, dx, h, m_squared=1.0, boundary='dirichlet',
+                 laplacian='stencil'):
+        shape = tuple(np.atleast_1d(N).astype(int))
+        dxs = _grid_spacing(dx)
+        if len(dxs) == 1:
+            dxs = dxs * len(shape)
+        self._forward, self._inverse, symbol = _laplacian_eigenbasis(
+            shape, dxs, boundary, laplacian)
+
+        m2 = np.asarray(m_squared, dtype=float)
+        lam = symbol - m2.reshape(m2.shape + (1,) * (len(shape) + 1))
+        q = 0.25 * h * h * lam
+        # Per-mode 2x2 update: phi_1 = a phi_0 + b pi_0, pi_1 = c phi_0 + d pi_0
+        self._a = (1.0 + q) / (1.0 - q)
+        self._b = h / (1.0 - q)
+        self._c = 0.5 * h * lam * (1.0 + self._a)
+        self._d = 1.0 + 0.5 * h * lam * self._b
+
+    def __call__(self, phi, pi):
+        phi_k = self._forward(phi)
+        pi_k = self._forward(pi)
+        return (self._inverse(self._a * phi_k + self._b * pi_k),
+                self._inverse(self._c * phi_k + self._d * pi_k))
+
+
 # ---------------------------------------------------------------------------
 # 1. octonionic_klein_gordon_rhs
 # ---------------------------------------------------------------------------
 
-def octonionic_klein_gordon_rhs(phi, pi_field, dx, m_squared=1.0):
+def octonionic_klein_gordon_rhs(phi, pi_field, dx, m_squared=1.0,
+                                boundary='dirichlet', laplacian='stencil'):
     """
     Right-hand side of the octonionic Klein-Gordon equation in first-order form.
 
@@ -61,6 +230,10 @@ def octonionic_klein_gordon_rhs(phi, pi_field, dx, m_squared=1.0):
         Grid spacing.
     m_squared : float
         Mass squared parameter (default 1.0).
+    boundary : str
+        'dirichlet' (default) or 'periodic'.
+    laplacian : str
+        'stencil' (3-point, default) or 'spectral' (periodic only).
 
     Returns
     -------
@@ -75,8 +248,8 @@ def octonionic_klein_gordon_rhs(phi, pi_field, dx, m_squared=1.0):
     # dphi/dt = pi
     dphi_dt = pi_field.copy()
 
-    # Laplacian via central differences with Dirichlet boundary conditions
-    lap = _compute_laplacian(phi, dx)
+    # Laplacian via central differences (or FFT) with the chosen boundaries
+    lap = _compute_laplacian(phi, dx, boundary, laplacian)
 
     # dpi/dt = Lap(phi) - m^2 * phi
     dpi_dt = lap - m_squared * phi
@@ -88,7 +261,8 @@ def octonionic_klein_gordon_rhs(phi, pi_field, dx, m_squared=1.0):
 # 2. compute_energy
 # ---------------------------------------------------------------------------
 
-def compute_energy(phi, pi_field, dx, m_squared=1.0):
+def compute_energy(phi, pi_field, dx, m_squared=1.0, boundary='dirichlet',
+                   laplacian='stencil'):
     """
     Compute the total energy of the octonionic Klein-Gordon field.
 
@@ -103,13 +277,17 @@ def compute_energy(phi, pi_field, dx, m_squared=1.0):
     Parameters
     ----------
     phi : ndarray, shape (N, 8)
-        Octonion-valued field.
-    pi_field : ndarray, shape (N, 8)
+        Octonion-valued field, or (*grid, 8) on a 2D/3D grid.
+    pi_field : ndarray, same shape as phi
         Time derivative of phi.
-    dx : float
-        Grid spacing.
+    dx : float or sequence of float
+        Grid spacing (one per axis on a 2D/3D grid; the sum is then
+        weighted by the cell volume).
     m_squared : float
         Mass squared parameter.
+    boundary, laplacian : str
+        As in octonionic_klein_gordon_rhs; with the spectral Laplacian the
+        gradient term is the spectral energy sum_k k^2 |phi_k|^2.
 
     Returns
     -------
@@ -118,17 +296,18 @@ def compute_energy(phi, pi_field, dx, m_squared=1.0):
     """
     phi = np.asarray(phi, dtype=float)
     pi_field = np.asarray(pi_field, dtype=float)
+    dV = float(np.prod(_grid_spacing(dx)))
 
     # Kinetic energy: (1/2) * sum |pi|^2 * dx
-    kinetic = np.sum(pi_field ** 2) * dx
+    kinetic = np.sum(pi_field ** 2) * dV
 
     # Gradient energy: (1/2) * sum (-phi . Lap(phi)) * dx
     # Using the same Laplacian as the evolution ensures exact conservation.
-    lap = _compute_laplacian(phi, dx)
-    gradient = -np.sum(phi * lap) * dx
+    lap = _compute_laplacian(phi, dx, boundary, laplacian)
+    gradient = -np.sum(phi * lap) * dV
 
     # Mass energy: (1/2) * m^2 * sum |phi|^2 * dx
-    mass = m_squared * np.sum(phi ** 2) * dx
+    mass = m_squared * np.sum(phi ** 2) * dV
 
     energy = 0.5 * (kinetic + gradient + mass)
     return float(energy)
@@ -138,7 +317,9 @@ def compute_energy(phi, pi_field, dx, m_squared=1.0):
 # 3. evolve_klein_gordon
 # ---------------------------------------------------------------------------
 
-def evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
+def evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared=1.0,
+                        boundary='dirichlet', laplacian='stencil',
+                        integrator='leapfrog'):
     """
     Evolve the octonionic Klein-Gordon equation using symplectic leapfrog.
 
@@ -152,6 +333,12 @@ def evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
     This is a symplectic integrator, so it conserves energy to O(dt^2)
     with no secular drift -- essential for demonstrating well-posedness.
 
+    Leapfrog is explicit and stable only for dt below about dx (the CFL
+    limit).  ``integrator='imex'`` instead treats the linear operator
+    implicitly (Crank-Nicolson, solved by FFT / sine transform), which is
+    stable for any dt and conserves the energy exactly, so fine grids can
+    use a time step set by the physics rather than by dx.
+
     Parameters
     ----------
     phi0 : ndarray, shape (N, 8)
@@ -166,6 +353,11 @@ def evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
         Number of time steps.
     m_squared : float
         Mass squared parameter.
+    boundary, laplacian : str
+        As in octonionic_klein_gordon_rhs.  The spectral Laplacian has
+        largest eigenvalue (pi/dx)^2, so leapfrog needs dt < 2 dx / pi.
+    integrator : str
+        'leapfrog' (default) or 'imex'.
 
     Returns
     -------
@@ -175,6 +367,8 @@ def evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
         'energy_history': list of float, energy at each step
         'times': ndarray of shape (n_steps+1,), time values
     """
+    if integrator not in ('leapfrog', 'imex'):
+        raise ValueError(f"Unknown integrator: {integrator!r}")
     phi0 = np.asarray(phi0, dtype=float)
     pi0 = np.asarray(pi0, dtype=float)
 
@@ -183,12 +377,30 @@ def evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
 
     phi_history = [phi.copy()]
     pi_history = [pi.copy()]
-    energy_history = [compute_energy(phi, pi, dx, m_squared)]
+    energy_history = [compute_energy(phi, pi, dx, m_squared, boundary, laplacian)]
     times = np.arange(n_steps + 1) * dt
 
+    if integrator == 'imex':
+        # The equation is linear, so the whole step is the implicit flow
+        linear_step = _ImplicitLinearStep(phi.shape[:-1], dx, dt, m_squared,
+                                          boundary, laplacian)
+        for _ in range(n_steps):
+            phi, pi = linear_step(phi, pi)
+            phi_history.append(phi.copy())
+            pi_history.append(pi.copy())
+            energy_history.append(
+                compute_energy(phi, pi, dx, m_squared, boundary, laplacian))
+        return {
+            'phi_history': phi_history,
+            'pi_history': pi_history,
+            'energy_history': energy_history,
+            'times': times,
+        }
+
     for _ in range(n_steps):
         # Compute force F(phi) = Lap(phi) - m^2 * phi
-        _, force = octonionic_klein_gordon_rhs(phi, pi, dx, m_squared)
+        _, force = octonionic_klein_gordon_rhs(phi, pi, dx, m_squared,
+                                               boundary, laplacian)
 
         # Half-step momentum update
         pi_half = pi + 0.5 * dt * force
@@ -197,7 +409,8 @@ def evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
         phi_new = phi + dt * pi_half
 
         # Compute force at new position
-        _, force_new = octonionic_klein_gordon_rhs(phi_new, pi_half, dx, m_squared)
+        _, force_new = octonionic_klein_gordon_rhs(phi_new, pi_half, dx,
+                                                   m_squared, boundary, laplacian)
 
         # Half-step momentum update
         pi_new = pi_half + 0.5 * dt * force_new
@@ -207,7 +420,8 @@ def evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
 
         phi_history.append(phi.copy())
         pi_history.append(pi.copy())
-        energy_history.append(compute_energy(phi, pi, dx, m_squared))
+        energy_history.append(
+            compute_energy(phi, pi, dx, m_squared, boundary, laplacian))
 
     return {
         'phi_history': phi_history,
@@ -221,7 +435,9 @@ def evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
 # 4. verify_energy_conservation
 # ---------------------------------------------------------------------------
 
-def verify_energy_conservation(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
+def verify_energy_conservation(phi0, pi0, dx, dt, n_steps, m_squared=1.0,
+                               boundary='dirichlet', laplacian='stencil',
+                               integrator='leapfrog'):
     """
     Evolve the field and verify energy conservation.
 
@@ -234,6 +450,8 @@ def verify_energy_conservation(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
     dx, dt : float
     n_steps : int
     m_squared : float
+    boundary, laplacian, integrator : str
+        As in evolve_klein_gordon.
 
     Returns
     -------
@@ -242,7 +460,8 @@ def verify_energy_conservation(phi0, pi0, dx, dt, n_steps, m_squared=1.0):
         'max_relative_error': float
         'energies': list of float
     """
-    result = evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared)
+    result = evolve_klein_gordon(phi0, pi0, dx, dt, n_steps, m_squared,
+                                 boundary, laplacian, integrator)
     energies = result['energy_history']
 
     e0 = energies[0]
@@ -0,0 +1,355 @@
+"""
+Chunked on-disk trajectory storage.
+
+Long simulation runs produce trajectories (one array per time step per
+field) far larger than memory.  ``TrajectoryWriter`` appends frames to a
+self-describing binary file in fixed-size chunks, and ``TrajectoryReader``
+reads time ranges and components back through ``np.memmap`` without
+loading the whole file.
+
+File layout:
+  - 8-byte magic ``b'OCTRAJ01'``, a little-endian uint64 byte count and a
+    UTF-8 JSON header (format version, writer options, user metadata).
+  - A sequence of chunks.  Each chunk is ``b'CHNK'``, a uint64 byte count,
+    a JSON chunk header listing its blocks, then the blocks themselves.
+  - Every block is one array in ``.npy`` format: the step numbers, the
+    times, and one (n_frames, *frame_shape) array per named field.  Blocks
+    are either raw (memory-mapped on read) or zlib-compressed.
+
+Chunks are self-contained, so a file can be appended to later and a file
+cut short by a crash is readable up to its last complete chunk.
+
+The writer is callable as ``writer(step, time, state)``, so it can be
+passed directly as the ``callback`` of the simulator's evolve methods.
+"""
+
+import io
+import json
+import os
+import struct
+import zlib
+
+import numpy as np
+
+
+_MAGIC = b'OCTRAJ01'
+_CHUNK_MAGIC = b'CHNK'
+_FORMAT_VERSION = 1
+
+
+def _write_record(f, magic, header):
+    """Write magic + uint64 length + JSON header."""
+    payload = json.dumps(header).encode('utf-8')
+    f.write(magic)
+    f.write(struct.pack('<Q', len(payload)))
+    f.write(payload)
+
+
+def _read_record(f, magic):
+    """Read a record written by ``_write_record``; None at end of file."""
+    head = f.read(len(magic) + 8)
+    if len(head) < len(magic) + 8 or head[:len(magic)] != magic:
+        return None
+    (length,) = struct.unpack('<Q', head[len(magic):])
+    payload = f.read(length)
+    if len(payload) < length:
+        return None
+    return json.loads(payload.decode('utf-8'))
+
+
+class TrajectoryWriter:
+    """Append trajectory frames to a chunked binary file.
+
+    Frames are buffered in memory and written ``chunk_size`` at a time, so
+    memory use is bounded by one chunk however long the run.
+
+    Attributes:
+        path: str, output file path.
+        chunk_size: int, frames per chunk.
+        compress: bool, zlib-compress each block.
+        dtype: numpy dtype fields are stored as, or None to keep their own.
+        n_frames: int, frames appended so far (including buffered ones).
+    """
+
+    def __init__(self, path, chunk_size=256, compress=False, dtype=None,
+                 metadata=None, mode='w'):
+        """Open a trajectory file for writing.
+
+        Args:
+            path: output file path.
+            chunk_size: int >= 1, frames per chunk.
+            compress: bool, zlib-compress each block (archival).
+            dtype: optional dtype for field data, e.g. ``np.float32`` to
+                halve the file size.  Steps and times are never downcast.
+            metadata: optional JSON-serialisable dict stored in the header.
+            mode: 'w' to create a new file, 'a' to append chunks to an
+                existing one (its header is kept).
+
+        Raises:
+            ValueError: on a bad chunk size or mode, or when appending to a
+                file that is not a trajectory file.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        if mode not in ('w', 'a'):
+            raise ValueError(f"Unknown mode: {mode!r}")
+        self.path = str(path)
+        self.chunk_size = int(chunk_size)
+        self.compress = bool(compress)
+        self.dtype = np.dtype(dtype) if dtype is not None else None
+        self.n_frames = 0
+        self._buffer = []
+
+        if mode == 'a' and os.path.exists(self.path):
+            existing = TrajectoryReader(self.path)
+            self.n_frames = len(existing)
+            # Drop any partial chunk left by an interrupted writer
+            self._file = open(self.path, 'r+b')
+            self._file.truncate(existing.data_end)
+            self._file.seek(existing.data_end)
+        else:
+            self._file = open(self.path, 'wb')
+            _write_record(self._file, _MAGIC, {
+                'format': 'octonion-trajectory',
+                'version': _FORMAT_VERSION,
+                'chunk_size': self.chunk_size,
+                'compress': self.compress,
+                'dtype': None if self.dtype is None else self.dtype.str,
+                'metadata': metadata or {},
+            })
+
+    def append(self, step, time, **fields):
+        """Append one frame.
+
+        Args:
+            step: int, step number.
+            time: float, simulation time.
+            **fields: named arrays; every frame must carry the same names
+                and shapes.
+        """
+        frame = {}
+        for name, value in fields.items():
+            arr = np.array(value, copy=True)
+            if self.dtype is not None:
+                arr = arr.astype(self.dtype)
+            frame[name] = arr
+        self._buffer.append((int(step), float(time), frame))
+        self.n_frames += 1
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def __call__(self, step, time, state):
+        """Callback form of ``append``: ``state`` is a dict of fields."""
+        self.append(step, time, **state)
+
+    def flush(self):
+        """Write the buffered frames as one chunk."""
+        if not self._buffer:
+            return
+        blocks = {
+            '_step': np.array([b[0] for b in self._buffer], dtype=np.int64),
+            '_time': np.array([b[1] for b in self._buffer], dtype=np.float64),
+        }
+        for name in self._buffer[0][2]:
+            blocks[name] = np.stack([b[2][name] for b in self._buffer])
+
+        codec = 'zlib' if self.compress else 'raw'
+        payloads = []
+        for name, arr in blocks.items():
+            buf = io.BytesIO()
+            np.lib.format.write_array(buf, np.ascontiguousarray(arr),
+                                      allow_pickle=False)
+            data = buf.getvalue()
+            if self.compress:
+                data = zlib.compress(data)
+            payloads.append((name, data))
+
+        _write_record(self._file, _CHUNK_MAGIC, {
+            'n_frames': len(self._buffer),
+            'blocks': [{'name': name, 'nbytes': len(data), 'codec': codec}
+                       for name, data in payloads],
+        })
+        for _, data in payloads:
+            self._file.write(data)
+        self._file.flush()
+        self._buffer = []
+
+    def rewind(self, n_frames):
+        """Discard every frame after the first ``n_frames``.
+
+        Used when resuming from a checkpoint: the writer is flushed when a
+        checkpoint is taken, so the checkpointed frame count always falls
+        on a chunk boundary.
+
+        Args:
+            n_frames: int, number of frames to keep.
+
+        Raises:
+            ValueError: if ``n_frames`` is not on a chunk boundary.
+        """
+        self.flush()
+        self._file.flush()
+        reader = TrajectoryReader(self.path)
+        if n_frames == len(reader):
+            return
+        ends = {c1: blocks for _, c1, blocks in reader._chunks}
+        if n_frames == 0:
+            offset = reader.header_end
+        elif n_frames in ends:
+            offset = max(o + nbytes for o, nbytes, _ in ends[n_frames].values())
+        else:
+            raise ValueError(f"{n_frames} frames is not a chunk boundary")
+        self._file.truncate(offset)
+        self._file.seek(offset)
+        self.n_frames = n_frames
+
+    def close(self):
+        """Flush remaining frames and close the file."""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class TrajectoryReader:
+    """Read a file written by ``TrajectoryWriter``.
+
+    Opening a file only scans the chunk headers.  ``read`` then touches the
+    chunks overlapping the requested frames: raw blocks are memory-mapped
+    and sliced, compressed blocks are decompressed one chunk at a time.
+
+    Attributes:
+        path: str, file path.
+        header: dict, the file header (options and 'metadata').
+        metadata: dict, user metadata from the header.
+        fields: dict mapping field name -> (frame_shape, dtype).
+        steps: ndarray (n_frames,) of step numbers.
+        times: ndarray (n_frames,) of times.
+        header_end: int, byte offset just past the file header.
+        data_end: int, byte offset just past the last complete chunk.
+    """
+
+    def __init__(self, path):
+        """Scan a trajectory file.
+
+        Args:
+            path: file path.
+
+        Raises:
+            ValueError: if the file is not a trajectory file.
+        """
+        self.path = str(path)
+        self._chunks = []
+        with open(self.path, 'rb') as f:
+            self.header = _read_record(f, _MAGIC)
+            if self.header is None:
+                raise ValueError(f"Not a trajectory file: {self.path}")
+            size = os.fstat(f.fileno()).st_size
+            self.header_end = self.data_end = f.tell()
+            start = 0
+            while True:
+                chunk = _read_record(f, _CHUNK_MAGIC)
+                if chunk is None:
+                    break
+                offset = f.tell()
+                end = offset + sum(b['nbytes'] for b in chunk['blocks'])
+                if end > size:
+                    break  # truncated final chunk
+                blocks = {}
+                for b in chunk['blocks']:
+                    blocks[b['name']] = (offset, b['nbytes'], b['codec'])
+                    offset += b['nbytes']
+                n = chunk['n_frames']
+                self._chunks.append((start, start + n, blocks))
+                start += n
+                f.seek(end)
+                self.data_end = end
+
+        self.metadata = self.header.get('metadata', {})
+        self.fields = {}
+        if self._chunks:
+            for name in self._chunks[0][2]:
+                if name.startswith('_'):
+                    continue
+                arr = self._block(self._chunks[0][2][name])
+                self.fields[name] = (tuple(arr.shape[1:]), arr.dtype)
+        self.steps = self._gather('_step')
+        self.times = self._gather('_time')
+
+    def __len__(self):
+        return self._chunks[-1][1] if self._chunks else 0
+
+    def _block(self, entry):
+        """Return one block as a memmap (raw) or array (compressed)."""
+        offset, nbytes, codec = entry
+        if codec == 'zlib':
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                data = zlib.decompress(f.read(nbytes))
+            return np.lib.format.read_array(io.BytesIO(data),
+                                            allow_pickle=False)
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            data_offset = f.tell()
+        return np.memmap(self.path, dtype=dtype, mode='r', offset=data_offset,
+                         shape=shape, order='F' if fortran else 'C')
+
+    def _gather(self, name):
+        if not self._chunks:
+            return np.zeros(0)
+        return np.concatenate([np.asarray(self._block(blocks[name]))
+                               for _, _, blocks in self._chunks])
+
+    def read(self, name, start=0, stop=None, stride=1, components=None):
+        """Read frames ``start:stop:stride`` of one field.
+
+        Args:
+            name: field name.
+            start, stop, stride: frame range, as in slicing (non-negative).
+            components: optional index, slice or list selecting entries of
+                the last axis.
+
+        Returns:
+            ndarray of shape (n_selected, *frame_shape), with the last axis
+            reduced by ``components``.
+
+        Raises:
+            KeyError: if the field does not exist.
+        """
+        if name not in self.fields:
+            raise KeyError(name)
+        frames = np.arange(len(self))[start:stop:stride]
+        parts = []
+        for c0, c1, blocks in self._chunks:
+            local = frames[(frames >= c0) & (frames < c1)] - c0
+            if len(local) == 0:
+                continue
+            arr = self._block(blocks[name])[local]
+            if components is not None:
+                arr = arr[..., components]
+            parts.append(np.asarray(arr))
+        if not parts:
+            shape, dtype = self.fields[name]
+            empty = np.zeros((0,) + shape, dtype=dtype)
+            return empty[..., components] if components is not None else empty
+        return np.concatenate(parts)
+
+    def iter_chunks(self, name):
+        """Yield ``(steps, times, frames)`` chunk by chunk for one field."""
+        if name not in self.fields:
+            raise KeyError(name)
+        for _, _, blocks in self._chunks:
+            yield (np.asarray(self._block(blocks['_step'])),
+                   np.asarray(self._block(blocks['_time'])),
+                   self._block(blocks[name]))
@@ -17,6 +17,8 @@ from octonion_algebra.applications import (
     fano_ternary_tensor,
     octonionic_lotka_volterra_rhs,
     simulate_lotka_volterra,
+    simulate_lotka_volterra_ensemble,
+    fano_ternary_entries,
     lotka_volterra_comparison,
     portfolio_associator,
     associator_entropy,
@@ -167,6 +169,44 @@ class TestLotkaVolterra:
         # All populations should remain positive in this mild regime
         assert np.all(traj > 0), "Populations went negative in mild regime"
 
+    def test_sparse_entries_match_dense_tensor(self):
+        """The 42 sparse entries reproduce the dense Fano tensor."""
+        j, k = fano_ternary_entries()
+        F = np.zeros((7, 7, 7))
+        F[np.arange(7)[:, None], j, k] = 1.0
+        np.testing.assert_array_equal(F, fano_ternary_tensor())
+
+    def test_ensemble_matches_single_trajectories(self, lv_params):
+        """Each ensemble member follows simulate_lotka_volterra."""
+        x0, r, A, _ = lv_params
+        scales = np.array([0.0, 0.001, 0.005])
+        x0s = np.stack([x0, 0.9 * x0, 1.1 * x0])
+        result = simulate_lotka_volterra_ensemble(
+            x0s, r, A, scales, dt=0.01, n_steps=100, return_trajectories=True)
+        for b, scale in enumerate(scales):
+            traj = simulate_lotka_volterra(x0s[b], r, A,
+                                           scale * fano_ternary_tensor(),
+                                           dt=0.01, n_steps=100)
+            np.testing.assert_allclose(result['trajectories'][:, b], traj,
+                                       atol=1e-12)
+        np.testing.assert_array_equal(result['stop_step'], 100)
+
+    def test_ensemble_early_termination(self, lv_params):
+        """Members stop independently on extinction or blow-up."""
+        x0, r, A, _ = lv_params
+        r_decay = np.stack([r, -np.ones(7), r])
+        result = simulate_lotka_volterra_ensemble(
+            np.tile(x0, (3, 1)), r_decay, A, np.array([0.0, 0.0, 5.0]),
+            dt=0.01, n_steps=500, extinction_threshold=0.5,
+            blowup_threshold=1e3, return_trajectories=True)
+        assert result['extinct'].tolist() == [False, True, False]
+        assert result['blowup'].tolist() == [False, False, True]
+        assert result['stop_step'][0] == 500
+        assert result['stop_step'][1] < 500 and result['stop_step'][2] < 500
+        stop = result['stop_step'][1]
+        np.testing.assert_array_equal(result['trajectories'][-1, 1],
+                                      result['trajectories'][stop, 1])
+
 
 # ===================================================================
 # TestPortfolioAssociator
@@ -274,9 +314,40 @@ class TestCoalitionAssociator:
     def test_optimal_ordering_keys(self, random_agents):
         """optimal_coalition_ordering must return the documented keys."""
         result = optimal_coalition_ordering(random_agents)
-        expected_keys = {'min_ordering', 'min_cost', 'max_ordering', 'max_cost'}
+        expected_keys = {'min_ordering', 'min_cost', 'max_ordering', 'max_cost',
+                         'exact', 'min_gap', 'max_gap'}
         assert set(result.keys()) == expected_keys
 
+    def test_optimal_ordering_matches_brute_force(self):
+        """The dynamic program finds the brute-force optimum over all n!."""
+        from itertools import permutations
+        agents = [Octonion.random(seed=i + 300) for i in range(6)]
+
+        def cost(perm):
+            return sum(associator_norm(agents[perm[t]], agents[perm[t + 1]],
+                                       agents[perm[t + 2]])
+                       for t in range(len(perm) - 2))
+
+        costs = [cost(p) for p in permutations(range(6))]
+        result = optimal_coalition_ordering(agents)
+        assert result['exact']
+        assert result['min_cost'] == pytest.approx(min(costs), abs=1e-10)
+        assert result['max_cost'] == pytest.approx(max(costs), abs=1e-10)
+        assert cost(result['min_ordering']) == pytest.approx(result['min_cost'], abs=1e-10)
+        assert cost(result['max_ordering']) == pytest.approx(result['max_cost'], abs=1e-10)
+
+    def test_beam_search_reports_valid_gaps(self):
+        """Beyond the exact limit the beam result lies within its reported gap."""
+        agents = [Octonion.random(seed=i + 400) for i in range(7)]
+        exact = optimal_coalition_ordering(agents)
+        beam = optimal_coalition_ordering(agents, exact_max_n=0, beam_width=8)
+        assert not beam['exact']
+        assert sorted(beam['min_ordering']) == list(range(7))
+        assert beam['min_cost'] >= exact['min_cost'] - 1e-10
+        assert beam['min_cost'] - beam['min_gap'] <= exact['min_cost'] + 1e-10
+        assert beam['max_cost'] <= exact['max_cost'] + 1e-10
+        assert beam['max_cost'] + beam['max_gap'] >= exact['max_cost'] - 1e-10
+
     def test_optimal_ordering_valid_permutations(self, random_agents):
         """Both orderings must be valid permutations of agent indices."""
         result = optimal_coalition_ordering(random_agents)
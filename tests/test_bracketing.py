@@ -0,0 +1,104 @@
+"""Tests for the batched bracketing engine."""
+import numpy as np
+import pytest
+
+from octonion_algebra.core import Octonion
+from octonion_algebra.alignment import all_bracketings, all_bracketings_4
+from octonion_algebra.deformation import deformed_multiply
+from octonion_algebra.bracketing import (
+    catalan,
+    bracketed_products,
+    bracketing_spread,
+)
+
+
+def test_catalan_numbers():
+    """First Catalan numbers are 1, 1, 2, 5, 14, 42, 132."""
+    assert [catalan(n) for n in range(7)] == [1, 1, 2, 5, 14, 42, 132]
+
+
+def test_four_factors_match_all_bracketings_4():
+    """At eps=1 the engine reproduces all_bracketings_4 in the same order."""
+    X = np.array([Octonion.random(seed=40 + i).coeffs for i in range(4)])
+    vals = bracketed_products(X, 1.0)
+    expected = all_bracketings_4(*[Octonion(x) for x in X])
+    assert vals.shape == (5, 8)
+    for v, e in zip(vals, expected):
+        np.testing.assert_allclose(v, e.coeffs, atol=1e-12)
+
+
+def test_three_factors_give_associator():
+    """For three factors the two bracketings differ by the associator."""
+    rng = np.random.default_rng(7)
+    a, b, c = rng.standard_normal((3, 8))
+    vals = bracketed_products(np.array([a, b, c]), 0.6)
+    left = deformed_multiply(deformed_multiply(a, b, 0.6), c, 0.6)
+    right = deformed_multiply(a, deformed_multiply(b, c, 0.6), 0.6)
+    np.testing.assert_allclose(vals[0], left, atol=1e-12)
+    np.testing.assert_allclose(vals[1], right, atol=1e-12)
+
+
+@pytest.mark.parametrize("n", [2, 3, 5, 6])
+def test_batch_shape(n):
+    """A batch of B sequences gives (B, Catalan(n-1), 8) values."""
+    X = np.random.default_rng(n).standard_normal((4, n, 8))
+    assert bracketed_products(X, 1.0).shape == (4, catalan(n - 1), 8)
+
+
+def test_shared_memo_across_orderings():
+    """Reusing a memo across orderings gives the same values as fresh calls."""
+    X = np.random.default_rng(3).standard_normal((2, 4, 8))
+    memo = {}
+    for order in [(0, 1, 2, 3), (1, 0, 2, 3), (3, 2, 1, 0)]:
+        shared = bracketed_products(X, 1.0, order=order, memo=memo)
+        fresh = bracketed_products(X[:, list(order)], 1.0)
+        np.testing.assert_allclose(shared, fresh, atol=1e-12)
+
+
+def test_quaternionic_bracketings_coincide_at_eps0():
+    """At eps=0 quaternionic factors associate, so all bracketings agree."""
+    X = np.zeros((5, 8))
+    X[:, :4] = np.random.default_rng(9).standard_normal((5, 4))
+    vals = bracketed_products(X, 0.0)
+    np.testing.assert_allclose(vals, np.broadcast_to(vals[0], vals.shape),
+                               atol=1e-12)
+
+
+def test_all_bracketings_general_n():
+    """all_bracketings returns Catalan(n-1) Octonions for n factors."""
+    elems = [Octonion.random(seed=60 + i) for i in range(6)]
+    results = all_bracketings(*elems)
+    assert len(results) == 42
+    left = elems[0]
+    for e in elems[1:]:
+        left = left * e
+    np.testing.assert_allclose(results[0].coeffs, left.coeffs, atol=1e-12)
+
+
+@pytest.mark.parametrize("functional", ["real", "norm"])
+def test_spread_matches_enumeration(functional):
+    """Streaming statistics equal those of the enumerated bracketings."""
+    X = np.random.default_rng(11).standard_normal((5, 6, 8))
+    vals = bracketed_products(X, 0.8)
+    f = vals[..., 0] if functional == "real" else np.linalg.norm(vals, axis=-1)
+    stats = bracketing_spread(X, 0.8, functional=functional, batch_size=2)
+    np.testing.assert_allclose(stats["min"], f.min(axis=1), atol=1e-12)
+    np.testing.assert_allclose(stats["max"], f.max(axis=1), atol=1e-12)
+    np.testing.assert_allclose(stats["mean"], f.mean(axis=1), atol=1e-12)
+    dev = np.linalg.norm(vals - vals[:, :1], axis=-1).max(axis=1)
+    np.testing.assert_allclose(stats["max_deviation"], dev, atol=1e-12)
+
+
+def test_spread_ten_factors():
+    """n = 10 covers all 4862 bracketings."""
+    X = np.random.default_rng(12).standard_normal((10, 8))
+    stats = bracketing_spread(X, 1.0)
+    assert stats["n_bracketings"] == 4862
+    assert stats["spread"] > 0
+
+
+def test_norm_spread_vanishes_at_eps1():
+    """The octonion norm is multiplicative, so all bracketings share it."""
+    X = np.random.default_rng(13).standard_normal((3, 7, 8))
+    stats = bracketing_spread(X, 1.0, functional="norm")
+    np.testing.assert_allclose(stats["spread"], 0.0, atol=1e-10)
@@ -0,0 +1,38 @@
+"""
+Tests for atomic rotating checkpoints (checkpoint).
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from octonion_algebra.checkpoint import Checkpointer, load_checkpoint
+
+
+class TestCheckpointer:
+    """Checkpoint files are complete, ordered and pruned."""
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        ckpt = Checkpointer(tmp_path, every=5)
+        path = ckpt.save(10, {'x': np.arange(4.0)}, {'step': 10, 'kind': 'test'})
+        arrays, meta = load_checkpoint(path)
+        np.testing.assert_array_equal(arrays['x'], np.arange(4.0))
+        assert meta == {'step': 10, 'kind': 'test'}
+        assert not any(name.endswith('.tmp') for name in os.listdir(tmp_path))
+
+    def test_retention_keeps_newest(self, tmp_path):
+        ckpt = Checkpointer(tmp_path, every=1, keep=2)
+        for step in (1, 2, 3, 4):
+            ckpt.save(step, {'x': np.zeros(1)}, {'step': step})
+        assert [os.path.basename(p) for p in ckpt.checkpoints()] == [
+            'checkpoint_0000000003.npz', 'checkpoint_0000000004.npz']
+        assert ckpt.latest() == ckpt.path_for(4)
+
+    def test_due(self, tmp_path):
+        ckpt = Checkpointer(tmp_path, every=3)
+        assert [n for n in range(10) if ckpt.due(n)] == [3, 6, 9]
+
+    def test_invalid_settings_raise(self, tmp_path):
+        with pytest.raises(ValueError):
+            Checkpointer(tmp_path, every=0)
@@ -14,6 +14,7 @@ from octonion_algebra.associator import associator
 from octonion_algebra.deformation import (
     deformed_structure_constants,
     deformed_multiply,
+    deformed_multiply_batch,
     DeformedOctonion,
     deformed_associator,
     associativity_measure,
@@ -342,3 +343,32 @@ def test_deformation_summary_structure():
     assert len(result['derivation_dimension']) == 3
     assert len(result['killing_eigenvalues']) == 3
     np.testing.assert_allclose(result['epsilon'], [0.0, 0.5, 1.0], atol=1e-12)
+
+
+# ---------------------------------------------------------------------------
+# 15. Batched deformed product matches the scalar product
+# ---------------------------------------------------------------------------
+
+def test_deformed_multiply_batch_matches_scalar():
+    """deformed_multiply_batch agrees with deformed_multiply pair by pair."""
+    rng = np.random.default_rng(31)
+    a = rng.standard_normal((6, 8))
+    b = rng.standard_normal((6, 8))
+    for eps_val in [0.0, 0.4, 1.0]:
+        batch = deformed_multiply_batch(a, b, eps_val)
+        for n in range(6):
+            np.testing.assert_allclose(
+                batch[n], deformed_multiply(a[n], b[n], eps_val), atol=1e-12
+            )
+
+
+def test_deformed_multiply_batch_broadcasts():
+    """Leading axes broadcast to give all pairwise products."""
+    rng = np.random.default_rng(32)
+    a = rng.standard_normal((3, 8))
+    b = rng.standard_normal((4, 8))
+    batch = deformed_multiply_batch(a[:, None, :], b[None, :, :], 0.7)
+    assert batch.shape == (3, 4, 8)
+    np.testing.assert_allclose(
+        batch[2, 1], deformed_multiply(a[2], b[1], 0.7), atol=1e-12
+    )
@@ -13,6 +13,7 @@ from octonion_algebra.core import Octonion
 from octonion_algebra.derivation_engine import (
     FieldConfiguration,
     vary_action,
+    action_gradient,
     derive_euler_lagrange,
     derive_field_equation_steps,
     verify_derivation_numerically,
@@ -121,6 +122,77 @@ class TestVariation:
         assert max_asym < 1e-7
 
 
+# ===================================================================
+# TestActionGradient
+# ===================================================================
+
+class TestActionGradient:
+    """Tests for the exact reverse-mode action gradient."""
+
+    @pytest.mark.parametrize('coupling', [0.0, 0.7])
+    def test_matches_finite_differences(self, coupling):
+        """The exact gradient agrees with the vary_action checker."""
+        phi = np.random.default_rng(20).uniform(-1, 1, size=(12, 8))
+        fc = FieldConfiguration(phi)
+        exact = action_gradient(fc, dx=0.2, m_sq=1.0, coupling=coupling)
+        numerical = vary_action(fc, dx=0.2, m_sq=1.0, coupling=coupling)
+        np.testing.assert_allclose(exact, numerical, atol=1e-6)
+
+    def test_kinetic_gradient_is_analytic_kg(self):
+        """Without the associator term the gradient is dx (-lap phi + m^2 phi)."""
+        from octonion_algebra.derivation_engine import _analytic_kg
+        phi = np.random.default_rng(21).uniform(-1, 1, size=(40, 8))
+        grad = action_gradient(FieldConfiguration(phi), dx=0.25, m_sq=2.0)
+        np.testing.assert_allclose(grad / 0.25, _analytic_kg(phi, 0.25, 2.0),
+                                   atol=1e-12)
+
+    def test_quaternionic_field_has_no_correction(self):
+        """The associator term vanishes to first order on associative fields."""
+        phi = np.zeros((20, 8))
+        phi[:, :4] = np.random.default_rng(22).uniform(-1, 1, size=(20, 4))
+        fc = FieldConfiguration(phi)
+        assert fc.coherence_energy(dx=0.1) < 1e-28
+        np.testing.assert_allclose(fc.action_gradient(0.1, 1.0, 1.0, 5.0),
+                                   fc.action_gradient(0.1, 1.0, 1.0),
+                                   atol=1e-12)
+
+    def test_one_contraction_per_product(self, monkeypatch):
+        """Each product's backward contracts once for both input gradients."""
+        from octonion_algebra import derivation_engine as de
+        calls = []
+        original = de._octonion_product_vjp
+
+        def counting(a, b, g):
+            calls.append(1)
+            return original(a, b, g)
+
+        monkeypatch.setattr(de, '_octonion_product_vjp', counting)
+        phi = np.random.default_rng(24).uniform(-1, 1, size=(10, 8))
+        FieldConfiguration(phi).action_gradient(0.1, 1.0, 1.0, 0.5)
+        assert len(calls) == 4
+
+    def test_repeated_backward_is_stable(self):
+        """Replaying backward on the same graph gives identical gradients."""
+        from octonion_algebra.derivation_engine import _Var, _product
+        phi = _Var(np.random.default_rng(25).uniform(-1, 1, size=(10, 8)))
+        a, b, c = phi[:-2], phi[1:-1], phi[2:]
+        S = (_product(_product(a, b), c)
+             - _product(a, _product(b, c))).sum_squares()
+        S.backward()
+        first = phi.grad.copy()
+        S.backward()
+        np.testing.assert_array_equal(phi.grad, first)
+        (S * 2.0).backward()
+        np.testing.assert_allclose(phi.grad, 2.0 * first, rtol=1e-12)
+
+    def test_large_grid(self):
+        """The gradient is O(N): a 10^5-point grid is cheap."""
+        phi = np.random.default_rng(23).normal(size=(100_000, 8))
+        grad = action_gradient(FieldConfiguration(phi), dx=0.1, coupling=0.5)
+        assert grad.shape == (100_000, 8)
+        assert np.all(np.isfinite(grad))
+
+
 # ===================================================================
 # TestEulerLagrange
 # ===================================================================
@@ -0,0 +1,101 @@
+"""
+Tests for shared-memory domain decomposition (domain_decomposition).
+"""
+
+import glob
+
+import numpy as np
+import pytest
+
+from octonion_algebra.domain_decomposition import slab_bounds
+from octonion_algebra.simulator import OctonionicFieldSimulator, resume
+from octonion_algebra.checkpoint import Checkpointer
+
+
+def _pair(workers=3, **kwargs):
+    """A single-process simulator and a decomposed one on the same grid."""
+    kwargs.setdefault('N', 48)
+    kwargs.setdefault('L', 4.8)
+    kwargs.setdefault('dt', 0.02)
+    return (OctonionicFieldSimulator(**kwargs),
+            OctonionicFieldSimulator(workers=workers, **kwargs))
+
+
+class TestSlabBounds:
+    def test_slabs_cover_grid(self):
+        bounds = slab_bounds(10, 3)
+        assert bounds[0][0] == 0 and bounds[-1][1] == 10
+        assert all(b0[1] == b1[0] for b0, b1 in zip(bounds, bounds[1:]))
+        assert {b - a for a, b in bounds} <= {3, 4}
+
+    def test_too_many_workers_raises(self):
+        with pytest.raises(ValueError):
+            slab_bounds(7, 4)
+
+
+class TestDecomposedRuns:
+    """Decomposed runs reproduce single-process runs bit for bit."""
+
+    @pytest.mark.parametrize('boundary', ['dirichlet', 'periodic'])
+    @pytest.mark.parametrize('integrator', ['leapfrog', 'yoshida4'])
+    def test_klein_gordon_matches_single_process(self, boundary, integrator):
+        serial, parallel = _pair(boundary=boundary)
+        phi0 = serial.random_field(amplitude=0.5, seed=1)
+        a = serial.evolve_klein_gordon(phi0, steps=20, integrator=integrator)
+        b = parallel.evolve_klein_gordon(phi0, steps=20, integrator=integrator)
+        for key in ('phi_history', 'pi_history', 'energy_history'):
+            np.testing.assert_array_equal(b[key], a[key])
+
+    @pytest.mark.parametrize('integrator', ['leapfrog', 'yoshida4'])
+    def test_maxwell_matches_single_process(self, integrator):
+        serial, parallel = _pair(workers=2, boundary='periodic')
+        field = serial.random_field(amplitude=0.5, seed=2)
+        E0, B0 = field[:, 1:], np.roll(field[:, :7], 5, axis=0)
+        a = serial.evolve_maxwell_7d(E0, B0, steps=20, integrator=integrator)
+        b = parallel.evolve_maxwell_7d(E0, B0, steps=20, integrator=integrator)
+        np.testing.assert_array_equal(b['E_history'], a['E_history'])
+        np.testing.assert_array_equal(b['B_history'], a['B_history'])
+
+    def test_lattice_matches_single_process(self):
+        serial, parallel = _pair(workers=4, N=(20, 12), L=2.0)
+        phi0 = serial.random_field(amplitude=0.5, seed=3)
+        a = serial.evolve_klein_gordon(phi0, steps=10)
+        b = parallel.evolve_klein_gordon(phi0, steps=10)
+        np.testing.assert_array_equal(b['phi_history'], a['phi_history'])
+
+    def test_preempted_run_resumes_identically(self, tmp_path):
+        serial, parallel = _pair(workers=2)
+        phi0 = serial.gaussian_pulse(components=[0, 1, 4])
+        full = serial.evolve_klein_gordon(phi0, steps=20)
+
+        def preempt(n, t, state):
+            if n == 13:
+                raise KeyboardInterrupt
+
+        ckpt = Checkpointer(tmp_path, every=5)
+        with pytest.raises(KeyboardInterrupt):
+            parallel.evolve_klein_gordon(phi0, steps=20, callback=preempt,
+                                         checkpoint=ckpt)
+        resumed = resume(ckpt.latest())
+        np.testing.assert_array_equal(resumed['phi_history'],
+                                      full['phi_history'])
+
+    def test_early_exit_releases_shared_memory(self):
+        _, parallel = _pair(workers=2)
+        phi0 = parallel.random_field(seed=4)
+        before = set(glob.glob('/dev/shm/psm_*'))
+        steps = parallel.iter_klein_gordon(phi0, steps=100)
+        for n, _, _, _ in steps:
+            if n == 3:
+                break
+        steps.close()
+        assert set(glob.glob('/dev/shm/psm_*')) <= before
+
+    def test_non_local_operators_rejected(self):
+        with pytest.raises(ValueError):
+            OctonionicFieldSimulator(N=32, boundary='periodic',
+                                     laplacian='spectral', workers=2)
+        _, parallel = _pair(workers=2)
+        phi0 = parallel.random_field(seed=5)
+        with pytest.raises(ValueError):
+            parallel.evolve_klein_gordon(phi0, steps=2, integrator='imex')
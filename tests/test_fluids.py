@@ -8,6 +8,7 @@ from octonion_algebra.fluids import (
     restrict_velocity_to_3d,
     octonionic_curl_7d,
     octonionic_gradient,
+    octonionic_divergence,
 )
 
 
@@ -104,3 +105,89 @@ def test_gradient_shape():
         assert gi.shape == shape, (
             f"Gradient component {i} has shape {gi.shape}, expected {shape}"
         )
+
+
+def _random_field(N, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.normal(size=(N,) * 7) for _ in range(7)], 2 * np.pi / N
+
+
+def test_curl_matches_structure_constant_definition():
+    """(curl F)_k = sum_{i,j} f_{ijk} dF_j/dx_i with all 49 partials."""
+    from octonion_algebra.calculus import structure_constants
+    f = structure_constants()
+    F, dx = _random_field(3)
+    curl = octonionic_curl_7d(F, dx)
+    for k in range(7):
+        expected = sum(f[i, j, k] * np.gradient(F[j], dx, axis=i)
+                       for i in range(7) for j in range(7) if f[i, j, k])
+        np.testing.assert_allclose(curl[k], expected, atol=1e-12)
+
+
+def test_vorticity_source_is_curl_minus_3d_part():
+    F, dx = _random_field(3, seed=1)
+    curl = octonionic_curl_7d(F, dx)
+    S = vorticity_source_na(F, dx)
+    p = lambda j, i: np.gradient(F[j], dx, axis=i)
+    curl_3d = [p(2, 1) - p(1, 2), p(0, 2) - p(2, 0), p(1, 0) - p(0, 1)]
+    for k in range(7):
+        expected = curl[k] - curl_3d[k] if k < 3 else curl[k]
+        np.testing.assert_allclose(S[k], expected, atol=1e-12)
+
+
+@pytest.mark.parametrize('op', [octonionic_curl_7d, vorticity_source_na])
+def test_curl_peak_memory(op):
+    """Partials are streamed: peak memory is ~7 outputs plus one buffer."""
+    import tracemalloc
+    F, dx = _random_field(5, seed=2)
+    tracemalloc.start()
+    op(F, dx)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 10 * F[0].nbytes
+
+
+def _taylor_green_partial(N, j, i):
+    """Exact dv_j/dx_i of taylor_green_7d on its grid."""
+    dx = 2 * np.pi / N
+    x = np.linspace(0, 2 * np.pi - dx, N)
+    g = np.meshgrid(*[x] * 7, indexing='ij')
+    nxt = (j + 1) % 7
+    if i == j:
+        return np.cos(g[j]) * np.cos(g[nxt])
+    if i == nxt:
+        return -np.sin(g[j]) * np.sin(g[nxt])
+    return np.zeros_like(g[0])
+
+
+def test_spectral_curl_is_exact_for_taylor_green():
+    """Band-limited periodic fields are differentiated to rounding error."""
+    from octonion_algebra.calculus import structure_constants
+    f = structure_constants()
+    N = 4
+    v, dx = taylor_green_7d(N=N)
+    curl = octonionic_curl_7d(v, dx, method='spectral')
+    for k in range(7):
+        exact = sum(f[i, j, k] * _taylor_green_partial(N, j, i)
+                    for i in range(7) for j in range(7) if f[i, j, k])
+        np.testing.assert_allclose(curl[k], exact, atol=1e-12)
+    S = vorticity_source_na(v, dx, method='spectral')
+    assert sum(np.sum(s ** 2) for s in S) > 1.0
+
+
+def test_spectral_gradient_and_divergence():
+    N = 4
+    v, dx = taylor_green_7d(N=N)
+    div = octonionic_divergence(v, dx, method='spectral')
+    exact = sum(_taylor_green_partial(N, i, i) for i in range(7))
+    np.testing.assert_allclose(div, exact, atol=1e-12)
+    grad = octonionic_gradient(v[2], dx, method='spectral')
+    for i in range(7):
+        np.testing.assert_allclose(grad[i], _taylor_green_partial(N, 2, i),
+                                   atol=1e-12)
+
+
+def test_unknown_derivative_method_raises():
+    v, dx = taylor_green_7d(N=4)
+    with pytest.raises(ValueError):
+        octonionic_curl_7d(v, dx, method='chebyshev')
@@ -365,6 +365,56 @@ class TestPortfolioDynamics:
         )
 
 
+    def test_bracketing_spread_includes_left_product(self, portfolio_eps1):
+        """The left-to-right return lies within the bracketing range."""
+        result = portfolio_eps1.bracketing_spread([0, 1, 2, 3, 4])
+        lr = portfolio_eps1.portfolio_product([0, 1, 2, 3, 4])[0]
+        assert result['n_bracketings'] == 14
+        assert result['min_return'] - 1e-12 <= lr <= result['max_return'] + 1e-12
+        assert result['spread'] > 0
+
+    def test_bracketing_spread_zero_for_quaternionic_at_eps0(self):
+        """Quaternionic assets at eps=0 associate: every bracketing agrees."""
+        portfolio = PortfolioDynamics(n_assets=6, epsilon=0.0, seed=3)
+        portfolio.assets[:, 4:] = 0.0
+        result = portfolio.bracketing_spread(range(6))
+        assert result['spread'] < 1e-14
+        assert result['max_deviation'] < 1e-14
+
+    def test_ordering_returns_match_scalar_products(self, portfolio_eps1):
+        """Batched and trie evaluation agree with portfolio_product."""
+        orderings = [[0, 1, 2, 3], [0, 1, 3, 2], [4, 2, 0, 1], [0, 1, 2, 4]]
+        expected = [portfolio_eps1.portfolio_product(o)[0] for o in orderings]
+        for prefix_sharing in (False, True):
+            returns = portfolio_eps1.ordering_returns(
+                orderings, prefix_sharing=prefix_sharing)
+            np.testing.assert_allclose(returns, expected, atol=1e-14)
+
+    def test_ordering_spread_trie_matches_batch(self, portfolio_eps1):
+        """Prefix sharing reproduces the exhaustive returns in order."""
+        plain = portfolio_eps1.ordering_spread(range(5))
+        trie = portfolio_eps1.ordering_spread(range(5), prefix_sharing=True)
+        assert len(plain['returns']) == 120
+        np.testing.assert_allclose(trie['returns'], plain['returns'], atol=1e-14)
+
+    def test_ordering_spread_estimate_bounds(self):
+        """The sample spread bounds the exhaustive spread from below."""
+        portfolio = PortfolioDynamics(n_assets=6, epsilon=1.0, seed=11)
+        exact = portfolio.ordering_spread(range(6))
+        est = portfolio.ordering_spread_estimate(range(6), n_samples=2000)
+        assert est['spread_lower_bound'] <= exact['spread'] + 1e-14
+        assert 0.99 < est['coverage'] < 1.0
+        lo, hi = est['mean_ci']
+        assert lo < est['mean_return'] < hi
+
+    def test_ordering_spread_estimate_twenty_assets(self):
+        """Sampling handles baskets far beyond exhaustive enumeration."""
+        portfolio = PortfolioDynamics(n_assets=20, epsilon=1.0, seed=2)
+        est = portfolio.ordering_spread_estimate(range(20), n_samples=500)
+        assert est['n_samples'] == 500
+        assert est['spread_lower_bound'] > 0
+
+
 # ===================================================================
 # EcosystemModel
 # ===================================================================
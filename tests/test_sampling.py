@@ -0,0 +1,90 @@
+"""
+Tests for the checkerboard Metropolis sampler (sampling).
+"""
+
+import numpy as np
+import pytest
+
+from octonion_algebra.derivation_engine import FieldConfiguration
+from octonion_algebra.sampling import (
+    MetropolisSampler,
+    integrated_autocorrelation_time,
+)
+
+
+class TestLocalAction:
+    """Local action changes agree with re-evaluating the whole action."""
+
+    def test_action_matches_field_configuration(self):
+        phi = np.random.default_rng(0).normal(size=(20, 8))
+        sampler = MetropolisSampler(dx=0.5, m_sq=2.0, coupling=0.3)
+        assert sampler.action(phi) == pytest.approx(
+            FieldConfiguration(phi).corrected_action(0.5, 1.0, 2.0, 0.3))
+
+    @pytest.mark.parametrize('coupling, block_size, periodic, colours', [
+        (0.0, 1, False, 2),
+        (0.3, 1, False, 3),
+        (0.3, 1, True, 3),
+        (0.3, 2, False, 2),
+        (0.0, 3, True, 2),
+    ])
+    def test_block_deltas_are_independent(self, coupling, block_size,
+                                          periodic, colours):
+        phi = np.random.default_rng(1).normal(size=(24, 8))
+        sampler = MetropolisSampler(dx=0.5, coupling=coupling,
+                                    block_size=block_size, periodic=periodic)
+        assert sampler.colours == colours
+        move = np.random.default_rng(2).normal(size=phi.shape)
+        for sites, ids, n_blocks, terms in sampler._plan(len(phi)):
+            trial = phi.copy()
+            trial[sites] += move[sites]
+            delta = (sampler._local_action(trial, terms, n_blocks)
+                     - sampler._local_action(phi, terms, n_blocks))
+            # Same-colour blocks share no term, so the deltas add up
+            assert np.sum(delta) == pytest.approx(
+                sampler.action(trial) - sampler.action(phi))
+
+    def test_periodic_chain_must_fit_colouring(self):
+        sampler = MetropolisSampler(coupling=0.5, periodic=True)
+        with pytest.raises(ValueError):
+            sampler.sweep(np.zeros((10, 8)))
+
+
+class TestSampling:
+    def test_gaussian_equipartition(self):
+        """For the quadratic action <beta S> = (number of components) / 2."""
+        sampler = MetropolisSampler(dx=1.0, beta=2.0, step_size=0.3, seed=3)
+        res = sampler.run(np.zeros((32, 8)), sweeps=2000, thermalize=200)
+        mean = np.mean(res['observables']['action'])
+        assert 2.0 * mean == pytest.approx(32 * 8 / 2, rel=0.05)
+        assert 0.2 < res['acceptance_rate'] < 0.8
+        assert res['autocorrelation_time']['action'] >= 0.5
+
+    def test_reproducible_with_seed(self):
+        runs = [MetropolisSampler(coupling=0.5, block_size=2, seed=4).run(
+            np.zeros((12, 8)), sweeps=5) for _ in range(2)]
+        np.testing.assert_array_equal(runs[0]['phi'], runs[1]['phi'])
+
+    def test_custom_observables(self):
+        sampler = MetropolisSampler(seed=5)
+        res = sampler.run(np.zeros((8, 8)), sweeps=6, every=2,
+                          observables={'mean': lambda p: float(p.mean())})
+        assert set(res['observables']) == {'action', 'phi_sq', 'mean'}
+        assert len(res['observables']['mean']) == 3
+
+
+class TestAutocorrelation:
+    def test_white_noise(self):
+        x = np.random.default_rng(6).normal(size=20000)
+        assert integrated_autocorrelation_time(x) == pytest.approx(0.5,
+                                                                   abs=0.05)
+
+    def test_ar1_process(self):
+        """AR(1) with coefficient a has tau = (1 + a) / (2 (1 - a))."""
+        rng = np.random.default_rng(7)
+        a, x = 0.8, np.zeros(100000)
+        noise = rng.normal(size=x.size)
+        for t in range(1, x.size):
+            x[t] = a * x[t - 1] + noise[t]
+        assert integrated_autocorrelation_time(x) == pytest.approx(
+            (1 + a) / (2 * (1 - a)), rel=0.15)
@@ -56,7 +56,17 @@ from octonion_algebra.simulator import (
     compare_associative_limit,
     _compute_laplacian,
     _associator_correction,
+    _AssociatorKernel,
+    _MaxwellOperators,
+    EnergyObserver,
+    CoherenceObserver,
+    PoyntingFluxObserver,
+    SpectralObserver,
+    resume,
 )
+from octonion_algebra.checkpoint import Checkpointer
+from octonion_algebra.trajectory_io import TrajectoryWriter, TrajectoryReader
+from octonion_algebra.deformation import deformed_multiply
 
 
 # ---------------------------------------------------------------------------
@@ -395,6 +405,39 @@ class TestInitialConditions:
         phi0 = sim.random_field()
         assert phi0.shape == (sim.N, 8)
 
+    @pytest.mark.parametrize('N', [64, 33])
+    def test_random_field_matches_sine_series(self, N):
+        """The FFT synthesis reproduces the direct k^-2 sine sum."""
+        sim = OctonionicFieldSimulator(N=N, L=6.4)
+        rng = np.random.default_rng(11)
+        ref = np.zeros((N, 8))
+        for c in range(8):
+            modes = rng.standard_normal(N // 2)
+            for k in range(1, N // 2):
+                ref[:, c] += modes[k] * np.sin(
+                    2 * np.pi * k * sim.x / sim.L) / k ** 2
+        np.testing.assert_allclose(sim.random_field(1.0, seed=11), ref,
+                                   atol=1e-13)
+
+    def test_random_field_batch_and_spectrum(self, sim):
+        batch = sim.random_field(seed=5, batch=3)
+        assert batch.shape == (3, sim.N, 8)
+        np.testing.assert_array_equal(batch[0], sim.random_field(seed=5))
+        assert not np.allclose(batch[1], batch[0])
+        # A flat spectrum with only mode 3 excited is a single sine
+        phi0 = sim.random_field(1.0, seed=5,
+                                spectrum=lambda k: (k == 3).astype(float))
+        wave = np.sin(6 * np.pi * sim.x / sim.L)
+        coeff = phi0[:, 0] @ wave / (wave @ wave)
+        np.testing.assert_allclose(phi0[:, 0], coeff * wave, atol=1e-13)
+
+    def test_sine_mode_batch(self, sim):
+        batch = sim.sine_mode(mode=[1, 2, 3], components=[0, 3])
+        assert batch.shape == (3, sim.N, 8)
+        for b, m in enumerate([1, 2, 3]):
+            np.testing.assert_array_equal(batch[b],
+                                          sim.sine_mode(m, components=[0, 3]))
+
 
 # ---------------------------------------------------------------------------
 # 9. Poynting vector
@@ -509,6 +552,32 @@ class TestInternalHelpers:
         assoc = _associator_correction(phi, 0.2, epsilon=1.0)
         assert np.max(np.abs(assoc)) > 1e-6
 
+    @pytest.mark.parametrize("epsilon", [0.3, 1.0])
+    def test_associator_correction_matches_deformed_products(self, epsilon):
+        """The fused kernel equals (ab)c - a(bc) from deformed_multiply."""
+        rng = np.random.default_rng(7)
+        phi = rng.standard_normal((6, 8))
+        assoc = _associator_correction(phi, 0.2, epsilon=epsilon)
+        for i in range(1, 5):
+            a, b, c = phi[i - 1], phi[i], phi[i + 1]
+            expected = (
+                deformed_multiply(deformed_multiply(a, b, epsilon), c, epsilon)
+                - deformed_multiply(a, deformed_multiply(b, c, epsilon), epsilon)
+            )
+            np.testing.assert_allclose(assoc[i], expected, atol=1e-12)
+        np.testing.assert_array_equal(assoc[0], assoc[1])
+        np.testing.assert_array_equal(assoc[-1], assoc[-2])
+
+    def test_associator_kernel_reuses_buffer(self):
+        """Repeated calls on the same grid size write into one buffer."""
+        rng = np.random.default_rng(3)
+        kernel = _AssociatorKernel(1.0)
+        first = kernel(rng.standard_normal((10, 8)))
+        phi = rng.standard_normal((10, 8))
+        second = kernel(phi)
+        assert first is second
+        np.testing.assert_allclose(second, _associator_correction(phi, 0.1, 1.0))
+
 
 # ---------------------------------------------------------------------------
 # 12. Regression / smoke tests
@@ -532,3 +601,709 @@ class TestSmoke:
         _ = sim.evolve_maxwell_7d(E0, B0, steps=5)
         _ = sim.compute_coherence_evolution(phi0, steps=5)
         _ = sim.compare_associative_limit(phi0, steps=5)
+
+
+# ---------------------------------------------------------------------------
+# 13. Recording strides, generators and observers
+# ---------------------------------------------------------------------------
+
+class TestRecording:
+    """Strided histories, snapshot generators and observers."""
+
+    def test_record_every_subsamples_history(self, small_sim):
+        phi0 = small_sim.gaussian_pulse(components=[0, 1, 4])
+        full = small_sim.evolve_klein_gordon(phi0, steps=20)
+        strided = small_sim.evolve_klein_gordon(phi0, steps=20, record_every=5)
+        assert strided['phi_history'].shape == (5, small_sim.N, 8)
+        np.testing.assert_array_equal(strided['phi_history'],
+                                      full['phi_history'][::5])
+        np.testing.assert_array_equal(strided['energy_history'],
+                                      full['energy_history'][::5])
+        np.testing.assert_allclose(strided['times'], full['times'][::5])
+
+    def test_iter_klein_gordon_matches_evolve(self, small_sim):
+        phi0 = small_sim.gaussian_pulse(components=[0, 1, 4])
+        full = small_sim.evolve_klein_gordon(phi0, steps=12)
+        snaps = list(small_sim.iter_klein_gordon(phi0, steps=12, every=4))
+        assert [n for n, _, _, _ in snaps] == [0, 4, 8, 12]
+        for n, t, phi, pi in snaps:
+            np.testing.assert_array_equal(phi, full['phi_history'][n])
+            np.testing.assert_array_equal(pi, full['pi_history'][n])
+
+    def test_callback_sees_recorded_steps(self, small_sim):
+        seen = []
+        phi0 = small_sim.sine_mode()
+        small_sim.evolve_klein_gordon(
+            phi0, steps=9, record_every=3,
+            callback=lambda n, t, state: seen.append((n, state['phi'].shape)))
+        assert seen == [(n, (small_sim.N, 8)) for n in (0, 3, 6, 9)]
+
+    def test_observers_use_own_cadence(self, small_sim):
+        phi0 = small_sim.gaussian_pulse(components=[0, 1, 4])
+        full = small_sim.evolve_klein_gordon(phi0, steps=10)
+        result = small_sim.evolve_klein_gordon(
+            phi0, steps=10, record_every=10,
+            observers=[EnergyObserver(every=2), CoherenceObserver(every=5)])
+        energy = result['observers']['energy']
+        np.testing.assert_array_equal(energy['steps'], [0, 2, 4, 6, 8, 10])
+        np.testing.assert_allclose(energy['values'],
+                                   full['energy_history'][::2])
+        assert result['observers']['coherence']['values'].shape == (3,)
+        assert result['phi_history'].shape == (2, small_sim.N, 8)
+
+    def test_same_class_observers_need_distinct_names(self, small_sim):
+        phi0 = small_sim.gaussian_pulse(components=[1, 2, 4, 7])
+        result = small_sim.evolve_klein_gordon(
+            phi0, steps=6,
+            observers=[CoherenceObserver(epsilon=0.0, name='q0'),
+                       CoherenceObserver(epsilon=1.0, name='q1'),
+                       EnergyObserver(every=2),
+                       EnergyObserver(every=3, name='energy3')])
+        obs = result['observers']
+        assert sorted(obs) == ['energy', 'energy3', 'q0', 'q1']
+        assert not np.allclose(obs['q0']['values'], obs['q1']['values'])
+        np.testing.assert_array_equal(obs['energy']['steps'], [0, 2, 4, 6])
+        np.testing.assert_array_equal(obs['energy3']['steps'], [0, 3, 6])
+        with pytest.raises(ValueError, match="Duplicate observer names"):
+            small_sim.evolve_klein_gordon(
+                phi0, steps=2,
+                observers=[CoherenceObserver(epsilon=0.0),
+                           CoherenceObserver(epsilon=1.0)])
+
+    def test_maxwell_record_every_and_flux(self, small_sim):
+        E0 = np.zeros((small_sim.N, 7))
+        B0 = np.zeros((small_sim.N, 7))
+        E0[:, 2] = 1.0
+        B0[:, 4] = 1.0
+        full = small_sim.evolve_maxwell_7d(E0, B0, steps=6)
+        result = small_sim.evolve_maxwell_7d(
+            E0, B0, steps=6, record_every=3,
+            observers=[PoyntingFluxObserver(every=3)])
+        np.testing.assert_array_equal(result['E_history'],
+                                      full['E_history'][::3])
+        flux = result['observers']['poynting_flux']['values']
+        assert flux.shape == (3, 7)
+        np.testing.assert_allclose(
+            flux, full['poynting_history'][::3].sum(axis=1) * small_sim.dx)
+
+
+# ---------------------------------------------------------------------------
+# 14. Checkpoint and resume
+# ---------------------------------------------------------------------------
+
+class _Preempted(Exception):
+    pass
+
+
+def _preempt_at(step):
+    def callback(n, t, state):
+        if n == step:
+            raise _Preempted()
+    return callback
+
+
+class TestCheckpointResume:
+    """An interrupted run resumed from a checkpoint matches an
+    uninterrupted one bit for bit."""
+
+    def test_klein_gordon_resume_is_bitwise_identical(self, small_sim, tmp_path):
+        phi0 = small_sim.gaussian_pulse(components=[0, 1, 4, 6])
+        full = small_sim.evolve_klein_gordon(
+            phi0, steps=20, record_every=2, observers=[EnergyObserver(every=3)])
+
+        ckpt = Checkpointer(tmp_path, every=5, keep=2)
+        with pytest.raises(_Preempted):
+            small_sim.evolve_klein_gordon(
+                phi0, steps=20, record_every=2,
+                observers=[EnergyObserver(every=3)],
+                callback=_preempt_at(14), checkpoint=ckpt)
+        assert ckpt.latest() == ckpt.path_for(10)
+        assert len(ckpt.checkpoints()) == 2
+
+        resumed = resume(ckpt.latest(), observers=[EnergyObserver(every=3)])
+        for key in ('phi_history', 'pi_history', 'energy_history', 'times'):
+            np.testing.assert_array_equal(resumed[key], full[key])
+        np.testing.assert_array_equal(resumed['observers']['energy']['values'],
+                                      full['observers']['energy']['values'])
+        assert ckpt.latest() == ckpt.path_for(20)
+
+    def test_same_class_observers_resume_separately(self, small_sim, tmp_path):
+        def observers():
+            return [CoherenceObserver(every=2, epsilon=0.0, name='q0'),
+                    CoherenceObserver(every=3, epsilon=1.0, name='q1')]
+
+        phi0 = small_sim.gaussian_pulse(components=[0, 1, 4, 6])
+        full = small_sim.evolve_klein_gordon(phi0, steps=20,
+                                             observers=observers())
+        ckpt = Checkpointer(tmp_path, every=5)
+        with pytest.raises(_Preempted):
+            small_sim.evolve_klein_gordon(
+                phi0, steps=20, observers=observers(),
+                callback=_preempt_at(14), checkpoint=ckpt)
+        resumed = resume(ckpt.latest(), observers=observers())
+        for name in ('q0', 'q1'):
+            for key, val in full['observers'][name].items():
+                np.testing.assert_array_equal(
+                    resumed['observers'][name][key], val)
+
+    def test_maxwell_resume_is_bitwise_identical(self, small_sim, tmp_path):
+        E0 = np.zeros((small_sim.N, 7))
+        B0 = np.zeros((small_sim.N, 7))
+        E0[:, 2] = np.exp(-(small_sim.x - 3.2) ** 2)
+        B0[:, 4] = 0.5 * np.exp(-(small_sim.x - 3.2) ** 2)
+        full = small_sim.evolve_maxwell_7d(E0, B0, steps=12)
+
+        ckpt = Checkpointer(tmp_path, every=4)
+        with pytest.raises(_Preempted):
+            small_sim.evolve_maxwell_7d(E0, B0, steps=12, checkpoint=ckpt,
+                                        callback=_preempt_at(7))
+        resumed = resume(ckpt.latest())
+        for key in ('E_history', 'B_history', 'poynting_history',
+                    'energy_history'):
+            np.testing.assert_array_equal(resumed[key], full[key])
+
+    def test_resume_rewinds_trajectory_writer(self, small_sim, tmp_path):
+        phi0 = small_sim.sine_mode(components=[0, 3])
+        path = tmp_path / "kg.oct"
+        ckpt = Checkpointer(tmp_path / "ckpt", every=4)
+        writer = TrajectoryWriter(path, chunk_size=3)
+        with pytest.raises(_Preempted):
+            small_sim.evolve_klein_gordon(phi0, steps=10, writer=writer,
+                                          store_history=False,
+                                          checkpoint=ckpt,
+                                          callback=_preempt_at(6))
+        writer.close()
+
+        with TrajectoryWriter(path, chunk_size=3, mode='a') as writer:
+            resume(ckpt.latest(), writer=writer)
+        reader = TrajectoryReader(path)
+        np.testing.assert_array_equal(reader.steps, np.arange(11))
+        full = small_sim.evolve_klein_gordon(phi0, steps=10)
+        np.testing.assert_array_equal(reader.read('phi'), full['phi_history'])
+
+
+# ---------------------------------------------------------------------------
+# 15. Batched ensembles
+# ---------------------------------------------------------------------------
+
+class TestEnsemble:
+    """The (B, N, 8) ensemble path matches member-by-member runs."""
+
+    def test_members_match_individual_runs(self, small_sim):
+        phi0 = np.stack([small_sim.random_field(0.5, seed=s) for s in range(3)])
+        eps = np.array([0.0, 0.4, 1.0])
+        m2 = np.array([1.0, 0.5, 2.0])
+        ens = small_sim.evolve_klein_gordon_ensemble(
+            phi0, steps=30, epsilon=eps, m_squared=m2, record_every=3)
+        assert ens['phi_history'].shape == (11, 3, small_sim.N, 8)
+        for b in range(3):
+            sim_b = OctonionicFieldSimulator(N=small_sim.N, dt=small_sim.dt,
+                                             L=small_sim.L, m_squared=m2[b])
+            ref = sim_b.evolve_klein_gordon(phi0[b], steps=30, epsilon=eps[b],
+                                            record_every=3)
+            coh = sim_b.compute_coherence_evolution(phi0[b], steps=30,
+                                                    epsilon=eps[b])
+            np.testing.assert_allclose(ens['phi_history'][:, b],
+                                       ref['phi_history'], atol=1e-12)
+            np.testing.assert_allclose(ens['energy_history'][:, b],
+                                       ref['energy_history'], atol=1e-12)
+            np.testing.assert_allclose(ens['coherence_history'][:, b],
+                                       coh['Q_C_history'][::3], atol=1e-12)
+
+    def test_shared_initial_condition_broadcasts(self, small_sim):
+        phi0 = small_sim.random_field(amplitude=0.3, seed=7)
+        ens = small_sim.evolve_klein_gordon_ensemble(
+            phi0, steps=5, epsilon=[0.0, 1.0], store_history=False)
+        assert ens['phi_history'] is None
+        assert ens['energy_history'].shape == (6, 2)
+        np.testing.assert_array_equal(ens['coherence_history'][:, 0], 0.0)
+        assert np.all(ens['coherence_history'][:, 1] > 0)
+
+
+# ---------------------------------------------------------------------------
+# 16. Periodic boundaries and the spectral Laplacian
+# ---------------------------------------------------------------------------
+
+class TestPeriodicSpectral:
+    """Per-instance boundary conditions and derivative schemes."""
+
+    @staticmethod
+    def _mode(sim, mode=2):
+        k = 2.0 * np.pi * mode / sim.L
+        phi = np.zeros((sim.N, 8))
+        phi[:, 0] = np.sin(k * sim.x)
+        phi[:, 5] = 0.4 * np.cos(k * sim.x)
+        return phi, k
+
+    def test_invalid_options_raise(self):
+        with pytest.raises(ValueError):
+            OctonionicFieldSimulator(laplacian='spectral')
+        with pytest.raises(ValueError):
+            OctonionicFieldSimulator(boundary='neumann')
+        with pytest.raises(ValueError):
+            OctonionicFieldSimulator(boundary='periodic', laplacian='chebyshev')
+
+    def test_spectral_derivatives_exact(self):
+        sim = OctonionicFieldSimulator(N=32, L=6.4, boundary='periodic',
+                                       laplacian='spectral')
+        phi, k = self._mode(sim)
+        np.testing.assert_allclose(sim._laplacian(phi), -k ** 2 * phi,
+                                   atol=1e-10)
+        dphi = np.zeros_like(phi)
+        dphi[:, 0] = k * np.cos(k * sim.x)
+        dphi[:, 5] = -0.4 * k * np.sin(k * sim.x)
+        np.testing.assert_allclose(sim._gradient(phi), dphi, atol=1e-10)
+
+    def test_periodic_kernel_wraps(self, small_sim):
+        rng = np.random.default_rng(3)
+        phi = rng.normal(size=(10, 8))
+        wrapped = _AssociatorKernel(0.6, periodic=True)(phi).copy()
+        padded = np.concatenate([phi[-1:], phi, phi[:1]])
+        ref = _AssociatorKernel(0.6)(padded)[1:-1]
+        np.testing.assert_allclose(wrapped, ref, atol=1e-14)
+
+    @pytest.mark.parametrize('laplacian', ['stencil', 'spectral'])
+    def test_periodic_kg_energy_bounded(self, laplacian):
+        sim = OctonionicFieldSimulator(N=32, dt=0.01, L=6.4,
+                                       boundary='periodic',
+                                       laplacian=laplacian)
+        phi, _ = self._mode(sim)
+        res = sim.evolve_klein_gordon(phi, steps=300, epsilon=1.0)
+        E = res['energy_history']
+        assert np.max(np.abs(E - E[0])) / E[0] < 1e-3
+
+    def test_translation_invariance(self):
+        """On a ring, shifting the initial field shifts the solution."""
+        sim = OctonionicFieldSimulator(N=32, dt=0.01, L=6.4,
+                                       boundary='periodic')
+        phi0 = sim.random_field(amplitude=0.5, seed=4)
+        a = sim.evolve_klein_gordon(phi0, steps=20)['phi_history'][-1]
+        b = sim.evolve_klein_gordon(np.roll(phi0, 5, axis=0),
+                                    steps=20)['phi_history'][-1]
+        np.testing.assert_allclose(np.roll(a, 5, axis=0), b, atol=1e-12)
+
+    def test_ensemble_matches_periodic_runs(self):
+        sim = OctonionicFieldSimulator(N=32, dt=0.01, L=6.4,
+                                       boundary='periodic',
+                                       laplacian='spectral')
+        phi0 = sim.random_field(amplitude=0.5, seed=2)
+        ens = sim.evolve_klein_gordon_ensemble(phi0, steps=10,
+                                               epsilon=[0.5, 1.0])
+        for b, eps in enumerate([0.5, 1.0]):
+            ref = sim.evolve_klein_gordon(phi0, steps=10, epsilon=eps)
+            coh = sim.compute_coherence_evolution(phi0, steps=10, epsilon=eps)
+            np.testing.assert_allclose(ens['phi_history'][:, b],
+                                       ref['phi_history'], atol=1e-12)
+            np.testing.assert_allclose(ens['coherence_history'][:, b],
+                                       coh['Q_C_history'], atol=1e-12)
+
+    def test_periodic_maxwell_runs(self):
+        sim = OctonionicFieldSimulator(N=32, dt=0.01, L=6.4,
+                                       boundary='periodic',
+                                       laplacian='spectral')
+        field = sim.random_field(amplitude=0.3, seed=5)
+        E0, B0 = field[:, 1:], 0.5 * field[:, :7]
+        res = sim.evolve_maxwell_7d(E0, B0, steps=50)
+        assert np.all(np.isfinite(res['energy_history']))
+
+    def test_resume_keeps_boundary(self, tmp_path):
+        sim = OctonionicFieldSimulator(N=16, dt=0.01, L=3.2,
+                                       boundary='periodic',
+                                       laplacian='spectral')
+        phi0 = sim.random_field(amplitude=0.5, seed=1)
+        full = sim.evolve_klein_gordon(phi0, steps=20)
+        ckpt = Checkpointer(tmp_path, every=10)
+        sim.evolve_klein_gordon(phi0, steps=20, checkpoint=ckpt)
+        resumed = resume(ckpt.checkpoints()[0])
+        np.testing.assert_array_equal(resumed['phi_history'],
+                                      full['phi_history'])
+
+
+# ---------------------------------------------------------------------------
+# 17. Higher-order composition integrators
+# ---------------------------------------------------------------------------
+
+class TestIntegrators:
+    """Yoshida compositions of the leapfrog / Strang steps."""
+
+    @staticmethod
+    def _final_state(kind, integrator, dt, t_final=0.5):
+        sim = OctonionicFieldSimulator(N=16, dt=dt, L=3.2,
+                                       boundary='periodic',
+                                       laplacian='spectral')
+        field = sim.random_field(amplitude=0.5, seed=1)
+        steps = int(round(t_final / dt))
+        if kind == 'klein_gordon':
+            snaps = sim.iter_klein_gordon(field, steps=steps, every=steps,
+                                          integrator=integrator)
+        else:
+            snaps = sim.iter_maxwell_7d(field[:, 1:], 0.5 * field[:, :7],
+                                        steps=steps, every=steps,
+                                        integrator=integrator)
+        return list(snaps)[-1][2]
+
+    @pytest.mark.parametrize('kind', ['klein_gordon', 'maxwell_7d'])
+    @pytest.mark.parametrize('integrator, order',
+                             [('leapfrog', 2), ('yoshida4', 4),
+                              ('yoshida6', 6)])
+    def test_convergence_order(self, kind, integrator, order):
+        ref = self._final_state(kind, 'yoshida6', 0.5 / 256)
+        e1 = np.max(np.abs(self._final_state(kind, integrator, 0.05) - ref))
+        e2 = np.max(np.abs(self._final_state(kind, integrator, 0.025) - ref))
+        assert np.log2(e1 / e2) > order - 0.5
+
+    def test_smaller_energy_error_at_same_dt(self, small_sim):
+        phi0 = small_sim.random_field(amplitude=0.5, seed=3)
+        errors = {}
+        for name in ('leapfrog', 'yoshida4', 'yoshida6'):
+            E = small_sim.evolve_klein_gordon(phi0, steps=100, epsilon=0.0,
+                                              integrator=name)['energy_history']
+            errors[name] = np.max(np.abs(E - E[0])) / E[0]
+        assert errors['yoshida6'] < errors['yoshida4'] < errors['leapfrog']
+
+    def test_unknown_integrator_raises(self, small_sim):
+        phi0 = small_sim.gaussian_pulse()
+        with pytest.raises(ValueError):
+            small_sim.evolve_klein_gordon(phi0, steps=2, integrator='rk4')
+        with pytest.raises(ValueError):
+            small_sim.evolve_klein_gordon_ensemble(phi0, steps=2,
+                                                   integrator='rk4')
+
+    def test_ensemble_matches_composed_runs(self, small_sim):
+        phi0 = small_sim.random_field(amplitude=0.5, seed=4)
+        ens = small_sim.evolve_klein_gordon_ensemble(
+            phi0, steps=10, epsilon=[0.3, 1.0], integrator='yoshida4')
+        for b, eps in enumerate([0.3, 1.0]):
+            ref = small_sim.evolve_klein_gordon(phi0, steps=10, epsilon=eps,
+                                                integrator='yoshida4')
+            np.testing.assert_allclose(ens['phi_history'][:, b],
+                                       ref['phi_history'], atol=1e-12)
+
+    def test_resume_keeps_integrator(self, small_sim, tmp_path):
+        phi0 = small_sim.random_field(amplitude=0.5, seed=5)
+        full = small_sim.evolve_klein_gordon(phi0, steps=20,
+                                             integrator='yoshida6')
+        ckpt = Checkpointer(tmp_path, every=10)
+        small_sim.evolve_klein_gordon(phi0, steps=20, checkpoint=ckpt,
+                                      integrator='yoshida6')
+        resumed = resume(ckpt.checkpoints()[0])
+        np.testing.assert_array_equal(resumed['phi_history'],
+                                      full['phi_history'])
+
+    def test_benchmark_reaches_target_faster(self):
+        sim = OctonionicFieldSimulator(N=16, L=3.2, boundary='periodic')
+        phi0 = sim.random_field(amplitude=0.5, seed=6)
+        bench = sim.benchmark_integrators(phi0, t_final=1.0, tolerance=1e-6,
+                                          epsilon=0.0)
+        res = bench['results']
+        assert set(res) == {'leapfrog', 'yoshida4', 'yoshida6'}
+        assert all(r['reached'] for r in res.values())
+        assert all(r['energy_error'] <= 1e-6 for r in res.values())
+        assert res['yoshida4']['force_evaluations'] < \
+            res['leapfrog']['force_evaluations']
+        assert res['yoshida6']['dt'] > res['leapfrog']['dt']
+
+
+# ---------------------------------------------------------------------------
+# 18. Implicit-explicit stepping
+# ---------------------------------------------------------------------------
+
+class TestIMEX:
+    """Implicit linear flow plus explicit associator kicks."""
+
+    @pytest.mark.parametrize('boundary, laplacian',
+                             [('dirichlet', 'stencil'),
+                              ('periodic', 'spectral')])
+    def test_fine_grid_large_dt_matches_reference(self, boundary, laplacian):
+        # dx = 0.02, dt = 0.1: five times the explicit CFL limit
+        kw = dict(N=256, L=5.12, boundary=boundary, laplacian=laplacian)
+        coarse = OctonionicFieldSimulator(dt=0.1, **kw)
+        ref = OctonionicFieldSimulator(dt=0.005, **kw)
+        phi0 = (coarse.gaussian_pulse(sigma=0.5, components=[0, 1])
+                + 0.3 * coarse.sine_mode(mode=2, components=[4, 6]))
+        imex = coarse.evolve_klein_gordon(phi0, steps=10, integrator='imex')
+        with np.errstate(over='ignore', invalid='ignore'):
+            explicit = coarse.evolve_klein_gordon(phi0, steps=10)
+        exact = ref.evolve_klein_gordon(phi0, steps=200, record_every=20)
+        err = (np.max(np.abs(imex['phi_history'][-1] - exact['phi_history'][-1]))
+               / np.max(np.abs(exact['phi_history'][-1])))
+        assert err < 0.05
+        # Leapfrog at the same dt is unstable (NaN compares False)
+        assert not np.all(np.abs(explicit['phi_history'][-1]) < 1e3)
+
+    def test_second_order_convergence(self, small_sim):
+        phi0 = small_sim.random_field(amplitude=0.5, seed=3)
+
+        def final(dt):
+            sim = OctonionicFieldSimulator(N=32, dt=dt, L=6.4)
+            steps = int(round(0.5 / dt))
+            return list(sim.iter_klein_gordon(phi0, steps=steps, every=steps,
+                                              integrator='imex'))[-1][2]
+
+        ref = final(0.5 / 512)
+        e1 = np.max(np.abs(final(0.05) - ref))
+        e2 = np.max(np.abs(final(0.025) - ref))
+        assert np.log2(e1 / e2) > 1.5
+
+    def test_associative_limit_conserves_energy_exactly(self, small_sim):
+        phi0 = small_sim.random_field(amplitude=0.5, seed=4)
+        res = small_sim.evolve_klein_gordon(phi0, steps=50, epsilon=0.0,
+                                            integrator='imex')
+        E = res['energy_history']
+        assert np.max(np.abs(E - E[0])) / E[0] < 1e-12
+
+    def test_ensemble_matches_imex_runs(self, small_sim):
+        phi0 = small_sim.random_field(amplitude=0.5, seed=5)
+        ens = small_sim.evolve_klein_gordon_ensemble(
+            phi0, steps=10, epsilon=[0.5, 1.0], m_squared=[1.0, 2.0],
+            integrator='imex')
+        for b, (eps, m2) in enumerate([(0.5, 1.0), (1.0, 2.0)]):
+            sim_b = OctonionicFieldSimulator(N=small_sim.N, dt=small_sim.dt,
+                                             L=small_sim.L, m_squared=m2)
+            ref = sim_b.evolve_klein_gordon(phi0, steps=10, epsilon=eps,
+                                            integrator='imex')
+            np.testing.assert_allclose(ens['phi_history'][:, b],
+                                       ref['phi_history'], atol=1e-12)
+
+    def test_maxwell_rejects_imex(self, small_sim):
+        E0 = np.zeros((small_sim.N, 7))
+        with pytest.raises(ValueError):
+            small_sim.evolve_maxwell_7d(E0, E0, steps=2, integrator='imex')
+
+
+# ---------------------------------------------------------------------------
+# 19. Multi-dimensional lattices
+# ---------------------------------------------------------------------------
+
+class TestLattices:
+    def test_grid_attributes(self):
+        sim = OctonionicFieldSimulator(N=(16, 8), L=(3.2, 2.0))
+        assert sim.ndim == 2 and sim.shape == (16, 8)
+        assert sim.spacing == pytest.approx((0.2, 0.25))
+        assert sim.dV == pytest.approx(0.05)
+        assert sim.gaussian_pulse().shape == (16, 8, 8)
+        with pytest.raises(ValueError):
+            OctonionicFieldSimulator(N=(4, 4, 4, 4))
+
+    def test_laplacian_of_sine_mode(self):
+        sim = OctonionicFieldSimulator(N=(32, 24), L=(4.0, 3.0),
+                                       boundary='periodic',
+                                       laplacian='spectral')
+        X, Y = sim._mesh()
+        phi = np.zeros(sim.shape + (8,))
+        phi[..., 2] = np.sin(2 * np.pi * X / 4.0) * np.cos(2 * np.pi * Y / 3.0)
+        k2 = (2 * np.pi / 4.0) ** 2 + (2 * np.pi / 3.0) ** 2
+        np.testing.assert_allclose(sim._laplacian(phi), -k2 * phi, atol=1e-10)
+
+    def test_kernel_sums_row_and_column_kernels(self):
+        rng = np.random.default_rng(0)
+        phi = rng.normal(size=(6, 5, 8))
+        kernel_1d = _AssociatorKernel(0.7, periodic=True)
+        rows = np.stack([kernel_1d(phi[i]).copy() for i in range(6)])
+        cols = np.stack([kernel_1d(phi[:, j]).copy() for j in range(5)], 1)
+        out = _AssociatorKernel(0.7, periodic=True, ndim=2)(phi)
+        np.testing.assert_allclose(out, rows + cols, atol=1e-12)
+
+    def test_translation_invariant_field_matches_1d(self):
+        sim_1d = OctonionicFieldSimulator(N=32, L=6.4, dt=0.02,
+                                          boundary='periodic')
+        sim_2d = OctonionicFieldSimulator(N=(32, 4), L=(6.4, 0.8), dt=0.02,
+                                          boundary='periodic')
+        phi0 = sim_1d.random_field(amplitude=0.5, seed=1)
+        res_1d = sim_1d.evolve_klein_gordon(phi0, steps=20)
+        res_2d = sim_2d.evolve_klein_gordon(
+            np.repeat(phi0[:, None], 4, axis=1), steps=20)
+        for j in range(4):
+            np.testing.assert_allclose(res_2d['phi_history'][:, :, j],
+                                       res_1d['phi_history'], atol=1e-12)
+        np.testing.assert_allclose(res_2d['energy_history'],
+                                   0.8 * res_1d['energy_history'], rtol=1e-10)
+
+    @pytest.mark.parametrize('integrator', ['leapfrog', 'imex'])
+    def test_energy_conservation_2d(self, integrator):
+        sim = OctonionicFieldSimulator(N=(24, 24), L=4.8, dt=0.02,
+                                       boundary='periodic')
+        phi0 = sim.gaussian_pulse(sigma=0.6)
+        res = sim.evolve_klein_gordon(phi0, steps=100, epsilon=0.0,
+                                      integrator=integrator)
+        E = res['energy_history']
+        assert np.max(np.abs(E - E[0])) / E[0] < 1e-3
+        assert res['phi_history'].shape == (101, 24, 24, 8)
+
+    def test_3d_run_and_coherence(self):
+        sim = OctonionicFieldSimulator(N=(8, 8, 8), L=2.0, dt=0.02)
+        phi0 = sim.random_field(amplitude=0.5, seed=2)
+        assert phi0.shape == (8, 8, 8, 8)
+        res = sim.evolve_klein_gordon(phi0, steps=5)
+        assert np.all(np.isfinite(res['phi_history']))
+        coh = sim.compute_coherence_evolution(phi0, steps=5)
+        assert coh['initial_Q_C'] > 0
+
+    def test_ensemble_on_lattice(self):
+        sim = OctonionicFieldSimulator(N=(10, 12), L=2.0, dt=0.02)
+        phi0 = sim.random_field(amplitude=0.5, seed=3)
+        ens = sim.evolve_klein_gordon_ensemble(phi0, steps=5,
+                                               epsilon=[0.0, 1.0])
+        for b, eps in enumerate([0.0, 1.0]):
+            ref = sim.evolve_klein_gordon(phi0, steps=5, epsilon=eps)
+            coh = sim.compute_coherence_evolution(phi0, steps=5, epsilon=eps)
+            np.testing.assert_allclose(ens['phi_history'][:, b],
+                                       ref['phi_history'], atol=1e-12)
+            np.testing.assert_allclose(ens['energy_history'][:, b],
+                                       ref['energy_history'], rtol=1e-12)
+            np.testing.assert_allclose(ens['coherence_history'][:, b],
+                                       coh['Q_C_history'], atol=1e-12)
+
+    def test_maxwell_is_1d_only(self):
+        sim = OctonionicFieldSimulator(N=(8, 8))
+        E0 = np.zeros((8, 8, 7))
+        with pytest.raises(ValueError):
+            sim.evolve_maxwell_7d(E0, E0, steps=1)
+        with pytest.raises(ValueError):
+            sim.signal_speed_test()
+
+
+# ---------------------------------------------------------------------------
+# 20. Precompiled Maxwell operators
+# ---------------------------------------------------------------------------
+
+class TestMaxwellOperators:
+    def test_operators_match_tensor_contractions(self):
+        from octonion_algebra.calculus import (structure_constants,
+                                               fano_correction_tensor)
+        rng = np.random.default_rng(0)
+        E, dF, dB = rng.normal(size=(3, 16, 7))
+        ops = _MaxwellOperators()
+        c = structure_constants()
+        T = fano_correction_tensor()
+        np.testing.assert_allclose(ops.curl(dF),
+                                   np.einsum('jk,nj->nk', c[0], dF),
+                                   atol=1e-14)
+        J = np.einsum('jkl,nl,nj->nk', T[0], E, dB)
+        np.testing.assert_allclose(ops.j_assoc(E, dB), J, atol=1e-13)
+        M = ops.j_assoc_operator(dB)
+        np.testing.assert_allclose(np.einsum('nkl,nl->nk', M, E), J,
+                                   atol=1e-13)
+
+    def test_buffers_follow_grid_size(self):
+        ops = _MaxwellOperators()
+        assert ops.curl(np.ones((8, 7))).shape == (8, 7)
+        assert ops.curl(np.ones((5, 7))).shape == (5, 7)
+        assert ops.j_assoc(np.ones((5, 7)), np.ones((5, 7))).shape == (5, 7)
+
+
+# ---------------------------------------------------------------------------
+# 21. Streaming spectral diagnostics
+# ---------------------------------------------------------------------------
+
+class TestSpectralObserver:
+    @pytest.mark.parametrize('kwargs', [
+        dict(N=48, L=4.8),
+        dict(N=48, L=4.8, boundary='periodic'),
+        dict(N=(12, 9), L=1.8, boundary='periodic'),
+    ])
+    def test_shell_energies_sum_to_energy(self, kwargs):
+        sim = OctonionicFieldSimulator(dt=0.02, **kwargs)
+        phi0 = sim.random_field(0.5, seed=1)
+        spectral = SpectralObserver(epsilon=0.0, segment=8)
+        res = sim.evolve_klein_gordon(phi0, steps=20, epsilon=0.0,
+                                      observers=[spectral])
+        spec = res['observers']['spectrum']
+        np.testing.assert_allclose(spec['values'][:, 0],
+                                   res['energy_history'], rtol=1e-12)
+        assert np.all(spec['values'][:, 1] == 0.0)
+        np.testing.assert_allclose(np.sum(spec['mode_energy']),
+                                   np.mean(res['energy_history']), rtol=1e-12)
+        assert spec['mode_energy'].shape == spec['wavenumbers'].shape
+
+    def test_transfer_is_associator_power(self):
+        sim = OctonionicFieldSimulator(N=32, L=3.2, boundary='periodic')
+        rng = np.random.default_rng(0)
+        phi, pi = rng.normal(size=(2, 32, 8))
+        spectral = SpectralObserver(epsilon=0.7)
+        _, transfer = spectral.measure(sim, {'phi': phi, 'pi': pi})
+        force = -0.1 * sim.dx ** 2 * sim._associator_kernel(0.7)(phi)
+        assert transfer == pytest.approx(np.sum(pi * force) * sim.dV,
+                                         rel=1e-10)
+
+    def test_psd_peaks_at_mode_frequency(self):
+        sim = OctonionicFieldSimulator(N=32, L=6.4, dt=0.05,
+                                       boundary='periodic')
+        phi0 = sim.sine_mode(mode=2, components=[0])
+        spectral = SpectralObserver(every=2, epsilon=0.0, segment=256)
+        res = sim.evolve_klein_gordon(phi0, steps=4096, epsilon=0.0,
+                                      observers=[spectral],
+                                      store_history=False)
+        spec = res['observers']['spectrum']
+        k = 2 * np.pi / 6.4
+        omega = np.sqrt(1.0 + (2 - 2 * np.cos(k * sim.dx)) / sim.dx ** 2)
+        df = spec['frequencies'][1]
+        peak = spec['frequencies'][np.argmax(spec['psd'][:, 0])]
+        assert abs(peak - omega / (2 * np.pi)) <= df
+        # The density integrates to the mean square: phi0 cos(omega t)
+        power = np.sum(spec['psd'][:, 0]) * df
+        assert power == pytest.approx(0.5 * np.mean(phi0[:, 0] ** 2),
+                                      rel=0.05)
+
+    def test_resume_restores_accumulators(self, small_sim, tmp_path):
+        phi0 = small_sim.random_field(0.5, seed=2)
+        full = small_sim.evolve_klein_gordon(
+            phi0, steps=20, observers=[SpectralObserver(segment=6)])
+        ckpt = Checkpointer(tmp_path, every=7)
+        with pytest.raises(_Preempted):
+            small_sim.evolve_klein_gordon(
+                phi0, steps=20, observers=[SpectralObserver(segment=6)],
+                callback=_preempt_at(16), checkpoint=ckpt)
+        resumed = resume(ckpt.latest(),
+                         observers=[SpectralObserver(segment=6)])
+        for key, val in full['observers']['spectrum'].items():
+            np.testing.assert_array_equal(
+                resumed['observers']['spectrum'][key], val)
+
+    def test_maxwell_state_rejected(self, small_sim):
+        E0 = np.zeros((small_sim.N, 7))
+        with pytest.raises(ValueError):
+            small_sim.evolve_maxwell_7d(E0, E0, steps=1,
+                                        observers=[SpectralObserver()])
+
+
+# ---------------------------------------------------------------------------
+# 22. Static solutions
+# ---------------------------------------------------------------------------
+
+def _static_source(sim, phi, epsilon=1.0):
+    """Source for which ``phi`` solves the static equation."""
+    alpha = 0.1 * sim.dx ** 2
+    return (sim._laplacian(phi) - sim.m_squared * phi
+            - alpha * sim._associator_kernel(epsilon)(phi))
+
+
+class TestSolveStatic:
+    @pytest.mark.parametrize('kwargs', [
+        dict(N=64, L=6.4),
+        dict(N=64, L=6.4, boundary='periodic', laplacian='spectral'),
+        dict(N=(16, 12), L=1.6, boundary='periodic'),
+    ])
+    def test_recovers_manufactured_solution(self, kwargs):
+        sim = OctonionicFieldSimulator(**kwargs)
+        target = sim.random_field(30.0, seed=1)
+        res = sim.solve_static(_static_source(sim, target), tol=1e-9)
+        assert res['converged']
+        assert res['newton_iterations'] <= 30
+        np.testing.assert_allclose(res['phi'], target, atol=1e-8)
+        np.testing.assert_allclose(res['epsilon_path'], [0.25, 0.5, 0.75, 1])
+
+    def test_linear_problem_needs_no_newton_step(self, small_sim):
+        target = small_sim.random_field(1.0, seed=2)
+        res = small_sim.solve_static(_static_source(small_sim, target, 0.0),
+                                     epsilon=0.0, continuation=1)
+        assert res['converged'] and res['newton_iterations'] == 0
+        np.testing.assert_allclose(res['phi'], target, atol=1e-10)
+
+    def test_explicit_path_and_initial_guess(self, small_sim):
+        target = small_sim.random_field(10.0, seed=3)
+        source = _static_source(small_sim, target, 0.5)
+        res = small_sim.solve_static(source, phi0=target, epsilon=0.5,
+                                     continuation=[0.5])
+        assert res['newton_iterations'] == 0
+        assert res['residual_history'] == [res['residual']]
@@ -303,6 +303,76 @@ class TestCoalitionDeterministic:
         assert arr.shape == (6, 8)
 
 
+# ---------------------------------------------------------------------------
+# test_coalition_scoring
+# ---------------------------------------------------------------------------
+
+class TestCoalitionScoring:
+    """Vectorised coalition scoring over bracketings and orderings."""
+
+    def test_triple_scores_match_scalar_path(self):
+        """Bracketing dependence of a triple is ||[a,b,c]|| / ||(ab)c||."""
+        model = CoalitionModel(5, epsilon=0.8, seed=21)
+        scores = model.score_coalitions(3)
+        for combo, value, dep in zip(scores["coalitions"], scores["value"],
+                                     scores["bracketing_dependence"]):
+            i, j, k = combo
+            v = model.coalition_value(i, j, k)
+            assert value == pytest.approx(v, abs=1e-12)
+            assoc = model.coalition_associator(i, j, k).norm()
+            assert dep == pytest.approx(assoc / v, abs=1e-12)
+
+    def test_larger_coalitions_supported(self):
+        """Sizes 4-6 are scored rather than silently skipped."""
+        model = CoalitionModel(7, epsilon=1.0, seed=5)
+        for size in (4, 5, 6):
+            scores = model.score_coalitions(size)
+            assert scores["coalitions"].shape[1] == size
+            assert np.all(scores["bracketing_dependence"] > 0)
+        stable = model.find_stable_coalitions(4, threshold=10.0)
+        assert len(stable) == 35
+        assert all(len(item[0]) == 4 for item in stable)
+
+    def test_invalid_size_raises(self):
+        """Coalition sizes outside 3-6 are rejected."""
+        model = CoalitionModel(8, seed=1)
+        with pytest.raises(ValueError):
+            model.score_coalitions(7)
+
+    def test_ordering_dependence_bounds_bracketing(self):
+        """Maximising over orderings can only increase the dependence."""
+        model = CoalitionModel(6, epsilon=1.0, seed=8)
+        scores = model.score_coalitions(4, orderings=True)
+        assert np.all(scores["ordering_dependence"]
+                      >= scores["bracketing_dependence"] - 1e-12)
+
+    def test_quaternionic_agents_zero_bracketing_dependence(self):
+        """At eps=0 quaternionic coalitions of any size are associative."""
+        rng = np.random.default_rng(66)
+        arr = np.zeros((6, 8))
+        arr[:, :4] = rng.standard_normal((6, 4))
+        model = CoalitionModel(6, agent_states=arr, epsilon=0.0)
+        for size in (3, 5):
+            assert model.agenda_dependence_index(size) < 1e-12
+
+    def test_top_k_matches_full_sort(self):
+        """Streaming top-k equals sorting all scores, for any batch size."""
+        model = CoalitionModel(9, epsilon=1.0, seed=4)
+        full = model.score_coalitions(3)
+        best = np.sort(full["bracketing_dependence"])[::-1][:5]
+        top = model.query_coalitions(3, top_k=5, batch_size=7)
+        np.testing.assert_allclose(top["bracketing_dependence"], best,
+                                   atol=1e-14)
+
+    def test_threshold_query(self):
+        """Threshold queries keep exactly the coalitions above the cutoff."""
+        model = CoalitionModel(8, epsilon=1.0, seed=4)
+        full = model.score_coalitions(3)
+        cut = np.median(full["bracketing_dependence"])
+        found = model.query_coalitions(3, threshold=cut)
+        assert len(found["value"]) == np.sum(full["bracketing_dependence"] >= cut)
+
+
 # ---------------------------------------------------------------------------
 # test_deformation_sweep_smooth
 # ---------------------------------------------------------------------------
@@ -23,6 +23,7 @@ from octonion_algebra.time_evolution import (
     quaternionic_slice_consistency,
     associator_perturbation_bound,
     well_posedness_summary,
+    _compute_laplacian,
 )
 
 
@@ -274,3 +275,144 @@ def test_well_posedness_summary():
     assert result['perturbation_bound'] >= 0, (
         "Perturbation bound should be non-negative"
     )
+
+
+# ---------------------------------------------------------------------------
+# test_periodic_and_spectral_laplacian
+# ---------------------------------------------------------------------------
+
+def _make_periodic_mode(N, L=2.0 * np.pi, mode=3):
+    """Single Fourier mode sin(k x) on a periodic grid of N points."""
+    dx = L / N
+    x = np.arange(N) * dx
+    k = 2.0 * np.pi * mode / L
+    phi = np.zeros((N, 8))
+    phi[:, 0] = np.sin(k * x)
+    phi[:, 2] = 0.5 * np.cos(k * x)
+    return phi, dx, k
+
+
+def test_spectral_laplacian_exact_on_fourier_mode():
+    """The FFT Laplacian returns -k^2 phi to rounding for a resolved mode."""
+    phi, dx, k = _make_periodic_mode(32)
+    lap = _compute_laplacian(phi, dx, boundary='periodic', method='spectral')
+    np.testing.assert_allclose(lap, -k ** 2 * phi, atol=1e-10)
+
+
+def test_spectral_needs_fewer_points_than_stencil():
+    """At 16 points the spectral Laplacian beats the stencil at 256."""
+    errors = {}
+    for N, method in ((16, 'spectral'), (256, 'stencil')):
+        phi, dx, k = _make_periodic_mode(N)
+        lap = _compute_laplacian(phi, dx, boundary='periodic', method=method)
+        errors[method] = np.max(np.abs(lap + k ** 2 * phi))
+    assert errors['spectral'] < errors['stencil'] * 1e-6
+
+
+def test_periodic_stencil_wraps():
+    """The periodic stencil equals the Dirichlet stencil on a padded ring."""
+    rng = np.random.default_rng(0)
+    phi = rng.normal(size=(12, 8))
+    lap = _compute_laplacian(phi, 0.3, boundary='periodic')
+    padded = np.concatenate([phi[-1:], phi, phi[:1]])
+    ref = _compute_laplacian(padded, 0.3)[1:-1]
+    np.testing.assert_allclose(lap, ref, atol=1e-12)
+
+
+def test_energy_conservation_periodic_spectral():
+    """Leapfrog with the spectral Laplacian conserves the spectral energy."""
+    phi0, dx, _ = _make_periodic_mode(32)
+    pi0 = np.zeros_like(phi0)
+    result = verify_energy_conservation(phi0, pi0, dx, 0.05, 400,
+                                        m_squared=1.0, boundary='periodic',
+                                        laplacian='spectral')
+    assert result['conserved']
+    assert result['max_relative_error'] < 0.01
+
+
+def test_invalid_boundary_combinations_raise():
+    phi = np.zeros((8, 8))
+    with pytest.raises(ValueError):
+        _compute_laplacian(phi, 0.1, boundary='dirichlet', method='spectral')
+    with pytest.raises(ValueError):
+        _compute_laplacian(phi, 0.1, boundary='neumann')
+    with pytest.raises(ValueError):
+        _compute_laplacian(phi, 0.1, method='chebyshev')
+
+
+# ---------------------------------------------------------------------------
+# test_imex_integrator
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize('boundary, laplacian', [
+    ('dirichlet', 'stencil'), ('periodic', 'stencil'), ('periodic', 'spectral'),
+])
+def test_imex_solves_crank_nicolson_system(boundary, laplacian):
+    """One IMEX step satisfies the trapezoidal-rule equations."""
+    rng = np.random.default_rng(1)
+    phi0, pi0 = rng.normal(size=(2, 20, 8))
+    dx, dt, m2 = 0.1, 0.3, 1.3
+    result = evolve_klein_gordon(phi0, pi0, dx, dt, 1, m2, boundary,
+                                 laplacian, integrator='imex')
+    phi1, pi1 = result['phi_history'][1], result['pi_history'][1]
+
+    def K(f):
+        return _compute_laplacian(f, dx, boundary, laplacian) - m2 * f
+
+    np.testing.assert_allclose(phi1, phi0 + 0.5 * dt * (pi0 + pi1), atol=1e-12)
+    np.testing.assert_allclose(pi1, pi0 + 0.5 * dt * (K(phi0) + K(phi1)),
+                               atol=1e-10)
+
+
+def test_imex_stable_beyond_cfl():
+    """With dt = 5 dx leapfrog blows up; IMEX conserves energy exactly."""
+    phi0, pi0, dx = _make_gaussian_field(N=200, dx=0.02)
+    dt = 0.1
+    with np.errstate(over='ignore', invalid='ignore'):
+        explicit = verify_energy_conservation(phi0, pi0, dx, dt, 50)
+    implicit = verify_energy_conservation(phi0, pi0, dx, dt, 50,
+                                          integrator='imex')
+    assert not explicit['conserved']
+    assert implicit['max_relative_error'] < 1e-12
+
+
+def test_unknown_integrator_raises():
+    phi0, pi0, dx = _make_gaussian_field()
+    with pytest.raises(ValueError):
+        evolve_klein_gordon(phi0, pi0, dx, 0.05, 1, integrator='rk4')
+
+
+# ---------------------------------------------------------------------------
+# test_multidimensional_laplacian
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize('boundary, laplacian', [
+    ('periodic', 'stencil'), ('periodic', 'spectral'),
+])
+def test_laplacian_2d_is_separable_sum(boundary, laplacian):
+    """On a (Nx, Ny, C) grid the Laplacian is the sum of the 1D ones."""
+    rng = np.random.default_rng(2)
+    phi = rng.normal(size=(12, 10, 8))
+    dx = (0.3, 0.2)
+    lap = _compute_laplacian(phi, dx, boundary, laplacian)
+    # A scalar dx treats the axis before the last as the only grid axis
+    lap_x = np.stack([_compute_laplacian(phi[:, j], dx[0], boundary,
+                                         laplacian) for j in range(10)], 1)
+    lap_y = _compute_laplacian(phi, dx[1], boundary, laplacian)
+    np.testing.assert_allclose(lap, lap_x + lap_y, atol=1e-10)
+
+
+def test_imex_2d_solves_crank_nicolson_system():
+    rng = np.random.default_rng(3)
+    phi0, pi0 = rng.normal(size=(2, 10, 12, 8))
+    dx, dt, m2 = (0.1, 0.15), 0.3, 0.7
+    result = evolve_klein_gordon(phi0, pi0, dx, dt, 1, m2,
+                                 integrator='imex')
+    phi1, pi1 = result['phi_history'][1], result['pi_history'][1]
+
+    def K(f):
+        return _compute_laplacian(f, dx) - m2 * f
+
+    np.testing.assert_allclose(phi1, phi0 + 0.5 * dt * (pi0 + pi1), atol=1e-12)
+    np.testing.assert_allclose(pi1, pi0 + 0.5 * dt * (K(phi0) + K(phi1)),
+                               atol=1e-9)
@@ -0,0 +1,122 @@
+"""
+Tests for chunked on-disk trajectory storage (trajectory_io).
+"""
+
+import numpy as np
+import pytest
+
+from octonion_algebra.trajectory_io import TrajectoryWriter, TrajectoryReader
+from octonion_algebra.simulator import OctonionicFieldSimulator
+from octonion_algebra.systems import OctonionicDynamicalSystem
+from octonion_algebra.market_sim import MultiAgentMarket
+
+
+def _write_frames(path, n_frames, **kwargs):
+    rng = np.random.default_rng(0)
+    frames = rng.standard_normal((n_frames, 5, 8))
+    with TrajectoryWriter(path, **kwargs) as writer:
+        for n, frame in enumerate(frames):
+            writer.append(n, 0.1 * n, phi=frame, norm=np.linalg.norm(frame))
+    return frames
+
+
+class TestTrajectoryRoundTrip:
+    """Frames written in chunks read back exactly."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_round_trip(self, tmp_path, compress):
+        path = tmp_path / "traj.oct"
+        frames = _write_frames(path, 23, chunk_size=5, compress=compress,
+                               metadata={'run': 'test'})
+        reader = TrajectoryReader(path)
+        assert len(reader) == 23
+        assert reader.metadata == {'run': 'test'}
+        assert reader.fields['phi'] == ((5, 8), np.dtype(np.float64))
+        np.testing.assert_array_equal(reader.steps, np.arange(23))
+        np.testing.assert_allclose(reader.times, 0.1 * np.arange(23))
+        np.testing.assert_array_equal(reader.read('phi'), frames)
+
+    def test_slices_across_chunks(self, tmp_path):
+        path = tmp_path / "traj.oct"
+        frames = _write_frames(path, 30, chunk_size=7)
+        reader = TrajectoryReader(path)
+        np.testing.assert_array_equal(
+            reader.read('phi', start=3, stop=25, stride=4, components=[0, 5]),
+            frames[3:25:4][..., [0, 5]])
+        assert reader.read('phi', start=40).shape == (0, 5, 8)
+
+    def test_raw_chunks_are_memory_mapped(self, tmp_path):
+        path = tmp_path / "traj.oct"
+        _write_frames(path, 10, chunk_size=4)
+        chunks = list(TrajectoryReader(path).iter_chunks('phi'))
+        assert [len(c[0]) for c in chunks] == [4, 4, 2]
+        assert isinstance(chunks[0][2], np.memmap)
+
+    def test_float32_downcast(self, tmp_path):
+        path = tmp_path / "traj.oct"
+        frames = _write_frames(path, 6, chunk_size=4, dtype=np.float32)
+        data = TrajectoryReader(path).read('phi')
+        assert data.dtype == np.float32
+        np.testing.assert_allclose(data, frames, rtol=1e-6)
+
+    def test_append_mode_continues_file(self, tmp_path):
+        path = tmp_path / "traj.oct"
+        frames = _write_frames(path, 5, chunk_size=2)
+        with TrajectoryWriter(path, chunk_size=2, mode='a') as writer:
+            assert writer.n_frames == 5
+            writer.append(5, 0.5, phi=frames[0], norm=0.0)
+        reader = TrajectoryReader(path)
+        assert len(reader) == 6
+        np.testing.assert_array_equal(reader.read('phi', start=5)[0], frames[0])
+
+    def test_truncated_chunk_is_ignored(self, tmp_path):
+        path = tmp_path / "traj.oct"
+        _write_frames(path, 9, chunk_size=4)
+        size = path.stat().st_size
+        with open(path, 'r+b') as f:
+            f.truncate(size - 10)
+        assert len(TrajectoryReader(path)) == 8
+
+    def test_not_a_trajectory_raises(self, tmp_path):
+        path = tmp_path / "junk.bin"
+        path.write_bytes(b"not a trajectory")
+        with pytest.raises(ValueError, match="Not a trajectory"):
+            TrajectoryReader(path)
+
+
+class TestTrajectoryIntegration:
+    """Evolve methods stream their states into a writer."""
+
+    def test_simulator_writer_without_history(self, tmp_path):
+        sim = OctonionicFieldSimulator(N=16, dt=0.01, L=3.2)
+        phi0 = sim.gaussian_pulse(components=[0, 1, 4])
+        full = sim.evolve_klein_gordon(phi0, steps=12)
+        path = tmp_path / "kg.oct"
+        with TrajectoryWriter(path, chunk_size=2) as writer:
+            result = sim.evolve_klein_gordon(phi0, steps=12, record_every=3,
+                                             writer=writer,
+                                             store_history=False)
+        assert result['phi_history'] is None
+        reader = TrajectoryReader(path)
+        np.testing.assert_array_equal(reader.steps, [0, 3, 6, 9, 12])
+        np.testing.assert_array_equal(reader.read('phi'),
+                                      full['phi_history'][::3])
+
+    def test_dynamical_system_writer(self, tmp_path):
+        path = tmp_path / "sys.oct"
+        system = OctonionicDynamicalSystem(N=4, seed=1)
+        with TrajectoryWriter(path, chunk_size=3) as writer:
+            result = system.evolve(0.01, 5, writer=writer)
+        np.testing.assert_array_equal(TrajectoryReader(path).read('states'),
+                                      result['trajectory'])
+
+    def test_market_writer(self, tmp_path):
+        path = tmp_path / "market.oct"
+        market = MultiAgentMarket(n_agents=4, seed=2)
+        with TrajectoryWriter(path, chunk_size=4) as writer:
+            result = market.evolve(steps=5, writer=writer, store_history=False)
+        assert result['states_history'] is None
+        reader = TrajectoryReader(path)
+        assert len(reader) == 6
+        np.testing.assert_array_equal(reader.read('states', start=5)[0],
+                                      market.states)